@@ -0,0 +1,37 @@
+"""
+Benchmarks for ezsgame internals.
+
+Run a benchmark from the repository root as a module, example: `python -m benchmarks.event_dispatch`
+Benchmarks run without opening a real window (SDL dummy drivers).
+"""
+
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def bench(func: Callable, repeat: int = 100) -> float:
+    """
+    #### Returns the average time (in milliseconds) that `func` takes to run
+    - `func` : function to benchmark
+    - `repeat` : number of times `func` is called
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def report(title: str, rows, columns=("case", "ms")) -> None:
+    """
+    #### Prints the benchmark results as a table
+    """
+    print(f"\n{title}")
+    print("  ".join(f"{c:>14}" for c in columns))
+
+    for row in rows:
+        print("  ".join(f"{v:>14.4f}" if isinstance(v, float) else f"{v:>14}" for v in row))
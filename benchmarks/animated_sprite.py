@@ -0,0 +1,84 @@
+"""
+Start time and memory of a long animation (300 frames of 256x256): decoding every GIF frame up front vs
+decoding the frames when they are needed, and GIF vs sprite sheet frame sources.
+"""
+
+from . import bench, report
+
+import os
+import tempfile
+import time
+
+import pygame as pg
+from PIL import Image, ImageSequence
+
+from ezsgame import Window, Pos, Size
+from ezsgame.graphics import AnimatedSprite, ImageCache
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    folder = tempfile.mkdtemp()
+    gif_path = os.path.join(folder, "animation.gif")
+    sheet_path = os.path.join(folder, "animation.png")
+
+    frames = [Image.new("RGB", (256, 256), (i % 256, 255 - i % 256, 90)) for i in range(300)]
+    frames[0].save(gif_path, save_all=True, append_images=frames[1:], duration=16)
+
+    sheet = Image.new("RGB", (256 * 20, 256 * 15))
+    for i, frame in enumerate(frames):
+        sheet.paste(frame, (i % 20 * 256, i // 20 * 256))
+    sheet.save(sheet_path)
+
+    # how the frames were loaded before
+    def decode_all():
+        return [
+            pg.transform.scale(pg.image.frombytes(frame.convert("RGBA").tobytes(), frame.size, "RGBA"), (128, 128))
+            for frame in ImageSequence.Iterator(Image.open(gif_path))
+        ]
+
+    def new_sprite(path, **kwargs):
+        AnimatedSprite._sources.clear()
+        ImageCache.clear()
+        return AnimatedSprite(path, Pos(0, 0), Size(128, 128), frame_rate=60, **kwargs)
+
+    def play(sprite, frames=300):
+        start = time.perf_counter()
+        for _ in range(frames):
+            sprite.last_update_time = -1000  # next frame on every draw
+            sprite.draw()
+        return (time.perf_counter() - start) * 1000 / frames
+
+    eager = bench(decode_all, 1)
+    eager_memory = 128 * 128 * 4 * len(frames)
+
+    lazy_start = bench(lambda: new_sprite(gif_path), 1)
+    gif = play(new_sprite(gif_path))
+    threaded_sprite = new_sprite(gif_path, threaded=True)
+    threaded = play(threaded_sprite)
+    threaded_sprite.source.close()
+
+    sheet_start = bench(lambda: new_sprite(sheet_path, frame_size=(256, 256)), 1)
+    sheet_frame = play(new_sprite(sheet_path, frame_size=(256, 256)))
+
+    report(
+        "300 frames animation (ms)",
+        [
+            ("start, eager", eager),
+            ("start, gif", lazy_start),
+            ("start, sheet", sheet_start),
+            ("frame, gif", gif),
+            ("frame, gif thr", threaded),
+            ("frame, sheet", sheet_frame),
+        ],
+    )
+
+    ImageCache.memory_budget = 4 * 1024**2
+    new_sprite(gif_path)
+    play(new_sprite(gif_path))
+    print(f"\nall frames decoded: {eager_memory / 1024**2:.1f} MB, cache with a 4 MB budget: {ImageCache.memory / 1024**2:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
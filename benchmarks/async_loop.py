@@ -0,0 +1,107 @@
+"""
+Frame rate of `Window.run_async` at 60 FPS while tasks run concurrently: simulated network requests, save files read
+in a thread, an `async def` interval and an `async def` key event.
+
+Run with `--check` to exit with an error when the loop doesn't keep the target frame rate or a task didn't run.
+"""
+
+from . import report
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pygame as pg
+
+from ezsgame import Window, Size, Rect, Pos, add_interval, on_key
+
+FPS = 60
+SECONDS = 2
+FRAME_WORK = 0.004  # seconds of work per frame
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=FPS)
+    Rect(Pos(10, 10), Size(50, 50), color="white")
+
+    done = {"requests": 0, "saves": 0, "interval": 0, "key": 0}
+    frame_times = []
+
+    save_file = os.path.join(tempfile.mkdtemp(), "save.bin")
+    with open(save_file, "wb") as file:
+        file.write(os.urandom(4 * 1024 * 1024))
+
+    async def request():
+        # a game server answering in 5 to 50 ms
+        while True:
+            await asyncio.sleep(random.uniform(0.005, 0.05))
+            done["requests"] += 1
+
+    def read_save():
+        with open(save_file, "rb") as file:
+            return len(file.read())
+
+    async def saves():
+        while True:
+            await asyncio.to_thread(read_save)
+            done["saves"] += 1
+
+    @add_interval(0.1)
+    async def autosave():
+        await asyncio.sleep(0.01)
+        done["interval"] += 1
+
+    @on_key("down", ["a"])
+    async def key_down():
+        await asyncio.sleep(0)
+        done["key"] += 1
+
+    last = [time.perf_counter()]
+
+    def update():
+        now = time.perf_counter()
+        frame_times.append(now - last[0])
+        last[0] = now
+
+        if len(frame_times) % 30 == 0:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_a, unicode="a", mod=0, scancode=0))
+
+        # game logic and drawing
+        busy = time.perf_counter() + FRAME_WORK
+        while time.perf_counter() < busy:
+            pass
+
+    async def game():
+        tasks = [asyncio.create_task(request()) for _ in range(50)]
+        tasks.append(asyncio.create_task(saves()))
+
+        try:
+            await asyncio.wait_for(window.run_async(update), SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+        for task in tasks:
+            task.cancel()
+
+    asyncio.run(game())
+
+    frame_times = sorted(frame_times[1:])
+    fps = len(frame_times) / sum(frame_times)
+    p95 = frame_times[int(len(frame_times) * 0.95)] * 1000
+
+    report(
+        f"run_async at {FPS} FPS for {SECONDS} s, 50 requests + thread reads running",
+        [("run_async", round(fps, 1), round(p95, 2), done["requests"], done["saves"], done["interval"], done["key"])],
+        columns=("case", "fps", "p95 frame ms", "requests", "saves", "intervals", "key events"),
+    )
+
+    if "--check" in sys.argv:
+        if fps < FPS * 0.95 or not all(done.values()):
+            sys.exit("run_async didn't keep the frame rate or a task didn't run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+2k sprites of 300 different small images: a surface per image vs area blits from a texture atlas, drawn one by one and
+batched (`draw_batched`, a `Surface.blits` with the atlas areas), and start time loading the images vs loading the saved atlas.
+
+In software rendering an area blit from a page costs about the same as a blit of a small surface (a bit more, the rows of
+the image are far apart in the page), the atlas wins at start time (a file and a convert per page instead of per image).
+
+Run with `--check` to exit with an error when loading the atlas is not faster than loading the images, or batched atlas
+blits are much slower than batched surface blits.
+"""
+
+from . import bench, report
+
+import os
+import random
+import sys
+import tempfile
+
+import pygame as pg
+
+from ezsgame import Window, Pos, Size, draw_batched
+from ezsgame.graphics import ImageCache, Sprite, TextureAtlas
+
+MAX_BLITS_SLOWDOWN = 1.5  # atlas blits vs surface blits, with --check
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    folder = tempfile.mkdtemp()
+    sprites_folder = os.path.join(folder, "sprites")
+    os.makedirs(sprites_folder)
+
+    names = []
+    for i in range(300):
+        size = random.randint(12, 40), random.randint(12, 40)
+        image = pg.Surface(size, pg.SRCALPHA)
+        image.fill((i % 256, 120, 255 - i % 256, 255), (2, 2, size[0] - 4, size[1] - 4))
+        names.append(f"sprite_{i}.png")
+        pg.image.save(image, os.path.join(sprites_folder, names[-1]))
+
+    cache = os.path.join(folder, "atlas.json")
+    placements = [(random.choice(names), random.uniform(0, 700), random.uniform(0, 400)) for _ in range(2000)]
+
+    def load_files():
+        ImageCache.clear()
+        return [Sprite(os.path.join(sprites_folder, name), Pos(x, y), Size(1, 1), scale=False) for name, x, y in placements]
+
+    def build_atlas():
+        if os.path.exists(cache):
+            os.remove(cache)
+        return TextureAtlas.from_directory(sprites_folder, cache=cache)
+
+    def load_atlas():
+        return TextureAtlas.from_directory(sprites_folder, cache=cache)
+
+    files_start = bench(load_files, 3)
+    build = bench(build_atlas, 3)
+    load = bench(load_atlas, 3)
+
+    surface_sprites = load_files()
+    atlas = load_atlas()
+    atlas_sprites = [Sprite(name, Pos(x, y), Size(1, 1), scale=False, atlas=atlas) for name, x, y in placements]
+
+    def draw(sprites):
+        window.surface.fill("black")
+        for sprite in sprites:
+            sprite.draw()
+
+    def draw_blits(sprites):
+        window.surface.fill("black")
+        draw_batched(sprites)
+
+    blits_surfaces = bench(lambda: draw_blits(surface_sprites), 50)
+    blits_atlas = bench(lambda: draw_blits(atlas_sprites), 50)
+
+    report(
+        "2k sprites, 300 images (ms)",
+        [
+            ("load files", files_start),
+            ("build atlas", build),
+            ("load atlas", load),
+            ("draw surfaces", bench(lambda: draw(surface_sprites), 50)),
+            ("draw atlas", bench(lambda: draw(atlas_sprites), 50)),
+            ("blits surfaces", blits_surfaces),
+            ("blits atlas", blits_atlas),
+        ],
+    )
+    print(f"\n{atlas}")
+
+    if "--check" in sys.argv:
+        if load >= files_start:
+            sys.exit("loading the atlas is not faster than loading the images")
+
+        if blits_atlas > blits_surfaces * MAX_BLITS_SLOWDOWN:
+            sys.exit("batched atlas blits are much slower than surface blits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Frame time while scrolling a large level (20k objects): moving every object vs moving the camera.
+"""
+
+from . import bench, report
+
+import random
+
+from ezsgame import Window, World, Rect, Pos, Size
+from ezsgame.camera import Camera, Auto
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    level_size = 40_000, 4_200
+    for _ in range(20_000):
+        Rect(Pos(random.uniform(0, level_size[0]), random.uniform(0, level_size[1])), Size(20, 20))
+
+    window.update()  # registers the objects
+
+    def scroll_objects():
+        window.fill()
+        for obj in World.objects:
+            obj.pos = Pos(obj.pos.x - 1, obj.pos.y)
+
+        for obj in World.get_visible():
+            obj.draw()
+
+        window.update()
+
+    def scroll_camera():
+        window.fill()
+        for obj in World.get_visible():
+            obj.draw()
+
+        window.update()  # the active camera scrolls
+
+    objects = bench(scroll_objects, 20)
+
+    camera = Camera(Rect(Pos(0, 0), Size(1, 1)), Auto)
+    camera.activate()
+    cam = bench(scroll_camera, 20)
+    stats = World.culling_stats
+    camera.deactivate()
+
+    report(
+        "Frame time scrolling 20k objects (ms)",
+        [
+            ("move objects", objects),
+            ("move camera", cam),
+        ],
+    )
+    print(f"\nlast frame: {stats.drawn} drawn, {stats.culled} culled")
+
+
+if __name__ == "__main__":
+    main()
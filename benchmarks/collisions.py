@@ -0,0 +1,54 @@
+"""
+Compares the old per-hitbox scan (every object against every object, corner test)
+against `CollisionWorld.find_pairs` (sweep and prune) at 100, 1k and 10k objects.
+"""
+
+from . import bench, report
+
+import random
+
+from ezsgame import Window, Rect, Pos, Size, CollisionWorld
+
+
+def corner_colliding(obj1, obj2) -> bool:
+    # What `is_colliding` used to do
+    for i in obj1._get_collision_box():
+        if obj2.pos[0] <= i[0] <= obj2.pos[0] + obj2.size[0] and obj2.pos[1] <= i[1] <= obj2.pos[1] + obj2.size[1]:
+            return True
+
+    return False
+
+
+def main():
+    window = Window(size=Size(1280, 720))
+
+    rows = []
+    for n in (100, 1_000, 10_000):
+        CollisionWorld.bodies.clear()
+
+        # keep the density constant, so the number of collisions grows with the objects
+        area = (n * 2_000) ** 0.5
+        objects = [
+            Rect(Pos(random.uniform(0, area), random.uniform(0, area)), Size(20, 20))
+            for _ in range(n)
+        ]
+        for obj in objects:
+            CollisionWorld.add(obj, lambda other: None)
+
+        def old():
+            for obj in objects:
+                for other in objects:
+                    if other is not obj:
+                        corner_colliding(obj, other)
+
+        # the old scan takes minutes at 10k objects
+        old_ms = bench(old, 1) if n <= 1_000 else float("nan")
+        new_ms = bench(CollisionWorld.find_pairs, 5)
+
+        rows.append((n, old_ms, new_ms, len(CollisionWorld.find_pairs())))
+
+    report("Collision check time per frame (ms)", rows, ("objects", "n^2 scan", "sweep", "pairs"))
+
+
+if __name__ == "__main__":
+    main()
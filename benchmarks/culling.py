@@ -0,0 +1,54 @@
+"""
+Draw time of a large level (50k objects, about 0.1% of them inside the view) with and without culling.
+"""
+
+from . import bench, report
+
+import random
+
+from ezsgame import Window, World, Rect, Pos, Size
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    level_size = 72_000, 4_200
+    for _ in range(50_000):
+        Rect(Pos(random.uniform(0, level_size[0]), random.uniform(0, level_size[1])), Size(20, 20))
+
+    window.update()  # registers the objects
+
+    def draw_all():
+        for obj in World.objects:
+            obj.draw()
+
+    def draw_visible():
+        for obj in World.get_visible():
+            obj.draw()
+
+    World.culling = False
+    no_culling = bench(draw_all, 5)
+
+    World.culling = True
+    wrapper_only = bench(draw_all, 5)
+    indexed = bench(draw_visible, 5)
+
+    # one frame to get the stats
+    window.update()
+    draw_visible()
+    window.update()
+    stats = World.culling_stats
+
+    report(
+        "Draw time of 50k objects (ms)",
+        [
+            ("no culling", no_culling),
+            ("view test", wrapper_only),
+            ("grid + view", indexed),
+        ],
+    )
+    print(f"\nlast frame: {stats.drawn} drawn, {stats.culled} culled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Frame time with and without the dirty rects mode, for a static scene, a scene where 1% of the objects move, a partially
+animated scene (10% of the objects move) and a fully animated scene.
+
+Run with `--check` to exit with an error when the dirty rects mode doesn't speed up the static scene, or is slower than
+updating the whole window in the animated scenes (it should switch to full window updates).
+"""
+
+from . import bench, report
+
+import random
+import sys
+
+from ezsgame import Window, World, Rect, Pos, Size
+
+ROUNDS = 15
+FRAMES = 30  # per round
+
+MIN_STATIC_SPEEDUP = 1.5  # with --check
+MIN_ANIMATED_SPEEDUP = 0.9  # with --check, the dirty rects mode falls back to full updates
+
+
+def main():
+    window = Window(size=Size(1280, 720), fps=0)
+
+    rects = [
+        Rect(Pos(random.randint(0, 1240), random.randint(0, 680)), Size(30, 30), border_radius=[6])
+        for _ in range(500)
+    ]
+    window.update()  # registers the objects
+
+    def frame(moving):
+        def run():
+            for rect in moving:
+                rect.pos += (random.choice((-1, 1)), 0)
+
+            window.fill("black")
+            for obj in World.objects:
+                obj.draw()
+
+            window.update()
+
+        return run
+
+    rows = []
+    for name, moving in (("static", []), ("1% moving", rects[:5]), ("partial", rects[:50]), ("animated", rects)):
+        # the modes take turns and the fastest round is kept, frame times are noisy
+        times = [float("inf"), float("inf")]
+
+        for _ in range(ROUNDS):
+            for mode, dirty_rects in enumerate((False, True)):
+                window.dirty_rects = dirty_rects
+                window._full_update = True
+                times[mode] = min(times[mode], bench(frame(moving), FRAMES))
+
+        rows.append((name, *times, times[0] / times[1]))
+
+    report("Frame time with 500 rects (ms)", rows, ("scene", "full update", "dirty rects", "speedup"))
+
+    if "--check" in sys.argv:
+        speedups = {name: speedup for name, *_, speedup in rows}
+
+        if speedups["static"] < MIN_STATIC_SPEEDUP:
+            sys.exit("the dirty rects mode doesn't speed up a static scene")
+
+        if min(speedups["partial"], speedups["animated"]) < MIN_ANIMATED_SPEEDUP:
+            sys.exit("the dirty rects mode is slower than full window updates in animated scenes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares the old linear event lookup (scan every event, then filter) against the `EventList` dispatch table.
+"""
+
+from . import bench, report
+
+import random
+import pygame as pg
+
+from ezsgame.event_handler import Event, EventList, to_pgkey
+
+KEYS = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def make_events(n: int) -> EventList:
+    events = EventList()
+
+    for i in range(n):
+        key = to_pgkey(random.choice(KEYS))
+        events.add(Event(random.choice((pg.KEYDOWN, pg.KEYUP)), key, lambda: None, None, f"bench.{i}", key=key))
+
+    return events
+
+
+def linear_lookup(events: EventList, ev: pg.event.Event):
+    # What `EventHandler.check` used to do for every window event
+    return [
+        event
+        for event in events
+        if event.type == ev.type and ("key" not in event or event.key == ev.key)
+    ]
+
+
+def main():
+    window_events = [pg.event.Event(pg.KEYDOWN, key=to_pgkey(k), unicode=k) for k in KEYS] * 10
+
+    rows = []
+    for n in (10, 1_000, 10_000):
+        events = make_events(n)
+
+        old = bench(lambda: [linear_lookup(events, ev) for ev in window_events], 20)
+        new = bench(lambda: [events.get_listeners(ev) for ev in window_events], 20)
+
+        rows.append((n, old, new, old / new))
+
+    report(
+        f"Lookup time for {len(window_events)} key events (ms)",
+        rows,
+        ("listeners", "linear", "dispatch", "speedup"),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Fixed timestep loop under load: ticks per second, caught up and dropped ticks when frames are slower than a tick.
+"""
+
+from . import report
+
+import time
+
+from ezsgame import Window, World, Size
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=0, tick_rate=60, max_ticks=5)
+
+    body = {"x": 0.0, "v": 120.0}
+
+    def step():
+        body["x"] += body["v"] * window.get_delta_time()
+
+    World.on_update.add("benchmark.step", step)
+
+    rows = []
+    for frame_ms in (2, 16, 40, 120):
+        window.tick_stats.reset()
+        body["x"] = 0.0
+
+        start = time.perf_counter()
+        while time.perf_counter() - start < 1:
+            time.sleep(frame_ms / 1000)  # frame cost
+            window.update()
+
+        elapsed = time.perf_counter() - start
+        stats = window.tick_stats
+
+        # the simulated time is the same whatever the frame cost, unless ticks are dropped
+        rows.append((f"{frame_ms} ms frames", stats.frames, round(stats.ticks / elapsed, 1), stats.caught_up, stats.dropped, round(body["x"] / stats.ticks, 3)))
+
+    report(
+        "60 ticks per second, max 5 ticks per frame",
+        rows,
+        columns=("case", "frames", "ticks/s", "caught up", "dropped", "x per tick"),
+    )
+
+    World.on_update.remove("benchmark.step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Draw time of a full window gradient background: stripes drawn every frame (old `Gradient.draw`) vs the cached surface.
+"""
+
+from . import bench, report
+
+import pygame as pg
+
+from ezsgame import Window, Size
+from ezsgame.funcs import div
+from ezsgame.styles.colors import Gradient, gen_gradient
+
+
+def main():
+    window = Window(size=Size(1280, 720), fps=0)
+    colors = ("#1d2b53", "#7e2553", "#ff004d")
+
+    # stripes of the old Gradient, with the max complexity
+    stripes = []
+    for index, division in enumerate(div("x", len(colors), window.size), start=1):
+        if index > len(colors) - 1:
+            break
+        stripes.extend(gen_gradient(window.size, div("x", 1000, [division[1], window.size[1]]), colors[index - 1], colors[index], "horizontal", division[0]))
+
+    def draw_stripes():
+        for pos, size, color in stripes:
+            pg.draw.rect(window.surface, color, pg.Rect(pos, size))
+
+    gradients = {direction: Gradient(*colors, direction=direction) for direction in ("horizontal", "vertical", "diagonal", "radial")}
+
+    report(
+        "first render (ms)",
+        [(direction, bench(gradient.get_surface, 1)) for direction, gradient in gradients.items()],
+    )
+
+    report(
+        "1280x720 gradient per frame (ms)",
+        [
+            ("stripes", bench(draw_stripes, 50)),
+            *[(f"cached {direction}", bench(gradient.draw, 50)) for direction, gradient in gradients.items()],
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares hit-testing every event listener object (old `EventHandler.is_hovering` loop)
+against querying the `SpatialGrid` of listener objects, with 5k clickable rects.
+
+Run with `--check` to exit with an error when objects moved in place are not hit at their new position (or still hit at the old one).
+"""
+
+from . import bench, report
+
+import random
+import sys
+
+from ezsgame import Window, Rect, Pos, Size, EventHandler, add_event
+
+
+def is_hovering(obj, mouse_pos) -> bool:
+    # What `EventHandler.is_hovering` did for every listener on every mouse event
+    box = obj._get_collision_box()
+    return box[0][0] < mouse_pos[0] < box[1][0] and box[0][1] < mouse_pos[1] < box[2][1]
+
+
+def main():
+    window = Window(size=Size(1280, 720))
+
+    rects = [
+        Rect(Pos(random.randint(0, 1240), random.randint(0, 680)), Size(40, 40), z_index=random.randint(0, 3))
+        for _ in range(5_000)
+    ]
+
+    for rect in rects:
+        add_event("click", rect)(lambda: None)
+
+    EventHandler.check()  # registers the listeners
+
+    mouse_positions = [(random.randint(0, 1280), random.randint(0, 720)) for _ in range(100)]
+
+    def old():
+        for mouse_pos in mouse_positions:
+            hovered = [rect for rect in rects if is_hovering(rect, mouse_pos)]
+
+    def new():
+        for mouse_pos in mouse_positions:
+            EventHandler.events.get_topmost(EventHandler.events.get_hovered(mouse_pos))
+
+    def move():
+        for rect in rects[:500]:
+            rect.pos += (1, 0)
+
+    old_ms, new_ms = bench(old, 5), bench(new, 5)
+    report(
+        "Hit-testing 100 mouse events with 5000 listener rects (ms)",
+        [("5000", old_ms, new_ms, old_ms / new_ms)],
+        ("listeners", "linear", "grid", "speedup"),
+    )
+    report("Moving 500 indexed rects (ms)", [("500", bench(move, 5))])
+
+    if "--check" in sys.argv:
+        # moved in place, like `Group.align_objects` does
+        for rect in rects[:100]:
+            old_center = (rect.pos.x + 20, rect.pos.y + 20)
+            rect.pos.x += 200
+            rect.pos[1] = rect.pos[1] + 100
+
+            hovered = EventHandler.events.get_hovered((rect.pos.x + 20, rect.pos.y + 20))
+            if rect not in hovered or rect in EventHandler.events.get_hovered(old_center):
+                sys.exit("an object moved in place is not hit at its position")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Load and draw time of 1k identical sprites: loading/scaling the image per sprite (and per draw) vs the image cache.
+"""
+
+from . import bench, report
+
+import os
+import tempfile
+
+import pygame as pg
+
+from ezsgame import Window, Pos, Size
+from ezsgame.graphics import ImageCache, Sprite
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    path = os.path.join(tempfile.mkdtemp(), "sprite.png")
+    image = pg.Surface((128, 128), pg.SRCALPHA)
+    image.fill((200, 80, 40, 255), (16, 16, 96, 96))
+    pg.image.save(image, path)
+
+    positions = [(i % 40 * 18, i // 40 * 16) for i in range(1000)]
+
+    # how the sprites were loaded and drawn before the cache
+    def load_uncached():
+        return [pg.transform.scale(pg.image.load(path), (32, 32)) for _ in positions]
+
+    def load_cached():
+        ImageCache.clear()
+        return [Sprite(path, Pos(*pos), Size(32, 32)) for pos in positions]
+
+    uncached_images = load_uncached()
+    sprites = load_cached()
+
+    def draw_uncached():
+        for surface, pos in zip(uncached_images, positions):
+            # scaled on every draw, never converted to the window format
+            window.surface.blit(pg.transform.scale(surface, (32, 32)), pos)
+
+    def draw_cached():
+        for sprite in sprites:
+            sprite.draw()
+
+    report(
+        "1k sprites (ms)",
+        [
+            ("load per sprite", bench(load_uncached, 5)),
+            ("load cached", bench(load_cached, 5)),
+            ("draw uncached", bench(draw_uncached, 20)),
+            ("draw cached", bench(draw_cached, 20)),
+        ],
+    )
+    print(f"\ncache: {len(ImageCache.surfaces)} surfaces, {ImageCache.memory / 1024:.1f} KB, {ImageCache.hits} hits, {ImageCache.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
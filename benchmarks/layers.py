@@ -0,0 +1,105 @@
+"""
+HUD-heavy scene: a playfield of moving objects under a HUD of 300 texts and 60 panels where one text changes every
+15 frames. The HUD drawn with the other objects every frame vs the HUD in a `Layer` (drawn again only when it changes),
+with the layer checking its objects for changes every frame or only drawn again after `mark_dirty`.
+
+Run with `--check` to exit with an error when the layer doesn't look like the HUD drawn directly.
+"""
+
+from . import report
+
+import random
+import sys
+import time
+
+import pygame as pg
+
+from ezsgame import Window, Layer, Rect, Text, Pos, Size, draw_batched
+
+FRAMES = 240
+CHANGE_EVERY = 15  # frames
+
+
+def make_hud():
+    random.seed(0)
+    hud = []
+
+    for i in range(60):
+        hud.append(Rect(Pos(i % 10 * 72, i // 10 * 20), Size(68, 18), color="#3a4a6b", border_radius=[6]))
+
+    for i in range(300):
+        hud.append(Text(f"stat {i}: {random.randint(0, 999)}", Pos(i % 10 * 72 + 2, i // 10 * 14), 10, color="white"))
+
+    return hud
+
+
+def make_playfield():
+    random.seed(1)
+    return [
+        Rect(Pos(random.uniform(0, 700), random.uniform(0, 400)), Size(12, 12), color="orange", static=True)
+        for _ in range(200)
+    ]
+
+
+def run(window, hud, layer=None):
+    # frame times (ms), the playfield moves every frame and a HUD text changes every `CHANGE_EVERY` frames
+    playfield = make_playfield()
+    objects = playfield + ([layer] if layer else hud)
+    frame_times = []
+
+    for frame in range(FRAMES):
+        for obj in playfield:
+            obj.pos[0] = (obj.pos[0] + 1) % 700
+
+        if hud and frame % CHANGE_EVERY == 0:
+            hud[-1].text.set(f"frame {frame}")
+
+            if layer and not layer.track_changes:
+                layer.mark_dirty()
+
+        start = time.perf_counter()
+        window.fill()
+        draw_batched(objects)
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    return frame_times
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    baseline = run(window, [])
+    direct = run(window, make_hud())
+    direct_frame = pg.image.tobytes(window.surface, "RGB")
+
+    hud = make_hud()
+    layer = Layer(Pos(0, 0), window.size, hud, fixed=True, z_index=1)
+    layered = run(window, hud, layer)
+    layer_frame = pg.image.tobytes(window.surface, "RGB")
+
+    hud = make_hud()
+    manual_layer = Layer(Pos(0, 0), window.size, hud, track_changes=False, fixed=True, z_index=1)
+    manual = run(window, hud, manual_layer)
+
+    report(
+        f"{FRAMES} frames, 200 moving rects + HUD (300 texts, 60 panels), a HUD text changes every {CHANGE_EVERY} frames",
+        [
+            ("no HUD", round(sum(baseline) / FRAMES, 3), round(max(baseline), 3), 0),
+            ("HUD objects", round(sum(direct) / FRAMES, 3), round(max(direct), 3), FRAMES),
+            ("HUD layer", round(sum(layered) / FRAMES, 3), round(max(layered), 3), layer.renders),
+            ("mark_dirty", round(sum(manual) / FRAMES, 3), round(max(manual), 3), manual_layer.renders),
+        ],
+        columns=("case", "mean frame ms", "max frame ms", "HUD renders"),
+    )
+
+    # antialiased texts are blended twice in a transparent layer, a few levels of difference are expected
+    different = sum(abs(a - b) > 8 for a, b in zip(direct_frame, layer_frame))
+    print(f"\nchannels that differ between the two last frames: {different} / {len(direct_frame)}")
+
+    if "--check" in sys.argv:
+        if different > len(direct_frame) // 1000 or layer.renders != FRAMES // CHANGE_EVERY:
+            sys.exit("the layer doesn't match the HUD drawn directly")
+
+
+if __name__ == "__main__":
+    main()
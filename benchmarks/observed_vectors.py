@@ -0,0 +1,112 @@
+"""
+Change tracking of `pos` / `size`: cost of `Pos` vs `ObservedPos` operations (without observer, with an observer that does
+nothing and the `pos` of an object in the world, that updates the culling grid), and keeping a spatial index up to date when
+objects are moved in place (`obj.pos += velocity`) by rescanning every object each frame vs objects that observe their
+geometry (the default, only the objects that moved update the index).
+
+Run with `--check` to exit with an error when the index doesn't match the objects positions.
+"""
+
+from . import bench, report
+
+import random
+import sys
+
+from ezsgame import Window, Rect, Pos, ObservedPos, SpatialGrid, Size
+
+OBJECTS = 5_000
+MOVING = 0.05  # part of the objects that move every frame
+
+
+def make_objects(observed):
+    random.seed(0)
+    objects = [Rect(Pos(random.uniform(0, 4_000), random.uniform(0, 4_000)), Size(16, 16)) for _ in range(OBJECTS)]
+    grid = SpatialGrid(cell_size=128)
+
+    for obj in objects:
+        grid.insert(obj)
+        obj._grids.append(grid)
+
+        # objects observe their geometry by default
+        if not observed:
+            obj.pos.observe(None)
+            obj.size.observe(None)
+
+    return objects, grid
+
+
+def is_indexed(grid, objects):
+    # every object is found in the cells of its current bounds
+    return all(obj in grid.query_rect(obj._get_bounds()) and grid._objects[obj] == grid._cell_range(obj._get_bounds()) for obj in objects)
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=0)
+
+    # operations (ms per 10k)
+    def write(vector):
+        for i in range(10_000):
+            vector[0] = i
+
+    def add(vector):
+        for _ in range(10_000):
+            vector += (1, 1)
+
+    def read(vector):
+        for _ in range(10_000):
+            vector.x
+
+    def plus(vector):
+        for _ in range(10_000):
+            vector + (1, 1)
+
+    obj = Rect(Pos(0, 0), Size(16, 16))
+    Window.update(window)  # adds the object to the world (and the culling grid)
+
+    vectors = [
+        ("Pos", Pos(0, 0)),
+        ("ObservedPos", ObservedPos(0, 0)),
+        ("observer", ObservedPos(0, 0, observer=lambda v: None)),
+        ("object pos", obj.pos),
+    ]
+
+    report(
+        "10k operations (ms)",
+        [(case, *(bench(lambda: op(vector), 10) for op in (write, add, read, plus))) for case, vector in vectors],
+        columns=("case", "v[0] = i", "v += (1, 1)", "v.x", "v + (1, 1)"),
+    )
+
+    velocity = Pos(3, 2)
+    moving = int(OBJECTS * MOVING)
+
+    # in place changes are not seen by the index, a system has to update every object every frame
+    objects, rescanned_grid = make_objects(False)
+
+    def rescan():
+        for obj in random.sample(objects, moving):
+            obj.pos += velocity
+
+        for obj in objects:
+            rescanned_grid.update(obj)
+
+    observed_objects, observed_grid = make_objects(True)
+
+    def observed():
+        for obj in random.sample(observed_objects, moving):
+            obj.pos += velocity
+
+    report(
+        f"frame with {moving} of {OBJECTS} objects moved in place (ms)",
+        [
+            ("rescan", bench(rescan, 20)),
+            ("observed", bench(observed, 20)),
+        ],
+    )
+
+    if "--check" in sys.argv:
+        if not is_indexed(observed_grid, observed_objects) or not is_indexed(rescanned_grid, objects):
+            sys.exit("the spatial index doesn't match the objects")
+
+
+if __name__ == "__main__":
+    main()
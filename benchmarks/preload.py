@@ -0,0 +1,125 @@
+"""
+Switching to a scene with large assets: loading them when the scene is switched to (the main loop freezes) vs a
+loading scene while an `AssetLoader` decodes them in background threads (the main loop keeps running).
+
+Run with `--check` to exit with an error when a frame takes too long during the preload.
+"""
+
+from . import report
+
+import os
+import sys
+import tempfile
+import time
+
+import pygame as pg
+from PIL import Image as PILImage
+
+from ezsgame import Window, Size, Scene, SceneManager, ImageCache, GifFrames
+
+IMAGES = 24
+IMAGE_SIZE = 1024
+MAX_FRAME = 50  # ms, with --check
+
+
+def make_assets():
+    folder = tempfile.mkdtemp()
+    paths = []
+
+    for i in range(IMAGES):
+        path = os.path.join(folder, f"image_{i}.png")
+        pg.image.save(pg.image.frombytes(os.urandom(IMAGE_SIZE * IMAGE_SIZE * 3), (IMAGE_SIZE, IMAGE_SIZE), "RGB"), path)
+        paths.append(path)
+
+    path = os.path.join(folder, "animation.gif")
+    frames = [PILImage.frombytes("RGB", (256, 256), os.urandom(256 * 256 * 3)) for _ in range(30)]
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+    paths.append(path)
+
+    return paths
+
+
+class Main(Scene):
+    def init(self): pass
+    def update(self): pass
+    def draw(self): pass
+
+
+class Loading(Scene):
+    def init(self):
+        self.progress = []
+
+    def update(self):
+        self.progress.append(self.manager.loading_progress)
+
+    def draw(self):
+        pg.draw.rect(self.manager.window.surface, "white", (10, 10, 300 * self.manager.loading_progress, 10))
+
+
+def make_game_scene(paths, preload):
+    class Game(Scene):
+        assets = paths if preload else ()
+
+        def init(self):
+            self.images = [ImageCache.load(path) for path in paths if not path.endswith(".gif")]
+            self.animation = GifFrames(paths[-1])
+            self.frames = [self.animation.get_frame(i) for i in range(len(self.animation))]
+
+        def update(self): pass
+        def draw(self): pass
+
+    return Game()
+
+
+def run(window, manager):
+    # frames until the game scene is shown, returns the frame times (ms)
+    frame_times = []
+    switched = False
+
+    while manager.current_scene.name != "Game":
+        start = time.perf_counter()
+
+        window.check_events()
+        manager.update()
+        manager.draw()
+        window.update()
+
+        if not switched:
+            manager.switch_to("Game")
+            switched = True
+
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    return frame_times
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=60)
+    paths = make_assets()
+
+    # the assets are loaded by `init` in `switch_to`
+    ImageCache.clear()
+    blocking = run(window, SceneManager(Main(), make_game_scene(paths, False), main_scene="Main", lazy_load=True))
+
+    ImageCache.clear()
+    loading = Loading()
+    manager = SceneManager(Main(), loading, make_game_scene(paths, True), main_scene="Main", lazy_load=True, loading_scene="Loading")
+    preloaded = run(window, manager)
+
+    report(
+        f"switch to a scene with {IMAGES} {IMAGE_SIZE}x{IMAGE_SIZE} images and a 30 frames GIF",
+        [
+            ("switch_to", len(blocking), round(sum(blocking), 1), round(max(blocking), 1)),
+            ("loading scene", len(preloaded), round(sum(preloaded), 1), round(max(preloaded), 1)),
+        ],
+        columns=("case", "frames", "total ms", "max frame ms"),
+    )
+    print(f"\nprogress reported by the loading scene: {[round(p, 2) for p in loading.progress[::max(1, len(loading.progress) // 8)]]}")
+
+    if "--check" in sys.argv:
+        if max(preloaded[1:]) > MAX_FRAME or len(preloaded) < 3:
+            sys.exit("the main loop was blocked during the preload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Visiting scenes with their own assets: memory of the `ImageCache` and time of the switch frames, with scenes that load
+their images in `init` vs scenes that declare their `assets` (unloaded when switched from) and their `next_scenes` (prefetched).
+"""
+
+from . import report
+
+import os
+import tempfile
+import time
+
+import pygame as pg
+
+from ezsgame import Window, Size, Scene, SceneManager, ImageCache
+
+IMAGES = 8  # per scene
+IMAGE_SIZE = 1024
+ROUTE = ["Menu", "Level1", "Menu", "Level2", "Menu", "Level3", "Menu", "Level1"]
+
+
+def make_images(folder, name):
+    paths = []
+    for i in range(IMAGES):
+        path = os.path.join(folder, f"{name}_{i}.png")
+        pg.image.save(pg.image.frombytes(os.urandom(IMAGE_SIZE * IMAGE_SIZE * 3), (IMAGE_SIZE, IMAGE_SIZE), "RGB"), path)
+        paths.append(path)
+    return paths
+
+
+def make_scene(name, paths, shared, declare, next_scenes=()):
+    class GameScene(Scene):
+        assets = [*paths, *shared] if declare else ()
+
+        def init(self):
+            self.images = [ImageCache.load(path) for path in [*paths, *shared]]
+
+        def unload(self):
+            self.images = []
+
+        def update(self): pass
+        def draw(self): pass
+
+    scene = GameScene(name)
+    scene.next_scenes = next_scenes if declare else ()
+    return scene
+
+
+def visit(window, manager):
+    # runs 20 frames in every scene of the route, returns the memory after each switch and the longest frame
+    memory = []
+    longest = 0.0
+
+    for name in ROUTE:
+        for frame in range(20):
+            start = time.perf_counter()
+
+            # switching happens in the first frame of the scene
+            if frame == 0:
+                manager.switch_to(name)
+
+            window.check_events()
+            manager.update()
+            manager.draw()
+            window.update()
+
+            longest = max(longest, (time.perf_counter() - start) * 1000)
+
+        memory.append(ImageCache.memory // 1024**2)
+
+    return memory, longest
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=60)
+    folder = tempfile.mkdtemp()
+
+    images = {name: make_images(folder, name) for name in ("Menu", "Level1", "Level2", "Level3")}
+    shared = make_images(folder, "shared")[:2]
+    levels = ("Level1", "Level2", "Level3")
+
+    results = []
+    for declare in (False, True):
+        ImageCache.clear()
+        ImageCache.memory_budget = 1024**3
+
+        scenes = [make_scene("Menu", images["Menu"], shared, declare, levels)]
+        scenes += [make_scene(name, images[name], shared, declare, ("Menu",)) for name in levels]
+
+        manager = SceneManager(*scenes, main_scene="Menu", lazy_load=True)
+        memory, longest = visit(window, manager)
+        results.append((declare, memory, longest, manager))
+
+    report(
+        f"route {' > '.join(ROUTE)}, {IMAGES} {IMAGE_SIZE}x{IMAGE_SIZE} images per scene",
+        [
+            ("load in init" if not declare else "assets+prefetch", str(memory), round(longest, 1))
+            for declare, memory, longest, _ in results
+        ],
+        columns=("case", "MB after each switch", "longest frame ms"),
+    )
+
+    print("\nmemory per scene (MB):", {name: memory // 1024**2 for name, memory in results[-1][3].get_memory().items()})
+
+
+if __name__ == "__main__":
+    main()
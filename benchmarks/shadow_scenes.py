@@ -0,0 +1,140 @@
+"""
+Shadow scenes: a game scene shown over a background simulation scene (`shadow_update`) and a HUD scene (`shadow_draw`).
+Compares updating the simulation every frame, at 10 Hz (`update_rate`) and a simulation that waits on I/O updated in the
+main thread vs in a background thread (`threaded`).
+
+Run with `--check` to exit with an error when the shadow scenes don't run or the main loop waits for a threaded update.
+"""
+
+from . import report
+
+import sys
+import time
+
+from ezsgame import Window, Size, Scene, SceneManager
+
+FRAMES = 120
+FPS = 60
+WORK = 4  # ms of work per simulation update
+IO_WAIT = 30  # ms the I/O simulation waits per update
+MAX_FRAME = 10  # ms, with --check
+
+
+def busy(ms):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+class Game(Scene):
+    def init(self): pass
+    def update(self): pass
+    def draw(self): pass
+
+
+class Simulation(Scene):
+    def init(self):
+        self.steps = 0
+
+    def update(self):
+        busy(WORK)
+        self.steps += 1
+
+    def draw(self): pass
+
+
+class Network(Scene):
+    # waits on a socket / file, the GIL is released while it waits
+    def init(self):
+        self.steps = 0
+
+    def update(self):
+        time.sleep(IO_WAIT / 1000)
+        self.steps += 1
+
+    def draw(self): pass
+
+
+class Hud(Scene):
+    def init(self):
+        self.draws = 0
+
+    def update(self): pass
+
+    def draw(self):
+        self.draws += 1
+
+
+def run(window, *background):
+    # frames at `FPS`, returns the time (ms) of the frames work and the manager
+    manager = SceneManager(Game(), *background, Hud(shadow_draw=True), main_scene="Game")
+    frame_times = []
+    next_frame = time.perf_counter()
+
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+
+        manager.update()
+        manager.draw()
+
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+        next_frame += 1 / FPS
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    manager._wait_update(manager.scenes[background[0].name])
+    return frame_times, manager
+
+
+def main():
+    window = Window(size=Size(320, 200), fps=FPS)
+
+    cases = [
+        ("every frame", Simulation(shadow_update=True)),
+        ("10 Hz", Simulation(shadow_update=True, update_rate=10)),
+        ("I/O main thread", Network(shadow_update=True, update_rate=10)),
+        ("I/O threaded", Network(shadow_update=True, update_rate=10, threaded=True)),
+        ("I/O threaded, drawn", Network(shadow_update=True, shadow_draw=True, update_rate=10, threaded=True)),
+    ]
+
+    rows = []
+    results = {}
+
+    for case, scene in cases:
+        frame_times, manager = run(window, scene)
+        stats = manager.stats[scene.name]
+        results[case] = frame_times, manager, scene
+
+        rows.append(
+            (
+                case,
+                scene.steps,
+                round(sum(frame_times) / len(frame_times), 2),
+                round(max(frame_times), 2),
+                round(stats.update_time * 1000, 1),
+            )
+        )
+
+    report(
+        f"{FRAMES} frames at {FPS} FPS, background scene + HUD scene under the current scene",
+        rows,
+        columns=("background", "updates", "mean frame ms", "max frame ms", "update ms"),
+    )
+
+    _, manager, _ = results["I/O threaded"]
+    print("\nstats of the threaded case:")
+    for name, stats in manager.stats.items():
+        print(f"  {name:>10}: {stats}")
+
+    if "--check" in sys.argv:
+        _, manager, scene = results["10 Hz"]
+
+        if manager.scenes["Hud"].draws != FRAMES or not 15 <= scene.steps <= 25:
+            sys.exit("the shadow scenes didn't run")
+
+        if max(results["I/O threaded"][0] + results["I/O threaded, drawn"][0]) > MAX_FRAME:
+            sys.exit("the main loop waited for a threaded update")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Spawn-heavy scene: 40 bullets are spawned every frame and live for 60 frames.
+Compares never removing objects (the only option before `World.remove`), removing them and creating new ones,
+and recycling them with an `ObjectPool`. Reports frame times and allocated memory blocks.
+"""
+
+from . import report
+
+import gc
+import statistics
+import sys
+import time
+
+from ezsgame import Window, World, Rect, Pos, Size, ObjectPool
+
+FRAMES = 300
+SPAWN = 40
+LIFETIME = 60
+
+
+def run(window, spawn, despawn):
+    alive = []
+    times = []
+    collections = [0]
+
+    def count(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    gc.callbacks.append(count)
+    blocks = sys.getallocatedblocks()
+
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+
+        for i in range(SPAWN):
+            alive.append((frame, spawn(Pos(i * 10, frame % 400))))
+
+        while alive and frame - alive[0][0] >= LIFETIME:
+            despawn(alive.pop(0)[1])
+
+        for _, bullet in alive:
+            bullet.pos += (0, 2)
+
+        window.fill("black")
+        for obj in World.objects:
+            obj.draw()
+        window.update()
+
+        times.append((time.perf_counter() - start) * 1000)
+
+    gc.callbacks.remove(count)
+    blocks = sys.getallocatedblocks() - blocks
+
+    # clean up for the next run
+    for _, bullet in alive:
+        despawn(bullet)
+
+    for obj in list(World.objects):
+        World.remove(obj)
+
+    window.update()
+
+    return (
+        statistics.mean(times),
+        statistics.quantiles(times, n=100)[98],
+        max(times),
+        collections[0],
+        blocks,
+    )
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    pool = ObjectPool(Rect, size=Size(4, 10), color="yellow", prefill=SPAWN * LIFETIME)
+    window.update()
+
+    rows = [
+        ("no removal", *run(window, lambda pos: Rect(pos, Size(4, 10), color="yellow"), lambda obj: None)),
+        ("World.remove", *run(window, lambda pos: Rect(pos, Size(4, 10), color="yellow"), World.remove)),
+        ("ObjectPool", *run(window, pool.get, pool.release)),
+    ]
+
+    report(
+        f"{FRAMES} frames spawning {SPAWN} bullets per frame (ms)",
+        rows,
+        ("case", "mean", "p99", "max", "gc runs", "new blocks"),
+    )
+
+
+if __name__ == "__main__":
+    main()
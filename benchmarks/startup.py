@@ -0,0 +1,75 @@
+"""
+Import time of ezsgame (`python -X importtime`) and time to the first frame, checked against a budget.
+
+Run with `--check` to exit with an error when a budget is exceeded (Example: in CI).
+"""
+
+from . import report
+
+import os
+import re
+import subprocess
+import sys
+
+# budgets in milliseconds, generous to not fail on slow machines
+IMPORT_BUDGET = 400
+FIRST_FRAME_BUDGET = 800
+
+FIRST_FRAME = """
+import time
+start = time.perf_counter()
+import pygame as pg
+import ezsgame
+imported = time.perf_counter()
+print("initialized", pg.display.get_init(), pg.font.get_init(), pg.mixer.get_init() is not None)
+window = ezsgame.Window(size=ezsgame.Size(200, 200), fps=0)
+ezsgame.Text("ready", ezsgame.Pos(10, 10), 20)
+window.fill()
+for obj in ezsgame.World.get_visible():
+    obj.draw()
+window.update()
+print("times", (imported - start) * 1000, (time.perf_counter() - start) * 1000)
+"""
+
+
+def run(args, repeat=5):
+    outputs = []
+    for _ in range(repeat):
+        outputs.append(subprocess.run([sys.executable, *args], capture_output=True, text=True, env=os.environ, check=True))
+    return outputs
+
+
+def main():
+    # cumulative import time of the ezsgame package (microseconds), best of the runs
+    import_times = []
+    for output in run(["-X", "importtime", "-c", "import ezsgame"]):
+        match = re.search(r"\|\s*(\d+)\s*\|\s*ezsgame$", output.stderr, re.MULTILINE)
+        import_times.append(int(match.group(1)) / 1000)
+
+    first_frame_times = []
+    initialized = None
+    for output in run(["-c", FIRST_FRAME]):
+        lines = dict(line.split(" ", 1) for line in output.stdout.splitlines() if " " in line)
+        initialized = lines["initialized"]
+        first_frame_times.append(float(lines["times"].split()[1]))
+
+    import_time, first_frame = min(import_times), min(first_frame_times)
+
+    report(
+        "Startup (ms)",
+        [
+            ("import", import_time, float(IMPORT_BUDGET)),
+            ("first frame", first_frame, float(FIRST_FRAME_BUDGET)),
+        ],
+        columns=("case", "ms", "budget"),
+    )
+    print(f"\ninitialized after import (display, font, mixer): {initialized}")
+
+    if "--check" in sys.argv:
+        over = import_time > IMPORT_BUDGET or first_frame > FIRST_FRAME_BUDGET
+        if over or initialized != "False False False":
+            sys.exit("startup budget exceeded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Draw time of 2k rounded UI panels, 1k circles and 1k ellipses: rasterized every frame vs `static` shapes.
+"""
+
+from . import bench, report
+
+import random
+
+from ezsgame import Window, World, Rect, Circle, Ellipse, Pos, Size, draw_batched
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    def make_shapes(static):
+        random.seed(0)
+        shapes = []
+        for _ in range(2000):
+            shapes.append(Rect(Pos(random.uniform(0, 600), random.uniform(0, 360)), Size(120, 60), color="#3a4a6b", border_radius=[12], static=static))
+        for _ in range(1000):
+            shapes.append(Circle(Pos(random.uniform(0, 720), random.uniform(0, 420)), 10, color="orange", stroke=2, static=static))
+        for _ in range(1000):
+            shapes.append(Ellipse(Pos(random.uniform(0, 700), random.uniform(0, 400)), Size(24, 12), color="green", static=static))
+        return shapes
+
+    rasterized = make_shapes(False)
+    static = make_shapes(True)
+
+    def draw(shapes):
+        window.fill()
+        draw_batched(shapes)
+
+    report(
+        "4k shapes (ms)",
+        [
+            ("rasterized", bench(lambda: draw(rasterized), 20)),
+            ("static", bench(lambda: draw(static), 20)),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Frame time of a counter text updated every frame: opening the font and rendering every time (before the font cache)
+vs cached font and rendered texts vs glyphs mode.
+
+Run with `--check` to exit with an error when the glyphs mode is not faster than rendering new texts.
+"""
+
+from . import bench, report
+
+import sys
+
+import pygame as pg
+
+from ezsgame import Window, Text, Pos, Size
+from ezsgame.fonts import Fonts
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    counter = Text("0", Pos(10, 10), 24)
+    glyph_counter = Text("0", Pos(10, 50), 24, glyphs=True)
+
+    def reopen_font():
+        # what Text did on every text change
+        for i in range(100):
+            pg.font.Font(Fonts.OpenSans.font_file, 24).render(f"Score: {i}", True, (255, 255, 255))
+
+    def update(text, start):
+        def run():
+            for i in range(start, start + 100):
+                text.text.set(f"Score: {i}")
+        return run
+
+    new = bench(update(counter, 0), 1)  # every text is new
+    glyphs = bench(update(glyph_counter, 1000), 10)
+
+    report(
+        "100 counter updates (ms)",
+        [
+            ("open font", bench(reopen_font, 10)),
+            ("cached, new", new),
+            ("cached, seen", bench(update(counter, 0), 10)),  # texts already rendered
+            ("glyphs", glyphs),
+        ],
+    )
+
+    if "--check" in sys.argv and glyphs >= new:
+        sys.exit("the glyphs mode is not faster than rendering new texts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Frame time while scrolling a 1000x1000 tiles map (16x16 tiles), memory of the cached chunks and cost of changing tiles.
+"""
+
+from . import bench, report
+
+import random
+
+import pygame as pg
+
+from ezsgame import Window, World, Pos, Size
+from ezsgame.graphics import Tileset, TileMap
+
+
+def main():
+    window = Window(size=Size(720, 420), fps=0)
+
+    # tileset of 16 colored tiles
+    image = pg.Surface((64, 64))
+    for i in range(16):
+        image.fill((i * 15, 255 - i * 15, 120), ((i % 4) * 16, (i // 4) * 16, 16, 16))
+
+    columns, rows = 1000, 1000
+    tilemap = TileMap(
+        Tileset(image, [16, 16]),
+        Pos(0, 0),
+        [columns, rows],
+        (random.randrange(-1, 16) for _ in range(columns * rows)),
+    )
+    window.update()  # registers the tilemap
+
+    def scroll():
+        window.fill()
+        World.pos.x = (World.pos.x + 8) % (columns * 16 - 720)
+        World.pos.y = (World.pos.y + 3) % (rows * 16 - 420)
+        tilemap.draw()
+
+    def set_tiles():
+        for _ in range(100):
+            tilemap.set_tile(random.randrange(60), random.randrange(30), random.randrange(-1, 16))
+
+    def draw_per_tile():
+        # drawing every visible tile each frame, without chunks
+        window.fill()
+        tiles = tilemap.tileset.tiles
+        first_column, first_row = int(World.pos.x // 16), int(World.pos.y // 16)
+        blits = []
+        for row in range(first_row, first_row + 420 // 16 + 2):
+            for column in range(first_column, first_column + 720 // 16 + 2):
+                index = tilemap.get_tile(column, row)
+                if index != -1:
+                    blits.append((tiles[index], (column * 16 - World.pos.x, row * 16 - World.pos.y)))
+        window.surface.blits(blits, doreturn=False)
+        World.pos.x = (World.pos.x + 8) % (columns * 16 - 720)
+        World.pos.y = (World.pos.y + 3) % (rows * 16 - 420)
+
+    per_tile = bench(draw_per_tile, 300)
+    chunked = bench(scroll, 300)
+    changes = bench(set_tiles, 20)
+
+    chunk_bytes = sum(chunk.get_bytesize() * chunk.get_width() * chunk.get_height() for chunk in tilemap._chunks.values())
+    World.pos.x = World.pos.y = 0
+
+    report(
+        "Scrolling a 1000x1000 tiles map (ms)",
+        [
+            ("per tile", per_tile),
+            ("chunks", chunked),
+            ("100 set_tile", changes),
+        ],
+    )
+    print(f"\n{tilemap}, {chunk_bytes / 1024 ** 2:.1f} MB of chunks, {len(tilemap.tiles) * tilemap.tiles.itemsize / 1024 ** 2:.1f} MB of tile indexes")
+
+
+if __name__ == "__main__":
+    main()
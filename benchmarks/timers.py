@@ -0,0 +1,90 @@
+"""
+`TimeHandler.check` and `remove` with 10k intervals: the old linear scan vs the heap scheduler.
+Intervals of a frame or less are kept out of the heap (a list checked every frame), so they don't pay for the heap operations.
+"""
+
+from . import bench, report
+
+import random
+import pygame as pg
+
+from ezsgame.time_handler import Interval, TimeHandler
+
+COUNT = 10_000
+
+
+def linear_check(intervals):
+    # What `TimeHandler.check` used to do every frame
+    current_time = pg.time.get_ticks()
+    for interval in intervals:
+        if current_time - interval.last_call >= interval.time:
+            interval.callback()
+            interval.last_call = pg.time.get_ticks()
+
+
+def linear_remove(intervals, name):
+    # What `TimeHandler.remove` used to do (at the next check)
+    for index, interval in enumerate(intervals):
+        if interval.name == name:
+            del intervals[index]
+            break
+
+
+def main():
+    pg.init()
+    random.seed(0)
+    calls = [0]
+
+    def callback():
+        calls[0] += 1
+
+    # cooldowns, spawners and buffs: from 1 to 30 seconds
+    periods = [random.uniform(1, 30) for _ in range(COUNT)]
+    now = pg.time.get_ticks()
+
+    intervals = [Interval(period * 1000, callback, now, f"timer.{i}", -1) for i, period in enumerate(periods)]
+    for i, period in enumerate(periods):
+        TimeHandler.add(period, callback, f"timer.{i}")
+    TimeHandler.check()
+
+    report(
+        f"check, {COUNT} idle intervals (ms)",
+        [
+            ("linear", bench(lambda: linear_check(intervals), 200)),
+            ("heap", bench(TimeHandler.check, 200)),
+        ],
+    )
+
+    names = iter(random.sample(range(COUNT), 500))
+    linear_names = iter(random.sample(range(COUNT), 500))
+
+    report(
+        f"remove by name, {COUNT} intervals (ms)",
+        [
+            ("linear", bench(lambda: linear_remove(intervals, f"timer.{next(linear_names)}"), 500)),
+            ("heap", bench(lambda: TimeHandler.remove(f"timer.{next(names)}"), 500)),
+        ],
+    )
+
+    TimeHandler.clear()
+
+    # every interval fires in every check
+    for _ in range(COUNT):
+        TimeHandler.add(0, callback)
+    TimeHandler.check()
+
+    intervals = [Interval(0, callback, 0, f"timer.{i}", -1) for i in range(COUNT)]
+
+    report(
+        f"check, {COUNT} intervals firing every frame (ms)",
+        [
+            ("linear", bench(lambda: linear_check(intervals), 20)),
+            ("heap", bench(TimeHandler.check, 20)),
+        ],
+    )
+
+    TimeHandler.clear()
+
+
+if __name__ == "__main__":
+    main()
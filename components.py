@@ -6,25 +6,16 @@ import time
 class HitBox(Component):
     def __init__(self) -> None:
         self.on_collision: Signal = Signal()
-        self._signal_name = f"hitbox_collision_{id(self)}"
 
     def mount(self, object: Object):
         self.object = object
 
-    def check_collision(self):
-        for other in World.objects:
-            if other != self.object:
-                if is_colliding(self.object, other):
-                    self.on_collision.trigger(other)
-
     def activate(self):
-        World.on_update.add(self._signal_name, self.check_collision)
+        # collisions are checked once per frame by the collision world
+        CollisionWorld.add(self.object, self.on_collision.trigger)
 
     def deactivate(self):
-        World.on_update.remove(self._signal_name)
-
-    def remove(self):
-        pass
+        CollisionWorld.remove(self.object)
 
 
 class Health(Component):
@@ -138,8 +129,11 @@ class HealthBar(Component):
             self.health_comp.health / self.health_comp.max
         ) * self.graphics["border"].size.width
 
+        # the text is only rendered again when the health changes
         if "text" in self.graphics:
-            self.graphics["text"].text.set(f"{self.health_comp.health}/{self.health_comp.max}")
+            text = f"{self.health_comp.health}/{self.health_comp.max}"
+            if self.graphics["text"].text.get() != text:
+                self.graphics["text"].text.set(text)
 
         self.graphics.draw()
 
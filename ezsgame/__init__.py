@@ -3,7 +3,11 @@ from .window import *
 from .objects import *
 from .event_handler import *
 from .time_handler import *
+from .task_handler import *
 from .world import *
+from .collisions import *
+from .render_batch import draw_batched
+from .assets import AssetLoader
 
 # Secondary Resources
 from .sounds import *
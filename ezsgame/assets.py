@@ -0,0 +1,300 @@
+"""
+Module for loading assets in the background (Example: assets of a scene, see `Scene.assets`)
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from path import Path
+import pygame as pg
+
+from .graphics.frames import GifFrames
+from .graphics.image_cache import ImageCache, convert, get_surface_memory
+from .fonts import FontCache
+from .sounds import Sound, SoundCache
+
+# an image, GIF or sound path, or a font `(font file, size)`
+Asset = Path | str | Tuple[str, int]
+
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3", ".flac")
+
+
+def get_asset_kind(asset: Asset) -> str:
+    r"""
+    #### Returns the kind of an asset: `"image"`, `"gif"`, `"sound"` or `"font"`
+    """
+    if isinstance(asset, tuple):
+        return "font"
+
+    path = str(asset).lower()
+
+    if path.endswith(".gif"):
+        return "gif"
+
+    if path.endswith(SOUND_EXTENSIONS):
+        return "sound"
+
+    return "image"
+
+
+def _decode_sound(path: str) -> pg.mixer.Sound:
+    try:
+        return pg.mixer.Sound(path)
+    except (FileNotFoundError, pg.error):
+        raise ValueError("Sound not found:", path)
+
+
+def _decode_image(path: str) -> pg.Surface:
+    try:
+        return pg.image.load(path)
+    except (FileNotFoundError, pg.error):
+        raise ValueError("Image not found:", path)
+
+
+def _decode_gif(path: str) -> Tuple[Tuple[int, int], List[bytes]]:
+    from PIL import Image
+
+    try:
+        image = Image.open(path)
+    except FileNotFoundError:
+        raise ValueError("Image not found:", path)
+
+    frames = []
+    # same frames as `GifFrames`
+    for index in range(GifFrames.first_frame(image), getattr(image, "n_frames", 1)):
+        image.seek(index)
+        frames.append(image.convert("RGBA").tobytes())
+
+    return image.size, frames
+
+
+class AssetLoader:
+    r"""
+    #### Asset Loader
+    Decodes images, GIFs and sounds in background threads and adds them to the `ImageCache` (and `SoundCache`) in the main
+    thread (in `poll`, a few at a time so frames are not delayed), fonts are loaded into the `FontCache`.
+
+    #### Parameters
+    - `assets`: assets to load, image, GIF or sound paths and fonts as `(font file, size)`
+
+    Loaders share `workers` threads (default: `2`) and files are decoded in the order they were requested,
+    more threads load faster but take more time from the main loop.
+
+    #### Example
+    ```python
+    loader = AssetLoader(["player.png", "explosion.gif", ("fonts/pixel.ttf", 24)])
+
+    # every frame
+    loader.poll()
+    progress_bar.width = 200 * loader.progress
+
+    if loader.done:
+        ...
+    ```
+    """
+
+    workers: int = 2
+    _executor: Optional[ThreadPoolExecutor] = None  # shared by the loaders, created with the first loader
+
+    def __init__(self, assets: Iterable[Asset]):
+        self.assets: List[Asset] = list(dict.fromkeys(assets))
+        self.errors: List[Tuple[Asset, Exception]] = []
+        self.loaded = 0
+
+        # pygame.mixer has to be initialized in the main thread
+        if any(get_asset_kind(asset) == "sound" for asset in self.assets):
+            Sound.get_default_mixer()
+
+        if self.assets and AssetLoader._executor is None:
+            AssetLoader._executor = ThreadPoolExecutor(max_workers=AssetLoader.workers, thread_name_prefix="ezsgame-assets")
+
+        self._pending: List[Tuple[Asset, Optional[Future], Callable[[Any], None]]] = []
+
+        for asset in self.assets:
+            self._pending.append(self._submit(asset))
+
+    def _submit(self, asset: Asset) -> Tuple[Asset, Optional[Future], Callable[[Any], None]]:
+        kind = get_asset_kind(asset)
+
+        # fonts are small, they are loaded in the main thread
+        if kind == "font":
+            file, size = asset
+            return asset, None, lambda _: FontCache.get_font(file, size)
+
+        path = str(asset)
+
+        if kind == "gif":
+            return asset, self._executor.submit(_decode_gif, path), lambda gif: self._add_gif(path, *gif)
+
+        if kind == "sound":
+            return asset, self._executor.submit(_decode_sound, path), lambda sound: SoundCache.add(path, sound)
+
+        return asset, self._executor.submit(_decode_image, path), lambda surface: self._add_image(path, surface)
+
+    @staticmethod
+    def _add_image(path: str, surface: pg.Surface) -> None:
+        # same key as `ImageCache.load(path)`
+        ImageCache.add((path, None, (False, False), 0), convert(surface))
+
+    @staticmethod
+    def _add_gif(path: str, size: Tuple[int, int], frames: List[bytes]) -> None:
+        # same keys as `GifFrames.get_frame(index)`
+        key = GifFrames.cache_key(path)
+
+        for index, frame in enumerate(frames):
+            ImageCache.add((key, index, None), convert(pg.image.frombytes(frame, size, "RGBA")))
+
+    @property
+    def progress(self) -> float:
+        r"""
+        #### Loaded assets from `0` to `1`
+        """
+        return (self.loaded + len(self.errors)) / len(self.assets) if self.assets else 1.0
+
+    @property
+    def done(self) -> bool:
+        r"""
+        #### True when every asset is loaded (or failed to load)
+        """
+        return not self._pending
+
+    def poll(self, budget: float = 4) -> float:
+        r"""
+        #### Adds the decoded assets to the caches for up to `budget` milliseconds, returns the progress
+        Call it every frame (from the main thread) while the assets load. At least one decoded asset is added per call.
+        Assets that fail to load are in `errors`.
+        """
+        end = time.perf_counter() + budget / 1000
+        pending = []
+
+        for i, (asset, future, finish) in enumerate(self._pending):
+            if future is not None and not future.done():
+                pending.append((asset, future, finish))
+                continue
+
+            try:
+                finish(future.result() if future is not None else None)
+                self.loaded += 1
+            except Exception as error:
+                self.errors.append((asset, error))
+
+            if time.perf_counter() > end:
+                pending.extend(self._pending[i + 1 :])
+                break
+
+        self._pending = pending
+        return self.progress
+
+    def wait(self) -> None:
+        r"""
+        #### Blocks until every asset is loaded
+        """
+        wait([future for _, future, _ in self._pending if future is not None])
+        self.poll(budget=float("inf"))
+
+    def cancel(self) -> None:
+        r"""
+        #### Stops loading (assets that are already loaded stay in the caches)
+        """
+        for _, future, _ in self._pending:
+            if future is not None:
+                future.cancel()
+
+        self._pending.clear()
+
+    def __str__(self):
+        return f"<AssetLoader : {self.loaded}/{len(self.assets)} loaded, {len(self.errors)} errors>"
+
+
+class Assets:
+    r"""
+    - Counts the owners (Example: scenes) of the assets in the shared caches (`ImageCache`, `FontCache`, `SoundCache`)
+
+    Assets are unloaded from the caches when their last owner releases them. Objects that still use an unloaded
+    surface keep it, the caches just don't hold it anymore.
+    """
+
+    owners: Dict[Asset, Set[Hashable]] = {}  # {asset: owners}
+
+    def acquire(owner: Hashable, assets: Iterable[Asset]) -> None:
+        r"""
+        #### Adds `owner` to the owners of `assets`
+        """
+        for asset in assets:
+            Assets.owners.setdefault(asset, set()).add(owner)
+
+    def release(owner: Hashable, assets: Optional[Iterable[Asset]] = None) -> List[Asset]:
+        r"""
+        #### Removes `owner` from the owners of `assets` (default: every asset of `owner`), returns the assets that were unloaded
+        """
+        if assets is None:
+            assets = [asset for asset, owners in Assets.owners.items() if owner in owners]
+
+        unloaded = []
+        for asset in assets:
+            owners = Assets.owners.get(asset)
+
+            if owners is None:
+                continue
+
+            owners.discard(owner)
+
+            if not owners:
+                del Assets.owners[asset]
+                Assets.unload(asset)
+                unloaded.append(asset)
+
+        return unloaded
+
+    def _get_cache_keys(asset: Asset) -> List[Hashable]:
+        # keys of the surfaces made from an asset (transformed images, scaled frames, rendered texts)
+        kind = get_asset_kind(asset)
+
+        if kind == "font":
+            return [key for key in ImageCache.surfaces if isinstance(key, tuple) and key[0] == "text" and key[1][:2] == asset]
+
+        prefix = GifFrames.cache_key(asset) if kind == "gif" else str(asset)
+        return [key for key in ImageCache.surfaces if isinstance(key, tuple) and key[0] == prefix]
+
+    def unload(asset: Asset) -> None:
+        r"""
+        #### Drops an asset (and the surfaces made from it) from the caches
+        """
+        kind = get_asset_kind(asset)
+
+        if kind == "sound":
+            SoundCache.remove(asset)
+            return
+
+        if kind == "font":
+            for key in [key for key in FontCache.fonts if key[:2] == asset]:
+                del FontCache.fonts[key]
+
+        for key in Assets._get_cache_keys(asset):
+            ImageCache.remove(key)
+
+    def is_loaded(asset: Asset) -> bool:
+        r"""
+        #### Returns True if the asset is in the caches
+        """
+        kind = get_asset_kind(asset)
+
+        if kind == "sound":
+            return SoundCache.get(asset) is not None
+
+        if kind == "font":
+            return any(key[:2] == asset for key in FontCache.fonts)
+
+        if kind == "gif":
+            return (GifFrames.cache_key(asset), 0, None) in ImageCache.surfaces
+
+        return (str(asset), None, (False, False), 0) in ImageCache.surfaces
+
+    def get_memory(asset: Asset) -> int:
+        r"""
+        #### Returns the memory (in bytes) used by an asset in the caches (surfaces made from it included, fonts not included)
+        """
+        if get_asset_kind(asset) == "sound":
+            return SoundCache.get_memory(asset)
+
+        return sum(get_surface_memory(ImageCache.surfaces[key]) for key in Assets._get_cache_keys(asset))
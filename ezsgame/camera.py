@@ -1,12 +1,27 @@
 import pygame
 from abc import ABC, abstractmethod
-from .world import get_window
+from .world import World, get_window
 
 Vector2 = pygame.math.Vector2
 
 class Camera:
+    r"""
+    #### Camera
+    Moves the world view, objects are drawn at `pos - camera.offset` while the camera is active.
+
+    #### Parameters
+    - `object`: object followed by the camera
+    - `scrollmethod`: `Follow`, `Border`, `Auto` or a `CamScroll` (Optional)
+
+    #### Example
+    ```python
+    camera = Camera(player, Follow)
+    camera.activate()  # scrolls every frame, objects outside of the camera view are not drawn
+    ```
+    """
     def __init__(self, object, scrollmethod=None):
         self.object = object
+        self.method = None
         self.offset = Vector2(0, 0)
         self.width, self.height = get_window().size
         self.CONST = Vector2(-self.width / 2 + object.size[0] / 2, -self.object.size[1] + 20)
@@ -23,6 +38,30 @@ class Camera:
     def scroll(self):
         self.method.scroll()
 
+    def activate(self):
+        r"""
+        #### Makes this camera the active camera, the camera is updated every frame by the window
+        """
+        World.camera = self
+        self.update()
+
+    def deactivate(self):
+        r"""
+        #### Stops using this camera, the world view goes back to `(0, 0)`
+        """
+        if World.camera is self:
+            World.camera = None
+            World.pos.x, World.pos.y = 0, 0
+
+    def update(self):
+        r"""
+        #### Scrolls the camera (if it has a scroll method) and moves the world view to the camera offset
+        """
+        if self.method:
+            self.scroll()
+
+        World.pos.x, World.pos.y = self.offset.x, self.offset.y
+
 class CamScroll(ABC):
     def __call__(self, camera):
         self.camera = camera
@@ -46,13 +85,12 @@ class Follow(CamScroll):
 
 class Border(CamScroll):
     def __init__(self, camera=None, borders=[]):
+        CamScroll.__init__(self, camera)
         self.borders = borders
         
         if not borders:
             self.borders = [self.object.pos.x, self.object.pos.x + self.object.size.width, self.object.pos.y, self.object.pos.y + self.object.size.height]
         
-        CamScroll.__init__(self, camera)
-        
     def scroll(self):
         self.camera.offset.x += (self.object.pos.x - self.camera.offset.x + self.camera.CONST.x)
         self.camera.offset.y += (self.object.pos.y - self.camera.offset.y + self.camera.CONST.y)
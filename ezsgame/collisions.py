@@ -0,0 +1,109 @@
+from typing import Any, Callable, Dict, List, Tuple
+from operator import itemgetter
+
+from .spatial import Bounds, get_bounds
+
+
+def overlaps(a: Bounds, b: Bounds) -> bool:
+    r"""
+    #### Returns True if two bounds `(x, y, width, height)` overlap (touching borders count as overlapping)
+    """
+    return (
+        a[0] <= b[0] + b[2]
+        and b[0] <= a[0] + a[2]
+        and a[1] <= b[1] + b[3]
+        and b[1] <= a[1] + a[3]
+    )
+
+
+class CollisionWorld:
+    r"""
+    - Finds the colliding objects once per frame (sweep and prune), instead of checking every object against every other object
+
+    Objects are added with a callback (Example: `HitBox.on_collision.trigger`) that is called with the other object
+    every frame the two objects are colliding.
+    """
+
+    bodies: Dict[Any, Callable] = {}
+    pairs: List[Tuple[Any, Any]] = []  # colliding pairs found in the last check
+    _suspended: Dict[Any, Callable] = {}  # bodies of objects removed from the world, back when they are added again
+
+    def add(obj, callback: Callable):
+        r"""
+        #### Adds an object to the collision world
+        - `obj` : object to check collisions for
+        - `callback` : function to be called with the other object when `obj` collides
+        """
+        CollisionWorld.bodies[obj] = callback
+
+    def remove(obj):
+        r"""
+        #### Removes an object from the collision world
+        - `obj` : object to be removed
+        """
+        CollisionWorld.bodies.pop(obj, None)
+        CollisionWorld._suspended.pop(obj, None)
+
+    def suspend(obj):
+        r"""
+        #### Stops checking the collisions of an object until `resume` (Example: an object removed from the world)
+        """
+        callback = CollisionWorld.bodies.pop(obj, None)
+
+        if callback is not None:
+            CollisionWorld._suspended[obj] = callback
+
+    def resume(obj):
+        r"""
+        #### Checks the collisions of a suspended object again
+        """
+        callback = CollisionWorld._suspended.pop(obj, None)
+
+        if callback is not None:
+            CollisionWorld.bodies[obj] = callback
+
+    def find_pairs() -> List[Tuple[Any, Any]]:
+        r"""
+        #### Returns the pairs of objects in the collision world that are colliding
+        """
+        # boxes sorted by their left side: (left, right, top, bottom, object)
+        boxes = []
+        for obj in CollisionWorld.bodies:
+            x, y, w, h = get_bounds(obj)
+            boxes.append((x, x + w, y, y + h, obj))
+
+        boxes.sort(key=itemgetter(0))
+
+        pairs = []
+        active = []  # boxes that can still overlap the next boxes in the x axis
+
+        for box in boxes:
+            left, _, top, bottom, obj = box
+
+            # drop boxes that end before this one starts
+            active = [other for other in active if other[1] >= left]
+
+            for other in active:
+                if other[2] <= bottom and top <= other[3]:
+                    pairs.append((other[4], obj))
+
+            active.append(box)
+
+        return pairs
+
+    def check():
+        r"""
+        #### Finds the colliding objects and calls their callbacks
+        """
+        if not CollisionWorld.bodies:
+            return
+
+        CollisionWorld.pairs = CollisionWorld.find_pairs()
+
+        for a, b in CollisionWorld.pairs:
+            # objects can be removed by a callback
+            if a in CollisionWorld.bodies:
+                CollisionWorld.bodies[a](b)
+
+            if b in CollisionWorld.bodies:
+                CollisionWorld.bodies[b](a)
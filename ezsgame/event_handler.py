@@ -1,7 +1,9 @@
-from typing import Iterable, List, Callable
+from typing import Any, Dict, Iterable, List, Callable, Set, Tuple
 import pygame as pg
 from .world import World
 from .objects import Object
+from .spatial import SpatialGrid
+from .task_handler import TaskHandler
 
 
 def to_pgkey(key: str) -> int:
@@ -23,7 +25,7 @@ class Event:
     def __init__(self, event_type, event_name, callback: Callable, object: Object = None, name: str = "Default", **kwargs):
         self.type = event_type
         self.event_name = event_name
-        self.callback = callback
+        self.callback = TaskHandler.wrap(callback)  # `async def` callbacks run as tasks
         self.object = object
         self.name = name
 
@@ -39,12 +41,176 @@ class Event:
         except Exception as e:
             self.callback()
 
+# mouse button each `MOUSEBUTTONDOWN` event name listens to
+_MOUSE_BUTTONS = {
+    "click": 1,
+    "mousedown": 1,
+    "leftclick": 1,
+    "rightclick": 3,
+    "mousewheelup": 4,
+    "mousewheeldown": 5,
+}
+
 class EventList(list):    
+    """
+    List of events that also keeps a dispatch table, so the listeners of a window event can be found
+    without scanning every event in the list.
+
+    The dispatch table is keyed by `(event type, key/button)`, where the key/button is `None` for events
+    that don't filter by a key or button. It's kept up to date by `add`, `remove` and `replace`.
+
+    Objects of event listeners are kept in a `SpatialGrid`, so only the objects under the mouse are hit-tested.
+    The objects update the grid when they move, in place too (Example: `obj.pos.x += 5`, see `Object.observe_geometry`),
+    and the candidates are tested against their current bounds.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._dispatch: Dict[Tuple[Any, Any], List[Event]] = {}
+
+        self.hit_grid = SpatialGrid()
+        self._targets: Dict[Any, Tuple[int, int]] = {}  # {object: (number of events, order)}
+        self._unindexed_targets: Set[Any] = set()  # objects that can't be in the grid (no `_grids`)
+        self._targets_count = 0
+
+        for event in self:
+            self._index(event)
+
+    @staticmethod
+    def _dispatch_key(event: Event) -> Tuple[Any, Any]:
+        if event.type == pg.MOUSEBUTTONDOWN:
+            return (event.type, _MOUSE_BUTTONS.get(event.event_name))
+
+        return (event.type, event.__dict__.get("key"))
+
+    def _index(self, event: Event) -> None:
+        self._dispatch.setdefault(self._dispatch_key(event), []).append(event)
+
+        if event.object is not None:
+            self._add_target(event.object)
+
+    def _unindex(self, event: Event) -> None:
+        key = self._dispatch_key(event)
+        bucket = self._dispatch.get(key, [])
+
+        for i, e in enumerate(bucket):
+            if e is event:
+                del bucket[i]
+                break
+
+        if not bucket:
+            self._dispatch.pop(key, None)
+
+        if event.object is not None:
+            self._remove_target(event.object)
+
+    def _add_target(self, obj) -> None:
+        refs, order = self._targets.get(obj, (0, self._targets_count))
+        self._targets[obj] = (refs + 1, order)
+
+        if refs:
+            return
+
+        self._targets_count += 1
+
+        if hasattr(obj, "_grids"):
+            self.hit_grid.insert(obj)
+            obj._grids.append(self.hit_grid)
+        else:
+            self._unindexed_targets.add(obj)
+
+    def _remove_target(self, obj) -> None:
+        refs, order = self._targets.get(obj, (1, 0))
+
+        if refs > 1:
+            self._targets[obj] = (refs - 1, order)
+            return
+
+        self._targets.pop(obj, None)
+
+        if obj in self.hit_grid:
+            self.hit_grid.remove(obj)
+            obj._grids.remove(self.hit_grid)
+        else:
+            self._unindexed_targets.discard(obj)
+
+    def _suspend_target(self, obj) -> None:
+        # the object was removed from the world, its events are kept but it can't be hovered
+        if obj in self._targets and obj in self.hit_grid:
+            self.hit_grid.remove(obj)
+            obj._grids.remove(self.hit_grid)
+
+    def _resume_target(self, obj) -> None:
+        if obj in self._targets and obj not in self.hit_grid and hasattr(obj, "_grids"):
+            self.hit_grid.insert(obj)
+            obj._grids.append(self.hit_grid)
+
+    def get_hovered(self, mouse_pos) -> List[Any]:
+        """
+        #### Returns the objects of event listeners that are under `mouse_pos`
+        - `mouse_pos` : mouse position in the window `[x, y]`
+        """
+        x, y = mouse_pos
+        view_x, view_y = World.pos
+
+        if view_x or view_y:
+            # objects are hit-tested in world positions, except the fixed ones
+            hovered = [obj for obj in self.hit_grid.query_point(x + view_x, y + view_y) if not obj.styles.fixed]
+            hovered += [obj for obj in self.hit_grid.query_point(x, y) if obj.styles.fixed]
+
+        else:
+            hovered = self.hit_grid.query_point(x, y)
+
+        for obj in self._unindexed_targets:
+            if EventHandler.is_hovering(obj):
+                hovered.append(obj)
+
+        return hovered
+
+    def get_topmost(self, objects: Iterable[Any]) -> Any:
+        """
+        #### Returns the visible object with the highest `z_index`, between objects with the same `z_index`
+        the one that started listening last (drawn on top) is returned
+        """
+        top, top_key = None, None
+
+        for obj in objects:
+            styles = getattr(obj, "styles", None)
+            if styles and not styles.visible:
+                continue
+
+            key = (styles.z_index if styles else 0, self._targets[obj][1])
+            if top_key is None or key > top_key:
+                top, top_key = obj, key
+
+        return top
 
     def get_by_type(self, event_type) -> List[Event]:
-        return [event for event in self if event.type == event_type]
+        return [
+            event
+            for (type, _), bucket in self._dispatch.items()
+            if type == event_type
+            for event in bucket
+        ]
+
+    def get_listeners(self, ev: pg.event.Event) -> List[Event]:
+        """
+        #### Returns the events that listen to the window event `ev`
+        - `ev` : pygame event
+        """
+        # mouse buttons events only listen to one button
+        if ev.type == pg.MOUSEBUTTONDOWN:
+            return self._dispatch.get((ev.type, ev.button), [])
+
+        listeners = self._dispatch.get((ev.type, None), [])
+
+        # key events listen to one key or to any key
+        if ev.type in (pg.KEYDOWN, pg.KEYUP):
+            keyed = self._dispatch.get((ev.type, ev.key))
+            if keyed:
+                return [*keyed, *listeners]
+
+        return listeners
 
     def get_by_name(self, event_name) -> Event:
         lst = [event for event in self if event.event_name == event_name]
@@ -53,13 +219,15 @@ class EventList(list):
     def replace(self, name: str, new_event: Event) -> None:
         for i, event in enumerate(self):
             if event.name == name:
+                self._unindex(event)
                 self[i] = new_event
+                self._index(new_event)
 
     def remove(self, *names) -> None:
         for name in names:
-            for i, event in enumerate(self):
-                if event.name == name:
-                    del self[i]
+            for event in [event for event in self if event.name == name]:
+                super().remove(event)
+                self._unindex(event)
 
     def add(self, event: Event):
         # if event already exists, replace it
@@ -69,6 +237,7 @@ class EventList(list):
         # otherwise, add it
         else:
             self.append(event)
+            self._index(event)
 
 
 class EventHandler:
@@ -93,15 +262,13 @@ class EventHandler:
         # removes events
         for name in EventHandler.to_remove:
 
-            for event in EventHandler.events:
-                if event.name == name:
-                    EventHandler.events.remove(event)
-                    break
+            if any(event.name == name for event in EventHandler.events):
+                EventHandler.events.remove(name)
 
             # if is ezsgame event
             else:
                 # removes event from on_update signal listeners so they won't be called anymore
-                if name in World.on_update.listeners.values():
+                if name in World.on_update.listeners:
                     World.on_update.remove(name)
 
         EventHandler.to_remove.clear()
@@ -124,13 +291,17 @@ class EventHandler:
 
         EventHandler.to_add.clear()
 
+        # objects under the mouse, mouse position is the same for every event in this check
+        hovered = None
+        target = None
+
         # EVENT MANAGEMENT -------------------------------------------------------------------------------------------
         for ev in events:
             # ev : event to process
 
             # quit event (cannot be event listener)
             if ev.type == pg.QUIT:
-                for event in EventHandler.events.get_by_type(pg.QUIT):
+                for event in EventHandler.events.get_listeners(ev):
                     event.callback()
 
                 World.window.quit()
@@ -148,84 +319,44 @@ class EventHandler:
                 event(**event_args)
 
             #  EVENT LOOP (managing events)
-            for event in EventHandler.events.get_by_type(ev.type):
+            # only the events listening to this key/button are visited, see `EventList.get_listeners`
+            for event in EventHandler.events.get_listeners(ev):
 
                 # if is event listener (uses a object)
                 is_event_listener = event.object is not None
                 is_hovering = False
 
                 if is_event_listener:
-                    is_hovering = EventHandler.is_hovering(event.object)
+                    if hovered is None:
+                        hovered = set(EventHandler.events.get_hovered(pg.mouse.get_pos()))
+                        target = EventHandler.events.get_topmost(hovered)
+
+                    is_hovering = event.object in hovered
 
                     # if is not hovering and event is not unhover then skip
                     if not is_hovering and not event.event_name == "unhover":
                         continue
 
-                # function to reduce code, function decides whaterver callback should called or not
-                def callback():
-                    if is_event_listener:
-                        # events that require be hovering
-                        if is_hovering and event.object.styles.visible:
-                            event.callback()
-
-                    # if is not event listener is base event, just call callback
-                    else:
-                        event.callback()
-
-                # mouse events
-                if ev.type == pg.MOUSEBUTTONDOWN:
-                    # mouse wheel up
-                    if event.event_name == "mousewheelup" and ev.button == 4:
-                        callback()
+                    # clicks only reach the topmost object under the mouse
+                    if ev.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP) and event.object is not target:
                         continue
 
-                        # mouse wheel down
-                    elif event.event_name == "mousewheeldown" and ev.button == 5:
-                        callback()
-                        continue
-                
-                    # right mouse button
-                    elif event.event_name == "rightclick" and ev.button == 3:
-                        callback()
-                        continue
-                            
-                    # click, mousedown or leftclick
-                    elif event.event_name in ("click", "mousedown", "leftclick") and ev.button == 1:
-                        callback()
-                        continue
-                    
-
                 # hover events
-                elif ev.type == pg.MOUSEMOTION:
-                    if event.event_name == "unhover":
-                        if not is_hovering:
-                            event.callback()
-                            continue
-
-                    else:
-                        callback()
-                        continue
+                if ev.type == pg.MOUSEMOTION and event.event_name == "unhover":
+                    if not is_hovering:
+                        event.callback()
 
                 # mouse up events
                 elif ev.type == pg.MOUSEBUTTONUP:
-                    if event.event_name == "mouseup" or event.type == pg.MOUSEBUTTONUP:
-                        event.callback()
-
-                    else:
-                        callback()
-
-                elif "key" in event:
-                    if event.key == ev.key:
-                        event(key=ev.key, unicode=ev.unicode)
-                        continue
+                    event.callback()
 
-                # base on key event keydown or keyapp
-                elif event.type in (pg.KEYDOWN, pg.KEYUP):
+                # key events, keydown or keyup
+                elif ev.type in (pg.KEYDOWN, pg.KEYUP):
                     event(key=ev.key, unicode=ev.unicode)
 
-                # any event that matchess current window event
-                else:
-                    callback()
+                # any event that matchess current window event (event listeners must be visible)
+                elif not is_event_listener or event.object.styles.visible:
+                    event.callback()
 
     def add_event(event: str, object: Object, callback, name: str = "Default"):
         '''
@@ -257,7 +388,9 @@ class EventHandler:
         #### Checks if the mouse is hovering over the object
         - `object` : object to check if the mouse is hovering over it
         '''
-        mouse_pos = pg.mouse.get_pos()
+        offset_x, offset_y = World.get_offset(object)
+        mouse_x, mouse_y = pg.mouse.get_pos()
+        mouse_pos = (mouse_x + offset_x, mouse_y + offset_y)
         box = object._get_collision_box()
 
         if mouse_pos[0] > box[0][0] and mouse_pos[0] < box[1][0]:
@@ -1,39 +1,169 @@
 import pygame as pg, os
+from typing import Dict, Tuple
 
-FONTS_PATH = "ezsgame/assets/fonts"
+from .graphics.image_cache import ImageCache
+
+FONTS_PATH = os.path.join(os.path.dirname(__file__), "assets", "fonts")
 
 class FontFamily:
     def __init__(self, folder_name:str, main_font:str, is_variation:bool = False):
         
         """
         if is_variation is True then main_font is the file name of the font, not just the name of the font
+
+        The font files of a family are found the first time the family is used (not on import)
         """
+        self.folder_name = folder_name
+        self.main_font = main_font
+        self._variations = None
+
         # is variation font
         if is_variation:
-            self.font_file = f"{FONTS_PATH}/{folder_name}/{main_font}"
-        
-        
-        # if font family  get main font and variations
+            self._font_file = f"{FONTS_PATH}/{folder_name}/{main_font}"
+            self._variations = {}
+
         else:
+            self._font_file = None
 
-            # get variations                
-            for filename in os.listdir(FONTS_PATH + "/" + folder_name):
-                
-                if filename.endswith(".ttf"):
-                    
-                    font_name = filename.replace(f"{folder_name}-", "")
-                    font_name = font_name.replace(".ttf", "")
-                    
-                     # set main font
-                    if font_name == main_font:
-                        self.font_file = f"{FONTS_PATH}/{folder_name}/{filename}"
-                        continue            
-
-                    # set variations
-                    setattr(self, font_name.lower(), FontFamily(folder_name, filename, True))
+    def _discover(self):
+        self._variations = {}
+
+        # get variations                
+        for filename in os.listdir(FONTS_PATH + "/" + self.folder_name):
             
-    def get_font(self, font_size) -> pg.font.Font:
-        return pg.font.Font(self.font_file, font_size)
+            if filename.endswith(".ttf"):
+                
+                font_name = filename.replace(f"{self.folder_name}-", "")
+                font_name = font_name.replace(".ttf", "")
+                
+                 # set main font
+                if font_name == self.main_font:
+                    self._font_file = f"{FONTS_PATH}/{self.folder_name}/{filename}"
+                    continue            
+
+                # set variations
+                self._variations[font_name.lower()] = FontFamily(self.folder_name, filename, True)
+
+    @property
+    def font_file(self) -> str:
+        if self._variations is None:
+            self._discover()
+
+        return self._font_file
+
+    def __getattr__(self, name: str) -> "FontFamily":
+        # variations (Example: `Fonts.OpenSans.bold`)
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._variations is None:
+            self._discover()
+
+        try:
+            return self._variations[name]
+        except KeyError:
+            raise AttributeError(f"Font family {self.folder_name} has no variation {name}")
+
+    def get_font(self, font_size, bold: bool = False, italic: bool = False) -> pg.font.Font:
+        return FontCache.get_font(self.font_file, font_size, bold, italic)
+
+
+FontKey = Tuple[str, int, bool, bool]  # (font file or system font name, size, bold, italic)
+
+
+class FontCache:
+    """
+    - Opens every font once, fonts are cached by `(font file, size, bold, italic)`
+    - Rendered texts are cached in the `ImageCache` by `(font, text, color, antialias)` (LRU)
+    - Glyphs mode (`render_glyphs`): texts are made of cached glyphs (one surface per character), for texts that
+    change all the time (Example: scores or FPS counters)
+    """
+
+    fonts: Dict[FontKey, pg.font.Font] = {}
+    glyphs: Dict[Tuple[FontKey, Tuple, bool], Dict[str, Tuple[pg.Surface, int]]] = {}  # {(font, color, antialias): {char: (glyph, width)}}
+
+    def get_font(file: str, size: int, bold: bool = False, italic: bool = False) -> pg.font.Font:
+        """
+        #### Returns the font (opened only the first time)
+        - `file` : path to a font file or name of a system font
+        - `size` : font size
+
+        Raises `ValueError` if the font file doesn't exist or the name is not a system font
+        """
+        key = (file, size, bold, italic)
+        font = FontCache.fonts.get(key)
+
+        if font is None:
+            # pygame.font is initialized when the first font is used
+            if not pg.font.get_init():
+                pg.font.init()
+
+            if os.path.isfile(file):
+                font = pg.font.Font(file, size)
+                font.bold, font.italic = bold, italic
+
+            # a path to a font file that doesn't exist
+            elif file.endswith(".ttf"):
+                raise ValueError(f"Font file not found: {file}")
+
+            elif file in pg.font.get_fonts():
+                font = pg.font.SysFont(file, size, bold, italic)
+
+            else:
+                raise ValueError("Invalid font name or path: " + file)
+
+            FontCache.fonts[key] = font
+
+        return font
+
+    def render(font: FontKey, text: str, color, antialias: bool = True) -> pg.Surface:
+        """
+        #### Returns the text rendered with the font `(font file, size, bold, italic)`, texts are rendered once and cached
+        """
+        key = ("text", font, text, tuple(color), antialias)
+        surface = ImageCache.get(key)
+
+        if surface is None:
+            surface = FontCache.get_font(*font).render(text, antialias, color)
+            ImageCache.add(key, surface)
+
+        return surface
+
+    def render_glyphs(font: FontKey, text: str, color, antialias: bool = True) -> pg.Surface:
+        """
+        #### Returns the text made of cached glyphs, faster than `render` for texts that are always different
+        Note: kerning between characters is not applied
+        """
+        key = (font, tuple(color), antialias)
+        glyphs = FontCache.glyphs.get(key)
+
+        if glyphs is None:
+            glyphs = FontCache.glyphs[key] = {}
+
+        # glyphs don't overlap, their pixels are copied as they are (a normal blit would blend the antialiased edges)
+        blits = []
+        x = 0
+
+        for char in text:
+            glyph = glyphs.get(char)
+
+            if glyph is None:
+                surface = FontCache.get_font(*font).render(char, antialias, color)
+                glyph = glyphs[char] = (surface, surface.get_width())
+
+            blits.append((glyph[0], (x, 0), None, pg.BLEND_RGBA_MAX))
+            x += glyph[1]
+
+        surface = pg.Surface((x, FontCache.get_font(*font).get_height()), pg.SRCALPHA)
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def clear() -> None:
+        """
+        #### Closes every cached font and drops the glyphs (rendered texts are dropped with `ImageCache.clear`)
+        """
+        FontCache.fonts.clear()
+        FontCache.glyphs.clear()
     
 
 # default fonts  
@@ -1,7 +1,9 @@
 from typing import List
 
 from ezsgame.types import Pos
-from .world import get_window
+from .world import World, get_window
+from .spatial import get_bounds
+from .collisions import overlaps
 import pygame as pg
 
 def outline(obj, color="red", stroke:int=1, size:int=1.5, border_radius:list = [0,0,0,0]):
@@ -49,12 +51,8 @@ def is_colliding(obj1, obj2, draw_collision_box=False):
         outline(obj1, size=1.1, stroke=2)
         outline(obj2, size=1.1, stroke=2)
 
-    for i in obj1._get_collision_box():    
-        if (i[0] >= obj2.pos[0] and i[0] <= obj2.pos[0]+obj2.size[0]) and (i[1] >= obj2.pos[1] and i[1] <= obj2.pos[1] + obj2.size[1]):
-            return True
-                
-        
-    return False
+    # compares the boxes, not only the corners (corners miss cross shaped overlaps)
+    return overlaps(get_bounds(obj1), get_bounds(obj2))
         
         
 def div(axis : str, q : int, size : float = None) -> List[List[float]]:
@@ -122,7 +120,9 @@ def is_hovering(obj):
 
     box = obj._get_collision_box()
     
-    mouse_pos = pg.mouse.get_pos()
+    offset_x, offset_y = World.get_offset(obj)
+    mouse_x, mouse_y = pg.mouse.get_pos()
+    mouse_pos = (mouse_x + offset_x, mouse_y + offset_y)
     
     if mouse_pos[0] >= box[0][0] and mouse_pos[0] <= box[1][0] and mouse_pos[1] >= box[0][1] and mouse_pos[1] <= box[1][1]:
         return True
@@ -1,2 +1,7 @@
 from .sprites import *
-from .image import Image
\ No newline at end of file
+from .image import Image
+from .image_cache import ImageCache
+from .atlas import TextureAtlas
+from .layer import Layer
+from .frames import FrameSource, GifFrames, SpriteSheet
+from .tiles import Tileset, TileMap
@@ -0,0 +1,238 @@
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+from path import Path
+import pygame as pg
+
+from .image_cache import ImageCache, convert
+
+Region = Tuple[int, pg.Rect]  # (page, area in the page)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tga", ".webp")
+
+
+class TextureAtlas:
+    r"""
+    #### Texture Atlas
+    Many images packed in one or a few large surfaces (pages), images are drawn with area blits from the pages.
+
+    #### Parameters
+    - `pages`: surfaces with the packed images
+    - `regions`: `{name: (page index, area)}` where every image is in the pages
+    - `name`: name of the atlas, used in the cache keys of transformed images (Optional)
+
+    #### Notes
+    - The atlas makes the start faster (a file and a convert per page instead of per image, see `from_directory` with a `cache`).
+    - Drawing is not faster: an area blit from a page costs about the same as a blit of a small surface (one by one or batched
+    by `draw_batched`, a `Surface.blits` with the areas). Use an atlas for the start time, not the frame time.
+
+    #### Example
+    ```python
+    atlas = TextureAtlas.from_directory("sprites/", cache="build/sprites_atlas.json")
+    player = Image("player/idle.png", Pos(10, 10), Size(32, 32), atlas=atlas)
+    ```
+    """
+
+    __slots__ = ("pages", "regions", "name")
+
+    def __init__(self, pages: List[pg.Surface], regions: Dict[str, Region], name: str = "atlas"):
+        self.pages = pages
+        self.regions = regions
+        self.name = name
+
+    @classmethod
+    def build(
+        cls,
+        images: Dict[str, pg.Surface],
+        max_size: int = 2048,
+        padding: int = 1,
+        name: str = "atlas",
+    ) -> "TextureAtlas":
+        r"""
+        #### Packs images into pages of at most `max_size` x `max_size` pixels
+        - `images`: `{name: surface}` images to pack
+        - `max_size`: max width and height of the pages (default: `2048`)
+        - `padding`: empty pixels between the images (default: `1`)
+
+        Images are packed in rows (shelves) from the tallest to the shortest.
+        Raises `ValueError` if an image is bigger than `max_size`
+        """
+        placed: List[Tuple[str, int, int, int]] = []  # (name, page, x, y)
+        page_sizes: List[List[int]] = [[0, 0]]
+        x = y = shelf_height = 0
+
+        for image_name in sorted(images, key=lambda n: images[n].get_height(), reverse=True):
+            width, height = images[image_name].get_size()
+
+            if width > max_size or height > max_size:
+                raise ValueError(f"Image {image_name} ({width}x{height}) doesn't fit in a {max_size}x{max_size} atlas page")
+
+            # next shelf
+            if x + width > max_size:
+                x, y = 0, y + shelf_height + padding
+                shelf_height = 0
+
+            # next page
+            if y + height > max_size:
+                page_sizes.append([0, 0])
+                x = y = shelf_height = 0
+
+            placed.append((image_name, len(page_sizes) - 1, x, y))
+
+            page_size = page_sizes[-1]
+            page_size[0] = max(page_size[0], x + width)
+            page_size[1] = max(page_size[1], y + height)
+
+            x += width + padding
+            shelf_height = max(shelf_height, height)
+
+        pages = [pg.Surface((max(w, 1), max(h, 1)), pg.SRCALPHA) for w, h in page_sizes]
+        regions: Dict[str, Region] = {}
+
+        for image_name, page, x, y in placed:
+            surface = images[image_name]
+            pages[page].blit(surface, (x, y))
+            regions[image_name] = (page, pg.Rect(x, y, *surface.get_size()))
+
+        return cls([convert(page) for page in pages], regions, name)
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path | str,
+        cache: Optional[Path | str] = None,
+        max_size: int = 2048,
+        padding: int = 1,
+    ) -> "TextureAtlas":
+        r"""
+        #### Packs every image in a directory (and its subdirectories)
+        - `directory`: directory with the images, images are named by their path relative to it (Example: `"player/idle.png"`)
+        - `cache`: path of the atlas file (`.json`), the atlas is loaded from it if it's newer than every image,
+          otherwise it's packed again and saved there (Optional)
+        - `max_size`, `padding`: see `TextureAtlas.build`
+        """
+        files: Dict[str, str] = {}
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    path = os.path.join(root, filename)
+                    files[os.path.relpath(path, directory).replace(os.sep, "/")] = path
+
+        if cache and os.path.exists(cache):
+            cache_time = os.path.getmtime(cache)
+
+            if all(os.path.getmtime(path) <= cache_time for path in files.values()):
+                atlas = cls.load(cache)
+                if set(atlas.regions) == set(files):
+                    return atlas
+
+        atlas = cls.build(
+            {name: pg.image.load(path) for name, path in files.items()},
+            max_size,
+            padding,
+            name=str(directory),
+        )
+
+        if cache:
+            atlas.save(cache)
+
+        return atlas
+
+    def save(self, path: Path | str) -> None:
+        r"""
+        #### Saves the atlas, the regions in `path` (`.json`) and the pages next to it (`<name>_<page>.png`)
+        """
+        base, _ = os.path.splitext(path)
+        pages = [f"{os.path.basename(base)}_{i}.png" for i in range(len(self.pages))]
+
+        for page, filename in zip(self.pages, pages):
+            pg.image.save(page, os.path.join(os.path.dirname(path), filename))
+
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "name": self.name,
+                    "pages": pages,
+                    "regions": {name: [page, *area] for name, (page, area) in self.regions.items()},
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: Path | str) -> "TextureAtlas":
+        r"""
+        #### Loads an atlas saved with `save`
+        """
+        with open(path) as file:
+            data = json.load(file)
+
+        folder = os.path.dirname(path)
+        pages = [convert(pg.image.load(os.path.join(folder, filename))) for filename in data["pages"]]
+        regions = {name: (page, pg.Rect(x, y, w, h)) for name, (page, x, y, w, h) in data["regions"].items()}
+
+        return cls(pages, regions, data.get("name", "atlas"))
+
+    def get(self, name: str) -> Tuple[pg.Surface, pg.Rect]:
+        r"""
+        #### Returns the page and the area of an image, to draw it with `surface.blit(page, pos, area)`
+        Raises `ValueError` if the image is not in the atlas
+        """
+        try:
+            page, area = self.regions[name]
+        except KeyError:
+            raise ValueError("Image not found in atlas:", name)
+
+        return self.pages[page], area
+
+    def get_surface(self, name: str) -> pg.Surface:
+        r"""
+        #### Returns an image of the atlas as a surface (shares the pixels with the atlas page)
+        """
+        page, area = self.get(name)
+        return page.subsurface(area)
+
+    def load_image(
+        self,
+        name: str,
+        size: Optional[Iterable[int]] = None,
+        flip: Tuple[bool, bool] = (False, False),
+        rotation: float = 0,
+    ) -> Tuple[pg.Surface, Optional[pg.Rect]]:
+        r"""
+        #### Returns the surface and the area to draw an image of the atlas (same arguments as `ImageCache.load`)
+        Images that keep their size and are not flipped or rotated are drawn from the atlas page,
+        transformed images are made once and cached in the `ImageCache` (area is `None`).
+        """
+        page, area = self.get(name)
+        size = (int(size[0]), int(size[1])) if size is not None else area.size
+        flip = (bool(flip[0]), bool(flip[1]))
+        rotation %= 360
+
+        if size == area.size and flip == (False, False) and not rotation:
+            return page, area
+
+        key = ("atlas", self.name, name, size, flip, rotation)
+        surface = ImageCache.get(key)
+
+        if surface is None:
+            surface = self.get_surface(name)
+
+            if size != area.size:
+                surface = pg.transform.scale(surface, size)
+            if flip != (False, False):
+                surface = pg.transform.flip(surface, *flip)
+            if rotation:
+                surface = pg.transform.rotate(surface, rotation)
+
+            ImageCache.add(key, surface)
+
+        return surface, None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.regions
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def __str__(self):
+        return f"<TextureAtlas : {self.name}, {len(self)} images in {len(self.pages)} pages>"
@@ -0,0 +1,198 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+from path import Path
+import pygame as pg
+
+from .image_cache import ImageCache, convert
+
+FrameSize = Optional[Tuple[int, int]]
+
+
+class FrameSource:
+    r"""
+    Frames of an animation, decoded when they are needed and cached (scaled) in the `ImageCache`.
+
+    #### Parameters
+    - `key`: unique key of the source, used in the cache keys of the frames
+    - `read_ahead`: number of frames decoded ahead of the requested frame (Optional)
+    - `threaded`: decode the frames ahead in a background thread (Optional)
+
+    Subclasses implement `__len__` and `_decode(index)`
+    """
+
+    def __init__(self, key: str, read_ahead: int = 0, threaded: bool = False):
+        self.key = key
+        self.read_ahead = read_ahead
+        self.threaded = threaded
+
+        self._pending: Dict[Tuple[int, FrameSize], Future] = {}  # frames being decoded in the background
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _decode(self, index: int) -> pg.Surface:
+        raise NotImplementedError
+
+    def _make_frame(self, index: int, size: FrameSize) -> pg.Surface:
+        # frames already decoded (Example: preloaded with `AssetLoader`) are only scaled
+        frame = ImageCache.surfaces.get((self.key, index, None))
+        if frame is None:
+            frame = self._decode(index)
+
+        if size is not None and size != frame.get_size():
+            frame = pg.transform.scale(frame, size)
+
+        return frame
+
+    def _submit(self, index: int, size: FrameSize) -> Future:
+        if self._executor is None:
+            # a single worker, decoders are not thread safe
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ezsgame-frames")
+
+        future = self._pending[(index, size)] = self._executor.submit(self._make_frame, index, size)
+        return future
+
+    def get_frame(self, index: int, size: Optional[Iterable[int]] = None) -> pg.Surface:
+        r"""
+        #### Returns the frame at `index` scaled to `size` (`None` keeps the size of the frame)
+        """
+        size = (int(size[0]), int(size[1])) if size is not None else None
+        key = (self.key, index, size)
+
+        frame = ImageCache.get(key)
+
+        if frame is None:
+            pending = self._pending.pop((index, size), None)
+
+            if pending is not None:
+                frame = pending.result()
+            elif self.threaded:
+                # all the decoding happens in the worker
+                frame = self._submit(index, size).result()
+                del self._pending[(index, size)]
+            else:
+                frame = self._make_frame(index, size)
+
+            ImageCache.add(key, frame)
+
+        if self.read_ahead:
+            self._decode_ahead(index, size)
+
+        return frame
+
+    def _decode_ahead(self, index: int, size: FrameSize) -> None:
+        # frames decoded in the background are cached once they are ready
+        for (i, frame_size), future in list(self._pending.items()):
+            if future.done():
+                del self._pending[(i, frame_size)]
+                ImageCache.add((self.key, i, frame_size), future.result())
+
+        count = len(self)
+        for i in range(index + 1, index + 1 + min(self.read_ahead, count - 1)):
+            i %= count
+            cache_key = (self.key, i, size)
+
+            if cache_key in ImageCache.surfaces or (i, size) in self._pending:
+                continue
+
+            if self.threaded:
+                self._submit(i, size)
+            else:
+                ImageCache.add(cache_key, self._make_frame(i, size))
+
+    def close(self) -> None:
+        r"""
+        #### Stops the background thread (if any)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+
+
+class GifFrames(FrameSource):
+    r"""
+    #### Frames of a GIF
+    Frames are decoded one at a time when they are needed (decoding every frame up front is slow for long animations).
+
+    #### Parameters
+    - `path`: path to the GIF
+    - `read_ahead`: number of frames decoded ahead of the requested frame (default: `4`)
+    - `threaded`: decode the frames ahead in a background thread (default: `False`)
+    """
+
+    def __init__(self, path: Path | str, read_ahead: int = 4, threaded: bool = False):
+        super().__init__(GifFrames.cache_key(path), read_ahead, threaded)
+        self.path = path
+
+        # PIL is only imported when a GIF is used (faster startup)
+        from PIL import Image
+
+        try:
+            self._image = Image.open(path)
+        except FileNotFoundError:
+            raise ValueError("Image not found:", path)
+
+        # the first frame of an animated GIF is skipped (like the old eager loader did)
+        self._first = GifFrames.first_frame(self._image)
+        self._count = getattr(self._image, "n_frames", 1) - self._first
+
+    @staticmethod
+    def first_frame(image) -> int:
+        r"""
+        #### Returns the index of the first played frame of a GIF opened with PIL, `1` for animated GIFs and `0` otherwise
+        """
+        return 1 if getattr(image, "n_frames", 1) > 1 else 0
+
+    @staticmethod
+    def cache_key(path: Path | str) -> str:
+        r"""
+        #### Returns the key of the GIF frames in the `ImageCache`, frames are cached as `(key, index, size)`
+        """
+        return f"gif:{path}"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _decode(self, index: int) -> pg.Surface:
+        self._image.seek(index + self._first)
+        frame = self._image.convert("RGBA")
+        return convert(pg.image.frombytes(frame.tobytes(), frame.size, "RGBA"))
+
+    def __str__(self):
+        return f"<GifFrames : {self.path}, {len(self)} frames>"
+
+
+class SpriteSheet(FrameSource):
+    r"""
+    #### Frames of a sprite sheet
+    Image with the frames side by side, frames are read from left to right and top to bottom.
+    Much cheaper to decode than a GIF (the image is loaded once and frames are parts of it).
+
+    #### Parameters
+    - `path`: path to the sprite sheet image
+    - `frame_size`: size of the frames `[width, height]`
+    - `count`: number of frames (Optional, default: every frame in the image)
+    """
+
+    def __init__(self, path: Path | str, frame_size: Iterable[int], count: Optional[int] = None):
+        super().__init__(f"sheet:{path}:{frame_size[0]}x{frame_size[1]}")
+        self.path = path
+        self.frame_size = int(frame_size[0]), int(frame_size[1])
+
+        width, height = ImageCache.load(path).get_size()
+        columns = width // self.frame_size[0]
+        self.columns = columns
+        self._count = count if count is not None else columns * (height // self.frame_size[1])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _decode(self, index: int) -> pg.Surface:
+        width, height = self.frame_size
+        x, y = index % self.columns * width, index // self.columns * height
+        return ImageCache.load(self.path).subsurface((x, y, width, height))
+
+    def __str__(self):
+        return f"<SpriteSheet : {self.path}, {len(self)} frames>"
@@ -2,11 +2,14 @@ from pathlib import Path
 from ..components import Component
 from ..world import get_window
 from ..objects.object import Object
-from typing import Any, Dict, Iterable
-from ..styles.style import Styles
+from ..render_batch import batchable
+from typing import Any, Dict, Iterable, Optional
 import pygame as pg
+from ..styles.style import Styles
 from ..styles.units import Measure
 from ..types import Pos, Size
+from .image_cache import ImageCache
+from .atlas import TextureAtlas
 
 
 class Image(Object):
@@ -15,10 +18,11 @@ class Image(Object):
     #### Parameters
     - `pos`: position of the image `[x, y]`
     - `size` : size of the image `[width, height]`
-    - `image` : path to image file `str`
+    - `image` : path to image file `str` (or name of the image in the `atlas`)
 
     #### Optional Arguments
     - `scale` : scale the image to the size `bool`
+    - `atlas` : `TextureAtlas` with the image, the image is drawn from the atlas page
     - `components` : components to add in the object `[Component, ..]`
     - `styles` : Styles
     """
@@ -29,6 +33,7 @@ class Image(Object):
         pos: Pos | Iterable[Measure],
         size: Size | Iterable[Measure],
         scale: bool = True,
+        atlas: Optional[TextureAtlas] = None,
         styles: Styles = Styles(),
         parent: "Object" = None,
         components: Iterable[Component] = [],
@@ -37,8 +42,14 @@ class Image(Object):
         if not parent:
             parent = get_window()
 
-        self.image = image
+        self.path = image
         self.scale = scale
+        self.atlas = atlas
+        self.area: Optional[pg.Rect] = None  # area of the atlas page to draw
+
+        # transformations of the image
+        self._flip = (False, False)
+        self._rotation = 0
 
         super().__init__(
             pos=pos,
@@ -48,25 +59,45 @@ class Image(Object):
             components=components,
             **_styles
         )
-        try:
-            self.image = pg.image.load(image)
-        except:
-            raise ValueError("Image not found:", image)
+        self._image_size = self.size.copy() if scale else None
+        self._load_image()
+
+    def _get_draw_state(self):
+        return (*super()._get_draw_state(), id(self.image))
 
-        if scale:
-            self.image = pg.transform.scale(self.image, self.size)
+    def _get_blit(self):
+        return (self.image, self.screen_pos, self.area)
 
+    @batchable
     def draw(self):
-        self.window.surface.blit(self.image, self.pos)
+        self.window.surface.blit(self.image, self.screen_pos, self.area)
+
+    def _load_image(self):
+        if self.atlas:
+            self.image, self.area = self.atlas.load_image(self.path, self._image_size, self._flip, self._rotation)
+        else:
+            self.image = ImageCache.load(self.path, self._image_size, self._flip, self._rotation)
+
+    def _load(self):
+        self._load_image()
+        self.size = self.area.size if self.area else self.image.get_size()
 
     def rotate(self, angle):
-        self.image = pg.transform.rotate(self.image, angle)
-        self.size = [self.image.get_width(), self.image.get_height()]
+        self._rotation = (self._rotation + angle) % 360
+        self._load()
 
     def flip(self, x_axis: bool = True, y_axis: bool = False):
-        self.image = pg.transform.flip(self.image, x_axis, y_axis)
-        self.size = [self.image.get_width(), self.image.get_height()]
+        self._flip = (self._flip[0] != x_axis, self._flip[1] != y_axis)
+
+        # the image is flipped before being rotated, flipping a rotated image inverts the rotation
+        if x_axis != y_axis:
+            self._rotation = -self._rotation % 360
+
+        self._load()
 
     def scale(self, new_size: Size):
-        self.image = pg.transform.scale(self.image, new_size)
-        self.size = [self.image.get_width(), self.image.get_height()]
+        r"""
+        #### Scales the image to `new_size` (size of the image before rotating it)
+        """
+        self._image_size = new_size
+        self._load()
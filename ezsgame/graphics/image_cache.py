@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from typing import Hashable, Iterable, Optional, Tuple
+from path import Path
+import pygame as pg
+
+ImageKey = Tuple[str, Optional[Tuple[int, int]], Tuple[bool, bool], float]  # (path, size, flip, rotation)
+
+
+def get_surface_memory(surface: pg.Surface) -> int:
+    r"""
+    #### Returns the memory (in bytes) used by the pixels of a surface
+    """
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+def convert(surface: pg.Surface) -> pg.Surface:
+    r"""
+    #### Converts a surface to the pixel format of the window (faster blits)
+    Surfaces with transparency keep their alpha channel. Does nothing if the window was not created yet.
+    """
+    if not pg.display.get_surface():
+        return surface
+
+    if surface.get_flags() & pg.SRCALPHA or surface.get_colorkey() is not None:
+        return surface.convert_alpha()
+
+    return surface.convert()
+
+
+class ImageCache:
+    r"""
+    - Loads every image once and shares the surfaces between the objects that use them (`Image`, `Sprite`, `Tileset`, ...)
+
+    Images are cached by `(path, size, flip, rotation)` and converted to the window pixel format.
+    When the cached surfaces use more than `memory_budget` bytes, the least recently used surfaces are dropped
+    (objects that use them keep them, the cache just loads them again the next time they are needed).
+
+    #### Notes
+    - Surfaces returned by the cache are shared, draw on a copy (`surface.copy()`) to modify them.
+    """
+
+    memory_budget: int = 128 * 1024**2  # bytes
+    memory: int = 0  # bytes used by the cached surfaces
+
+    surfaces: OrderedDict[Hashable, pg.Surface] = OrderedDict()
+
+    # stats
+    hits: int = 0
+    misses: int = 0
+
+    def load(
+        path: Path | str,
+        size: Optional[Iterable[int]] = None,
+        flip: Tuple[bool, bool] = (False, False),
+        rotation: float = 0,
+    ) -> pg.Surface:
+        r"""
+        #### Returns the image at `path` (loaded and transformed only the first time)
+        - `path` : path to the image
+        - `size` : size of the image `[width, height]`, `None` keeps the size of the file (Optional)
+        - `flip` : flip the image in the `[x, y]` axes (Optional)
+        - `rotation` : rotation of the image in degrees, applied after scaling and flipping (Optional)
+
+        Raises `ValueError` if the image is not found
+        """
+        size = (int(size[0]), int(size[1])) if size is not None else None
+        key = (str(path), size, (bool(flip[0]), bool(flip[1])), rotation % 360)
+
+        surface = ImageCache.get(key)
+        if surface is not None:
+            return surface
+
+        if size is None and key[2] == (False, False) and key[3] == 0:
+            try:
+                surface = convert(pg.image.load(path))
+            except (FileNotFoundError, pg.error):
+                raise ValueError("Image not found:", path)
+
+        else:
+            # transformed images are made from the original image
+            surface = ImageCache.load(path)
+
+            if size is not None and size != surface.get_size():
+                surface = pg.transform.scale(surface, size)
+
+            if key[2] != (False, False):
+                surface = pg.transform.flip(surface, *key[2])
+
+            if key[3]:
+                surface = pg.transform.rotate(surface, key[3])
+
+        ImageCache.add(key, surface)
+        return surface
+
+    def get(key: Hashable) -> Optional[pg.Surface]:
+        r"""
+        #### Returns the surface cached with `key`, `None` if it's not cached
+        """
+        surface = ImageCache.surfaces.get(key)
+
+        if surface is None:
+            ImageCache.misses += 1
+            return None
+
+        ImageCache.hits += 1
+        ImageCache.surfaces.move_to_end(key)
+        return surface
+
+    def add(key: Hashable, surface: pg.Surface) -> None:
+        r"""
+        #### Caches a surface (Example: surfaces made at runtime, animation frames)
+        - `key` : key of the surface, `load` uses `(path, size, flip, rotation)` keys
+        - `surface` : surface to cache
+        """
+        old = ImageCache.surfaces.pop(key, None)
+        if old is not None:
+            ImageCache.memory -= get_surface_memory(old)
+
+        ImageCache.surfaces[key] = surface
+        ImageCache.memory += get_surface_memory(surface)
+        ImageCache.evict()
+
+    def remove(key: Hashable) -> None:
+        r"""
+        #### Drops the surface cached with `key` (if any)
+        """
+        surface = ImageCache.surfaces.pop(key, None)
+        if surface is not None:
+            ImageCache.memory -= get_surface_memory(surface)
+
+    def evict(budget: Optional[int] = None) -> None:
+        r"""
+        #### Drops the least recently used surfaces until the cache uses less than `budget` bytes
+        - `budget` : memory budget in bytes (Optional, default: `ImageCache.memory_budget`)
+
+        Note: the last used surface is always kept
+        """
+        budget = ImageCache.memory_budget if budget is None else budget
+
+        while ImageCache.memory > budget and len(ImageCache.surfaces) > 1:
+            _, surface = ImageCache.surfaces.popitem(last=False)
+            ImageCache.memory -= get_surface_memory(surface)
+
+    def clear() -> None:
+        r"""
+        #### Drops all the cached surfaces
+        """
+        ImageCache.surfaces.clear()
+        ImageCache.memory = 0
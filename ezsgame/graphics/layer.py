@@ -0,0 +1,178 @@
+from typing import Any, Dict, Iterable, List, Optional
+import pygame as pg
+
+from ..components import Component
+from ..objects.object import Object
+from ..render_batch import batchable, draw_batched
+from ..render_order import RenderOrder
+from ..styles.style import Styles
+from ..styles.styles_resolver import resolve_color
+from ..styles.units import Measure
+from ..types import Pos, Signal, Size
+from ..world import World, get_window
+from .image_cache import convert
+
+
+class Layer(Object):
+    r"""
+    #### Layer
+    Offscreen surface with its own objects, drawn in the window with a single blit. The objects are drawn into the surface
+    again only when something in the layer changed (Example: a HUD with many texts that change a few times per second,
+    a static background).
+
+    #### Parameters
+    - `pos`: position of the layer `[x, y]`
+    - `size`: size of the layer `[width, height]`
+    - `objects`: objects in the layer, their positions are relative to the layer (Optional, see `add`)
+
+    #### Optional Arguments
+    - `background`: color the layer is filled with before drawing the objects, `None` for a transparent layer (opaque layers blit faster)
+    - `track_changes`: if True, the objects are checked every frame (position, size, colors, image, text) and the layer is drawn
+    again when one of them changed. If False, the layer is only drawn again after `mark_dirty`
+    - `components` : components to add in the layer `[Component, ..]`
+    - `styles` : Styles (`fixed` for layers that don't move with the world view, `z_index` to order the layers)
+
+    #### Notes
+    - Things drawn without objects can be drawn in `layer.surface` by `on_render` listeners, call `mark_dirty` when they change.
+    - `renders` counts the times the objects were drawn into the layer (profiling).
+    """
+
+    def __init__(
+        self,
+        pos: Pos | Iterable[Measure],
+        size: Size | Iterable[Measure],
+        objects: Iterable[Any] = (),
+        background=None,
+        track_changes: bool = True,
+        styles: Styles = None,
+        parent: "Object" = None,
+        components: Iterable[Component] = [],
+        **_styles: Dict[str, Any]
+    ):
+        if not parent:
+            parent = get_window()
+
+        self.objects = RenderOrder()
+        self.background = resolve_color(background) if background is not None else None
+        self.track_changes = track_changes
+        self.dirty = True
+        self.renders = 0
+        self.on_render = Signal()
+        self._states: List = []  # draw states of the objects the last time the layer was drawn
+
+        super().__init__(
+            pos=pos,
+            size=size,
+            styles=styles,
+            parent=parent,
+            components=components,
+            **_styles
+        )
+
+        self.surface = self._make_surface()
+        self.add(*objects)
+
+    def _make_surface(self) -> pg.Surface:
+        size = (int(self.size[0]), int(self.size[1]))
+
+        if self.background is None:
+            return convert(pg.Surface(size, pg.SRCALPHA))
+
+        return convert(pg.Surface(size))
+
+    def add(self, *objects) -> None:
+        r"""
+        #### Adds objects to the layer, they are removed from the world so they are only drawn by the layer
+        (they keep colliding and receiving mouse events)
+        """
+        for obj in objects:
+            World.remove(obj, detach=False)
+            self.objects.add(obj)
+
+        self.dirty = True
+
+    def remove(self, *objects) -> None:
+        r"""
+        #### Removes objects from the layer (they are not added back to the world)
+        """
+        for obj in objects:
+            self.objects.discard(obj)
+
+        self.dirty = True
+
+    def mark_dirty(self) -> None:
+        r"""
+        #### Draws the layer again the next time it's drawn
+        """
+        self.dirty = True
+
+    def _get_states(self) -> List:
+        # batched objects are compared by what they blit (surface, position, area), cheaper than the dirty rects state
+        states = []
+
+        for obj in self.objects:
+            blit = obj._get_blit() if getattr(type(obj).draw, "_batchable", False) else None
+
+            if blit is None:
+                states.append(obj._get_draw_state())
+            else:
+                styles = getattr(obj, "styles", None)
+                states.append((blit, styles is None or styles.visible))
+
+        return states
+
+    def render(self) -> bool:
+        r"""
+        #### Draws the objects into the layer surface if something changed, returns True if the layer was drawn again
+        """
+        window = self.window
+        surface, dirty_rects = window.surface, window.dirty_rects
+        view_pos, view_size = World.pos, World.size
+
+        if self.surface.get_size() != (int(self.size[0]), int(self.size[1])):
+            self.surface = self._make_surface()
+            self.dirty = True
+
+        # the objects are drawn in the layer as if it was the window
+        window.surface, window.dirty_rects = self.surface, False
+        World.pos, World.size = Pos(0, 0), self.size
+
+        try:
+            states = self._get_states() if self.track_changes else self._states
+
+            if not self.dirty and states == self._states:
+                return False
+
+            if self.background is None:
+                self.surface.fill((0, 0, 0, 0))
+            else:
+                self.surface.fill(self.background)
+
+            draw_batched(list(self.objects))
+            self.on_render.trigger()
+
+        finally:
+            window.surface, window.dirty_rects = surface, dirty_rects
+            World.pos, World.size = view_pos, view_size
+
+        self._states = states
+        self.dirty = False
+        self.renders += 1
+        return True
+
+    def _get_draw_state(self):
+        # the layer is drawn again before the dirty rects mode compares its state
+        self.render()
+        return (*super()._get_draw_state(), self.renders)
+
+    def _get_blit(self):
+        self.render()
+        return (self.surface, self.screen_pos)
+
+    @batchable
+    def draw(self):
+        self.render()
+        self.window.surface.blit(self.surface, self.screen_pos)
+
+    def __str__(self):
+        return f"<Layer : {len(self.objects)} objects, {self.renders} renders>"
@@ -1,12 +1,14 @@
-from ast import Tuple
-from typing import Callable, Iterable, List, Dict
+from typing import Dict, Iterable, Optional, Tuple
 from path import Path
 import pygame
 from ..styles.styles_resolver import resolve_position, resolve_size
 from ..styles.units import Measure
 from ezsgame.types import Pos, Size
-from ..world import get_window
-from PIL import Image, ImageSequence
+from ..world import World, get_window
+from ..render_batch import batchable
+from .image_cache import ImageCache
+from .atlas import TextureAtlas
+from .frames import FrameSource, GifFrames, SpriteSheet
 
 
 pgSpriteClass = pygame.sprite.Sprite
@@ -20,9 +22,10 @@ class Sprite(pgSpriteClass):
         size: Size | Iterable[Measure],
         scale: bool = True,
         static: bool = False,
+        atlas: Optional[TextureAtlas] = None,
     ):
         # if is animated
-        if Path(sprite).ext == ".gif":
+        if Path(sprite).suffix == ".gif":
             raise TypeError("Use the AnimatedSprite class for animated sprites instead.")
 
         return object.__new__(Sprite)
@@ -34,6 +37,7 @@ class Sprite(pgSpriteClass):
         size: Size | Iterable[Measure],
         scale: bool = True,
         static: bool = False,
+        atlas: Optional[TextureAtlas] = None,
     ):
         pgSpriteClass.__init__(self)
 
@@ -44,56 +48,75 @@ class Sprite(pgSpriteClass):
         self.pos = resolve_position(self, pos, self.window, True)
 
         self.sprite = sprite
-        self.image = pygame.image.load(sprite)
+        self.scale = scale
+        self.atlas = atlas
+        self._image_size = self.size.copy()  # size the image was loaded with
+        self._load_image(self.size if scale else None)
 
-        if scale:
-            self.image = pygame.transform.scale(self.image, size)
-
-        self.rect = self.image.get_rect()
+        self.rect = self.image.get_rect() if self.area is None else self.area.copy()
         self.rect.topleft = pos
         self.rect.size = size
         self.start_pos = pos
         self.start_size = size
 
         if static:
-            self.draw = lambda: self.window.surface.blit(self.image, self.rect)
+            self.draw = lambda: self.window.surface.blit(self.image, self.rect.move(-World.pos.x, -World.pos.y), self.area)
+
+    def _load_image(self, size):
+        # images of an atlas are drawn from the atlas page (area blit)
+        if self.atlas:
+            self.image, self.area = self.atlas.load_image(self.sprite, size)
+        else:
+            self.image, self.area = ImageCache.load(self.sprite, size), None
 
     def _update(self):
-        self.image = pygame.transform.scale(self.image, self.size)
-        self.rect = self.image.get_rect()
+        # the image is only scaled again when the size changes
+        if self.scale and self.size != self._image_size:
+            self._load_image(self.size)
+            self._image_size = self.size.copy()
+
         self.rect.topleft = self.pos
         self.rect.size = self.size
 
-    def draw(self):
+    def _get_blit(self):
         self._update()
-        self.window.surface.blit(self.image, self.rect)
+        return (self.image, self.rect.move(-World.pos.x, -World.pos.y), self.area)
+
+    @batchable
+    def draw(self):
+        self.window.surface.blit(*self._get_blit())
 
 
 class AnimatedSprite(pgSpriteClass):
-    _cached_frames: Dict[str, List[pygame.Surface]] = {} # {path: [frames]} used to cache frames/resources for animated sprites
-    _cached_sprites: Dict[str, Tuple] = {} # {path: (size, frame_rate, scale, draw_method)} used to cache sprites that do the same but are in different locations
-    
-    def __new__(
-        cls,
-        sprite: Path | str,
-        pos: Pos | Iterable[Measure],
-        size: Size | Iterable[Measure],
-        frame_rate: int = 5,
-        scale: bool = True,
-    ):
-        if AnimatedSprite._cached_sprites.get(sprite, [None])[:-1] == (size, frame_rate, scale):
-            # Return a AnimatedSpriteRef object that references the cached sprite
-            return AnimatedSpriteRef.__new__(AnimatedSpriteRef, AnimatedSprite._cached_sprites[sprite][-1])
-            
-        return object.__new__(AnimatedSprite)
+    r"""
+    #### Animated Sprite
+    #### Parameters
+    - `sprite`: path to a GIF, path to a sprite sheet image (with `frame_size`) or a `FrameSource`
+    - `pos`: position of the sprite `[x, y]`
+    - `size`: size of the sprite `[width, height]`
+
+    #### Optional Arguments
+    - `frame_rate`: frames per second (default: number of frames, the animation lasts a second)
+    - `scale`: scale the frames to the size `bool`
+    - `frame_size`: size of the frames of a sprite sheet `[width, height]`
+    - `read_ahead`: number of GIF frames decoded ahead of the current frame (default: `4`)
+    - `threaded`: decode the GIF frames in a background thread (default: `False`)
+
+    Frames are decoded when they are needed and cached (scaled) in the `ImageCache`, sprites with the same
+    source share the frames.
+    """
+    _sources: Dict[Tuple, FrameSource] = {} # {(path, frame_size): source} frame sources shared by the sprites
 
     def __init__(
         self,
-        sprite: Path | str,
+        sprite: Path | str | FrameSource,
         pos: Pos | Iterable[Measure],
         size: Size | Iterable[Measure],
         frame_rate: int = -1, # -1 = auto
         scale: bool = True,
+        frame_size: Optional[Iterable[int]] = None,
+        read_ahead: int = 4,
+        threaded: bool = False,
     ):
         pgSpriteClass.__init__(self)
 
@@ -105,36 +128,42 @@ class AnimatedSprite(pgSpriteClass):
 
         self.current_frame = 0
         self.last_update_time = 0
+        self.scale = scale
 
-        if sprite in self._cached_frames:
-            self.frames = self._cached_frames[sprite]
-
-        # load frames (sprite is a gif)
-        else:
-            self.frames = [
-                pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode)
-                for frame in ImageSequence.Iterator(Image.open(sprite))
-            ]
-            self.frames = self.frames[1:]
-
-            self._cached_frames[sprite] = self.frames
+        self.source = sprite if isinstance(sprite, FrameSource) else AnimatedSprite.get_source(sprite, frame_size, read_ahead, threaded)
 
         # set frame rate
-        if frame_rate == -1:
-            self.frame_rate = len(self.frames)
+        self.frame_rate = frame_rate if frame_rate != -1 else len(self.source)
 
         # set sprite image and rect
-        self.image = self.frames[self.current_frame]
+        self.image = self.source.get_frame(self.current_frame, self.size if scale else None)
         self.rect = self.image.get_rect()
         self.rect.x, self.rect.y = self.pos
 
-        # set scale
         if scale:
-            self.image = pygame.transform.scale(self.image, self.size)
             self.rect.size = self.size
 
-        # cache sprite
-        self._cached_sprites[sprite] = (size, frame_rate, scale, self.draw)
+    def get_source(
+        sprite: Path | str,
+        frame_size: Optional[Iterable[int]] = None,
+        read_ahead: int = 4,
+        threaded: bool = False,
+    ) -> FrameSource:
+        r"""
+        #### Returns the frame source of a GIF or sprite sheet, sources are created once and shared
+        """
+        key = (str(sprite), tuple(frame_size) if frame_size else None)
+        source = AnimatedSprite._sources.get(key)
+
+        if source is None:
+            if frame_size:
+                source = SpriteSheet(sprite, frame_size)
+            else:
+                source = GifFrames(sprite, read_ahead, threaded)
+
+            AnimatedSprite._sources[key] = source
+
+        return source
 
     def _update(self):
         current_time = pygame.time.get_ticks()
@@ -144,24 +173,16 @@ class AnimatedSprite(pgSpriteClass):
 
         # update current frame if enough time has passed
         if time_since_last_update > 1000 / self.frame_rate:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.image = self.frames[self.current_frame]
+            self.current_frame = (self.current_frame + 1) % len(self.source)
+            self.image = self.source.get_frame(self.current_frame, self.size if self.scale else None)
             self.last_update_time = current_time
 
-    def draw(self):
-        self._update()
-        self.window.surface.blit(self.image, self.rect)
-
-class AnimatedSpriteRef:
-
-    def __new__(
-        cls,
-        draw_method: Callable,
-    ):
-        return object.__new__(cls)        
+        self.rect.topleft = self.pos
 
-    def __init__(self, draw_method: Callable):
-        self.draw = draw_method
+    def _get_blit(self):
+        self._update()
+        return (self.image, self.rect.move(-World.pos.x, -World.pos.y))
 
+    @batchable
     def draw(self):
-        pass
\ No newline at end of file
+        self.window.surface.blit(*self._get_blit())
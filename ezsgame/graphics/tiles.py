@@ -0,0 +1,242 @@
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from path import Path
+import pygame as pg
+
+from ..components import Component
+from ..objects.object import Object
+from ..styles.style import Styles
+from ..styles.units import Measure
+from ..types import Pos, Size
+from ..world import get_window
+from .image_cache import ImageCache
+
+EMPTY = -1  # index of the empty tile
+
+
+class Tileset:
+    r"""
+    #### Tileset
+    Image with all the tiles of a tilemap, it's loaded once and sliced into tiles.
+
+    #### Parameters
+    - `image`: path to the tileset image or a `pygame.Surface`
+    - `tile_size`: size of the tiles `[width, height]`
+
+    Tiles are indexed from left to right and top to bottom, starting at `0`
+    """
+
+    __slots__ = ("image", "tile_size", "tiles")
+
+    def __init__(self, image: Path | str | pg.Surface, tile_size: Size | Iterable[int]):
+        if not isinstance(image, pg.Surface):
+            image = ImageCache.load(image)
+
+        # faster blits when the pixel format matches the window
+        elif pg.display.get_surface():
+            image = image.convert_alpha()
+
+        self.image = image
+        self.tile_size = tile_width, tile_height = int(tile_size[0]), int(tile_size[1])
+
+        self.tiles: List[pg.Surface] = [
+            image.subsurface((x, y, tile_width, tile_height))
+            for y in range(0, image.get_height() - tile_height + 1, tile_height)
+            for x in range(0, image.get_width() - tile_width + 1, tile_width)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __str__(self):
+        return f"<Tileset : {len(self)} tiles of {self.tile_size[0]}x{self.tile_size[1]}>"
+
+
+class TileMap(Object):
+    r"""
+    #### Tile Map
+    Grid of tiles of a `Tileset`, the tiles are drawn in chunks (`chunk_size` x `chunk_size` tiles) that are
+    rendered once and cached, only the chunks inside the window are drawn.
+
+    #### Parameters
+    - `tileset`: `Tileset` of the map
+    - `pos`: position of the map `[x, y]`
+    - `map_size`: number of tiles of the map `[columns, rows]`
+    - `tiles`: tile indexes, a list of rows or a flat iterable (row by row) (Optional, default: empty map)
+
+    #### Optional Arguments
+    - `chunk_size`: number of tiles per chunk side (default: `32`)
+    - `cache_size`: max number of rendered chunks kept in memory, least recently drawn chunks are dropped first (default: `32`)
+    - `components` : components to add in the object `[Component, ..]`
+    - `styles` : Styles
+
+    #### Example
+    ```python
+    tilemap = TileMap(Tileset("tiles.png", [16, 16]), Pos(0, 0), [1000, 1000])
+    tilemap.set_tile(10, 5, 3)  # only the tile is rendered again
+    ```
+    """
+
+    def __init__(
+        self,
+        tileset: Tileset,
+        pos: Pos | Iterable[Measure],
+        map_size: Iterable[int],
+        tiles: Optional[Iterable[int] | Iterable[Iterable[int]]] = None,
+        chunk_size: int = 32,
+        cache_size: int = 32,
+        styles: Styles = Styles(),
+        parent: "Object" = None,
+        components: Iterable[Component] = [],
+        **_styles: Dict[str, Any]
+    ):
+        if not parent:
+            parent = get_window()
+
+        self.tileset = tileset
+        self.columns, self.rows = int(map_size[0]), int(map_size[1])
+        self.chunk_size = chunk_size
+        self.cache_size = cache_size
+
+        # tile indexes, row by row (2 bytes per tile)
+        if tiles is None:
+            self.tiles = array("h", [EMPTY]) * (self.columns * self.rows)
+
+        else:
+            tiles = list(tiles)
+            if tiles and not isinstance(tiles[0], int):
+                tiles = [index for row in tiles for index in row]
+
+            if len(tiles) != self.columns * self.rows:
+                raise ValueError(f"Expected {self.columns * self.rows} tiles, got {len(tiles)}")
+
+            self.tiles = array("h", tiles)
+
+        self._chunks: OrderedDict[Tuple[int, int], pg.Surface] = OrderedDict()  # {(chunk x, chunk y): surface}
+        self._version = 0  # changes when a tile changes (dirty rects mode)
+
+        tile_width, tile_height = tileset.tile_size
+
+        super().__init__(
+            pos=pos,
+            size=Size(self.columns * tile_width, self.rows * tile_height),
+            styles=styles,
+            parent=parent,
+            components=components,
+            **_styles
+        )
+
+    def get_tile(self, column: int, row: int) -> int:
+        r"""
+        #### Returns the tile index at `[column, row]` (`-1` if the tile is empty)
+        """
+        return self.tiles[row * self.columns + column]
+
+    def set_tile(self, column: int, row: int, index: int) -> None:
+        r"""
+        #### Sets the tile at `[column, row]`, cached chunks are updated instead of rendered again
+        - `index`: tile index in the tileset (`-1` for an empty tile)
+        """
+        i = row * self.columns + column
+        if self.tiles[i] == index:
+            return
+
+        self.tiles[i] = index
+        self._version += 1
+
+        chunk = self._chunks.get((column // self.chunk_size, row // self.chunk_size))
+        if chunk is not None:
+            tile_width, tile_height = self.tileset.tile_size
+            x = (column % self.chunk_size) * tile_width
+            y = (row % self.chunk_size) * tile_height
+
+            chunk.fill((0, 0, 0, 0), (x, y, tile_width, tile_height))
+            if index != EMPTY:
+                chunk.blit(self.tileset.tiles[index], (x, y))
+
+    def get_tile_at(self, pos: Pos | Iterable[float]) -> Optional[Tuple[int, int]]:
+        r"""
+        #### Returns the `[column, row]` of the tile at a world position, `None` if the position is outside of the map
+        """
+        tile_width, tile_height = self.tileset.tile_size
+        column = int((pos[0] - self.pos.x) // tile_width)
+        row = int((pos[1] - self.pos.y) // tile_height)
+
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return column, row
+
+        return None
+
+    def _bake_chunk(self, chunk_x: int, chunk_y: int) -> pg.Surface:
+        tile_width, tile_height = self.tileset.tile_size
+        tileset = self.tileset.tiles
+        size = self.chunk_size
+
+        first_column, first_row = chunk_x * size, chunk_y * size
+        columns = min(size, self.columns - first_column)
+        rows = min(size, self.rows - first_row)
+
+        chunk = pg.Surface((columns * tile_width, rows * tile_height), pg.SRCALPHA)
+
+        blits = []
+        for row in range(rows):
+            start = (first_row + row) * self.columns + first_column
+            y = row * tile_height
+
+            for column, index in enumerate(self.tiles[start : start + columns]):
+                if index != EMPTY:
+                    blits.append((tileset[index], (column * tile_width, y)))
+
+        chunk.blits(blits, doreturn=False)
+        return chunk
+
+    def _get_chunk(self, chunk_x: int, chunk_y: int) -> pg.Surface:
+        key = (chunk_x, chunk_y)
+        chunk = self._chunks.get(key)
+
+        if chunk is None:
+            chunk = self._chunks[key] = self._bake_chunk(chunk_x, chunk_y)
+        else:
+            self._chunks.move_to_end(key)
+
+        return chunk
+
+    def clear_cache(self) -> None:
+        r"""
+        #### Drops all the rendered chunks (they are rendered again when needed)
+        """
+        self._chunks.clear()
+
+    def draw(self):
+        surface = self.window.surface
+        offset_x, offset_y = self.screen_pos
+        width, height = surface.get_size()
+
+        tile_width, tile_height = self.tileset.tile_size
+        chunk_width, chunk_height = tile_width * self.chunk_size, tile_height * self.chunk_size
+        chunks_x = -(-self.columns // self.chunk_size)
+        chunks_y = -(-self.rows // self.chunk_size)
+
+        # chunks inside the window
+        first_x = max(0, int(-offset_x // chunk_width))
+        last_x = min(chunks_x - 1, int((width - offset_x) // chunk_width))
+        first_y = max(0, int(-offset_y // chunk_height))
+        last_y = min(chunks_y - 1, int((height - offset_y) // chunk_height))
+
+        blits = [
+            (self._get_chunk(x, y), (offset_x + x * chunk_width, offset_y + y * chunk_height))
+            for y in range(first_y, last_y + 1)
+            for x in range(first_x, last_x + 1)
+        ]
+        surface.blits(blits, doreturn=False)
+
+        # drop the least recently drawn chunks (chunks inside the window are always kept)
+        while len(self._chunks) > max(self.cache_size, len(blits)):
+            self._chunks.popitem(last=False)
+
+    def _get_draw_state(self):
+        return (*super()._get_draw_state(), self._version)
+
+    def __str__(self):
+        return f"<TileMap : {self.columns}x{self.rows} tiles, {len(self._chunks)} chunks cached>"
@@ -1,4 +1,5 @@
 from .object import Object
 from .geometric import *
 from .text import Text
-from .groups import Group
\ No newline at end of file
+from .groups import Group
+from .pool import ObjectPool
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import Any, Dict, Iterable
 
-from ..world import get_window
+from ..world import World, get_window
+from ..render_batch import batchable
+from ..graphics.image_cache import ImageCache, convert
 from ..objects.object import Object
 import pygame as pg
 from ..styles.colors import resolve_color, Color
@@ -9,7 +11,86 @@ from ..styles.units import Measure
 from ..types import Pos, Size
 from ..components import Component
 
-class Rect(Object):
+class Shape(Object):
+    r"""
+    Base class for shapes drawn with `pygame.draw`.
+    With the `static` style the shape is rendered once into a surface (shared by the shapes that look the same)
+    and drawn as an image, it's only rendered again when its size, color, stroke or border radius change.
+    """
+
+    _shape_key = None
+    _shape: pg.Surface = None
+
+    def _render(self, surface: pg.Surface, x: float, y: float) -> None:
+        r"""
+        Draws the shape in `surface` with the top-left corner of its bounds at `[x, y]`
+        """
+        raise NotImplementedError
+
+    def _get_shape(self) -> pg.Surface:
+        styles = self.styles
+        _, _, width, height = self._get_bounds()
+        key = (
+            "shape",
+            self.__class__.__name__,
+            int(width),
+            int(height),
+            tuple(styles.color),
+            styles.stroke,
+            tuple(styles.border_radius),
+        )
+
+        if key != self._shape_key:
+            shape = ImageCache.get(key)
+
+            if shape is None:
+                shape = self._render_shape(key[2], key[3])
+                ImageCache.add(key, shape)
+
+            self._shape, self._shape_key = shape, key
+
+        return self._shape
+
+    def _render_shape(self, width: int, height: int) -> pg.Surface:
+        color = pg.Color(self.styles.color)
+
+        # translucent colors need an alpha channel
+        if color.a < 255:
+            shape = pg.Surface((width, height), pg.SRCALPHA)
+            self._render(shape, 0, 0)
+            return convert(shape)
+
+        # shapes are not antialiased, a colorkey is enough for the transparent parts (and blits faster)
+        colorkey = (255, 0, 255) if color[:3] != (255, 0, 255) else (0, 255, 0)
+        shape = pg.Surface((width, height))
+        shape.fill(colorkey)
+        self._render(shape, 0, 0)
+
+        shape = convert(shape)
+        shape.set_colorkey(colorkey, pg.RLEACCEL)
+        return shape
+
+    def _get_blit(self):
+        if not self.styles.static:
+            return None
+
+        x, y, _, _ = self._get_bounds()
+        offset_x, offset_y = World.get_offset(self)
+        return (self._get_shape(), (x - offset_x, y - offset_y))
+
+    @batchable
+    def draw(self):
+        blit = self._get_blit()
+
+        if blit is not None:
+            self.window.surface.blit(*blit)
+        else:
+            x, y, _, _ = self._get_bounds()
+            offset_x, offset_y = World.get_offset(self)
+            self._render(self.window.surface, x - offset_x, y - offset_y)
+
+
+class Rect(Shape):
     r"""
     #### Rect
     #### Parameters
@@ -24,17 +105,17 @@ class Rect(Object):
     - `components` : components to add in the rect `[Component, ..]`
     """
 
-    def draw(self):
+    def _render(self, surface, x, y):
         pg.draw.rect(
-            self.window.surface,
+            surface,
             self.styles.color,
-            (*self.pos, *self.size),
+            (x, y, *self.size),
             self.styles.stroke,
             *self.styles.border_radius
         )
 
 
-class Circle(Object):
+class Circle(Shape):
     r"""
     #### Circle
     #### Parameters
@@ -71,11 +152,11 @@ class Circle(Object):
             **_styles
         )
 
-    def draw(self):
+    def _render(self, surface, x, y):
         pg.draw.circle(
-            self.window.surface,
+            surface,
             self.styles.color,
-            self.pos,
+            (x + self.radius, y + self.radius),
             self.radius,
             self.styles.stroke,
         )
@@ -90,8 +171,13 @@ class Circle(Object):
             (center_x + radius, center_y + radius),  # bottom-right
         )
 
+    def _get_bounds(self):
+        center_x, center_y = self.pos
+        radius = self.size[0] / 2
+        return (center_x - radius, center_y - radius, radius * 2, radius * 2)
+
 
-class Ellipse(Object):
+class Ellipse(Shape):
     r"""
     #### Ellipse
     #### Parameters
@@ -105,11 +191,11 @@ class Ellipse(Object):
     - `margins`: margins of the Ellipse `[top, right, bottom, left]`
     """
 
-    def draw(self):
+    def _render(self, surface, x, y):
         pg.draw.ellipse(
-            self.window.surface,
+            surface,
             self.styles.color,
-            (*self.pos, *self.size),
+            (x, y, *self.size),
             self.styles.stroke,
         )
 
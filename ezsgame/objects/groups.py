@@ -1,7 +1,8 @@
-from typing import Any, Tuple, Union
+from typing import Any, Dict, Tuple, Union
 from ..funcs import center_at
 
 from ..objects.object import Object
+from ..render_order import RenderOrder
 from ..types import Pos
 
 
@@ -24,6 +25,8 @@ class Group:
 
     def __init__(self, *objects, **named_objects):
         self._objects = {}
+        self._keys: Dict[Object, int] = {}  # number of keys of each object, objects can be added with many keys
+        self._render_order = RenderOrder()
 
         parent = named_objects.get("parent", None)
         if parent:
@@ -43,16 +46,27 @@ class Group:
 
     def add(self, *objects, **named_objects):
         for obj in objects:
-            self._objects[id(obj)] = obj
+            self.add_as(id(obj), obj)
 
-        self._objects.update(named_objects)
+        for key, obj in named_objects.items():
+            self.add_as(key, obj)
 
     def add_as(self, key: Union[int, float, bool, str, Tuple], object: Object):
         """
         Adds a object to the group with a custom key.
         Make sure the key is a valid dictionary key.
         """
+        replaced = self._objects.get(key)
+
+        if replaced is object:
+            return
+
         self._objects[key] = object
+        self._keys[object] = self._keys.get(object, 0) + 1
+        self._render_order.add(object)
+
+        if replaced is not None:
+            self._discard(replaced)
 
     def get(
         self, name: Union[int, float, bool, str, Tuple], default: Any = None
@@ -63,7 +77,17 @@ class Group:
         return self._objects.get(name, default)
 
     def remove(self, name: str):
-        self._objects.pop(name)
+        self._discard(self._objects.pop(name))
+
+    def _discard(self, obj):
+        # removes the object from the render order if it's not in the group with other key
+        keys = self._keys[obj] - 1
+
+        if keys:
+            self._keys[obj] = keys
+        else:
+            del self._keys[obj]
+            self._render_order.discard(obj)
 
     def align_objects(self, auto_size=True):
         # aligns objects in the group
@@ -108,7 +132,7 @@ class Group:
         if self._parent:
             self.align_objects()
 
-        for obj in sorted(self.values(), key=lambda x: x.styles.z_index):
+        for obj in self._render_order:
             obj.draw()
 
     def map(self, func):
@@ -159,11 +183,11 @@ class Group:
 
     # delete item
     def __delitem__(self, key):
-        self._objects.pop(key)
+        self._discard(self._objects.pop(key))
         self.__dict__.pop(key)
 
     def __delattr__(self, key):
-        self._objects.pop(key)
+        self._discard(self._objects.pop(key))
         self.__dict__.pop(key)
 
     # contains
@@ -0,0 +1,158 @@
+from copy import deepcopy
+from dataclasses import fields, replace
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Type, TypeVar
+
+from ..components import Component
+from ..styles.style import Styles
+from ..styles.styles_resolver import resolve_position, resolve_size
+from ..styles.units import Measure
+from ..types import Pos, Size
+from ..world import World
+from .object import Object
+
+ObjectType = TypeVar("ObjectType", bound=Object)
+
+_STYLES_FIELDS = {f.name for f in fields(Styles)}
+
+
+class ObjectPool(Generic[ObjectType]):
+    r"""
+    #### Object Pool
+    Recycles objects of the same type (Example: bullets or particles) instead of creating new ones.
+
+    #### Parameters
+    - `object_type`: type of the objects `Rect`, `Circle`, `Image`, ...
+    - `*args`, `**kwargs`: arguments used to create the objects, `pos` is given in `get`
+    - `prefill`: number of objects created beforehand (Optional)
+
+    #### Notes
+    - `components` are made for every object, so objects don't share a component: component types (or functions that return
+    a component) are called, component instances are copied.
+
+    #### Example
+    ```python
+    bullets = ObjectPool(Rect, size=Size(4, 10), color="yellow", components=[HitBox])
+
+    bullet = bullets.get(Pos(100, 100))  # new or recycled bullet
+    bullets.release(bullet)  # removed from the world, will be recycled
+    ```
+    """
+
+    def __init__(self, object_type: Type[ObjectType], *args, prefill: int = 0, **kwargs):
+        self.object_type = object_type
+        self.args = args
+
+        # styles that every object starts with
+        styles = kwargs.pop("styles", None)
+        style_kwargs = {k: kwargs.pop(k) for k in list(kwargs) if k in _STYLES_FIELDS}
+        self.styles: Styles = styles or Styles(**style_kwargs)
+
+        self.kwargs = kwargs
+
+        self._free: List[ObjectType] = []
+        self._used: Dict[ObjectType, None] = {}
+
+        for _ in range(prefill):
+            obj = self._create(Pos(0, 0), {})
+            World.remove(obj)
+            self._free.append(obj)
+
+    def _new_styles(self) -> Styles:
+        return replace(
+            self.styles,
+            margins=list(self.styles.margins),
+            border_radius=list(self.styles.border_radius),
+        )
+
+    def _new_components(self, components: Iterable[Component | Callable[[], Component]]) -> List[Component]:
+        # a component can only be mounted on one object
+        return [deepcopy(comp) if isinstance(comp, Component) else comp() for comp in components]
+
+    def _create(self, pos, overrides: Dict[str, Any]) -> ObjectType:
+        kwargs = {**self.kwargs, **overrides, "pos": pos}
+        kwargs.setdefault("styles", self._new_styles())
+        kwargs["components"] = self._new_components(kwargs.get("components", ()))
+        return self.object_type(*self.args, **kwargs)
+
+    def _reset(
+        self,
+        obj: ObjectType,
+        pos: Pos | Iterable[Measure],
+        size: Optional[Size | Iterable[Measure]] = None,
+        radius: Optional[float] = None,
+        styles: Optional[Styles] = None,
+        components: Optional[Iterable[Component | Callable[[], Component]]] = None,
+    ) -> None:
+        # values not given fall back to the ones of the pool, not to the ones of the previous `get`
+        if radius is None and size is None:
+            radius, size = self.kwargs.get("radius"), self.kwargs.get("size")
+
+        if components is None:
+            components = self.kwargs.get("components", ())
+
+        obj.styles = styles or self._new_styles()
+        obj.styles.resolve(obj.parent.size)
+
+        if radius is not None:
+            obj.radius = radius
+            obj.size = Size(radius * 2, radius * 2)
+
+        elif size is not None:
+            obj.size = resolve_size(obj, size, obj.parent.size)
+
+        obj.pos = resolve_position(obj, pos, obj.parent)
+        obj.components.add(*self._new_components(components))
+
+    def get(self, pos: Pos | Iterable[Measure], **overrides) -> ObjectType:
+        r"""
+        #### Returns a recycled object (or a new one if there are no free objects) and adds it to the world
+        - `pos`: position of the object
+        - `**overrides`: `size`, `radius`, `styles` or `components` of the object (Optional, the ones of the pool are used by default)
+        """
+        if self._free:
+            obj = self._free.pop()
+            self._reset(obj, pos, **overrides)
+            World.add(obj)
+
+        else:
+            obj = self._create(pos, overrides)
+
+        self._used[obj] = None
+        return obj
+
+    def release(self, obj: ObjectType) -> None:
+        r"""
+        #### Removes the object from the world and keeps it to be recycled
+        Components of the object are removed (the components of the pool are added again in `get`) and `on_draw` listeners are cleared.
+        """
+        if obj not in self._used:
+            raise ValueError(f"{obj} is not in use in this pool")
+
+        del self._used[obj]
+
+        World.remove(obj)
+        obj.components.clear()
+        obj.on_draw.listeners.clear()
+
+        self._free.append(obj)
+
+    def release_all(self) -> None:
+        r"""
+        #### Releases every object in use
+        """
+        for obj in list(self._used):
+            self.release(obj)
+
+    @property
+    def in_use(self) -> int:
+        return len(self._used)
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    def __len__(self) -> int:
+        return len(self._used) + len(self._free)
+
+    def __str__(self):
+        return f"<ObjectPool : {self.object_type.__name__}, in use: {self.in_use}, free: {self.free}>"
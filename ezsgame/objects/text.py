@@ -5,14 +5,13 @@ from ..components import Component
 from ..world import get_window
 from ..objects.object import Object
 from ..reactivity import Reactive
+from ..render_batch import batchable
 from ..styles.style import Styles
 from ..styles.units import Measure
 from ..types import Pos, Size, Signal
-from ..fonts import Fonts, FontFamily
+from ..fonts import Fonts, FontFamily, FontCache, FontKey
 
 
-pg.font.init()
-
 
 class Text(Object):
     r"""
@@ -24,6 +23,7 @@ class Text(Object):
     - `font` : font of the text `"Arial or "path/to/font.ttf"` or `ezsgame font` (default: `OpenSans`)
     - `bold` : if True, the text will be bold `bool`
     - `italic` : if True, the text will be italic `bool`
+    - `glyphs` : if True, the text is made of cached glyphs, faster for texts that change every frame (Example: counters) `bool`
 
     #### Styles
     - `color`: color of the text `"white" or (R, G, B)`
@@ -38,9 +38,12 @@ class Text(Object):
         "bold",
         "italic",
         "text_obj",
+        "glyphs",
+        "_font_key",
         "styles",
         "children",
-        "on_draw"
+        "on_draw",
+        "__dict__", # draw method is replaced on init
     )
 
     def __init__(
@@ -54,6 +57,7 @@ class Text(Object):
         components: Iterable[Component] = [],
         italic: bool = False,
         bold: bool = False,
+        glyphs: bool = False,
         **_styles: Dict[str, Any],
     ):
         if not parent:
@@ -69,11 +73,13 @@ class Text(Object):
 
         self.bold = bold
         self.italic = italic
+        self.glyphs = glyphs
 
         # need before supert init because load_font uses it
         self.styles = styles
         self.styles.resolve(parent.size)
 
+        self._font_key = self.get_font_key()
         self.text_obj = self.load_font()
 
 
@@ -86,40 +92,57 @@ class Text(Object):
             **_styles,
         )
 
-    def load_font(self):
+    def get_font_key(self) -> FontKey:
+        r"""
+        #### Returns the `FontCache` key `(font file, size, bold, italic)` of the text font
+        """
         # is font is a ezsgame font
         if isinstance(self.font, FontFamily):
-            font = self.font.get_font(self.font_size.get())
+            font = self.font.font_file
 
         # if font is a path | str
         elif isinstance(self.font, str):
-            # if font in system fonts
-            if font in pg.font.get_fonts():
-                font = pg.font.SysFont(
-                    font, self.font_size.get(), self.bold, self.italic
-                )
-
             # if font is a path
-            elif font.endswith(".ttf"):
-                try:
-                    font = pg.font.Font(font, self.font_size.get())
-                except Exception as e:
-                    raise ValueError(f"Error loading font: {e}")
+            if self.font.endswith(".ttf"):
+                font = self.font
+
+            # if font in system fonts
+            elif self.font in pg.font.get_fonts():
+                font = self.font
 
             else:
                 raise ValueError("Invalid font name or path: " + self.font)
 
         else:
-            raise ValueError("Invalid font: " + self.font)
+            raise ValueError("Invalid font: " + str(self.font))
 
-        return font.render(self.text.get(), True, self.styles.color)
+        try:
+            FontCache.get_font(font, self.font_size.get(), self.bold, self.italic)
+        except Exception as e:
+            raise ValueError(f"Error loading font: {e}")
+
+        return (font, self.font_size.get(), self.bold, self.italic)
+
+    def load_font(self):
+        render = FontCache.render_glyphs if self.glyphs else FontCache.render
+        return render(self._font_key, str(self.text.get()), self.styles.color)
 
     def _update(self, updated_property_name: str):
-        if updated_property_name == "text":
+        if updated_property_name == "font_size":
+            self._font_key = self.get_font_key()
+
+        if updated_property_name in ("text", "font_size"):
             self.text_obj = self.load_font()
             self.size = Size(self.text_obj.get_width(), self.text_obj.get_height())
 
         super()._update(updated_property_name)
 
+    def _get_draw_state(self):
+        return (*super()._get_draw_state(), id(self.text_obj))
+
+    def _get_blit(self):
+        return (self.text_obj, self.screen_pos)
+
+    @batchable
     def draw(self):
-        self.window.surface.blit(self.text_obj, self.pos)
+        self.window.surface.blit(self.text_obj, self.screen_pos)
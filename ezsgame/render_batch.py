@@ -0,0 +1,95 @@
+"""
+Module for drawing many objects with batched blits (`Surface.blits`)
+"""
+
+from typing import Any, Callable, Iterable, List
+
+from .world import World, get_window
+
+
+def batchable(draw: Callable) -> Callable:
+    """
+    #### Marks a `draw` method that only blits `self._get_blit()` to the window, so it can be batched
+    `_get_blit` can return `None` when the object has to be drawn with `draw`.
+    Subclasses that override `draw` are drawn with their own `draw`.
+    """
+    draw._batchable = True
+    return draw
+
+
+def draw_batched(objects: Iterable[Any]) -> None:
+    """
+    #### Draws objects (in the given order) blitting the images, sprites, texts and static shapes with a `Surface.blits` per z-index layer
+    Objects that can't be batched (shapes that are not static, objects with `on_draw` listeners or a custom `draw`) are drawn with
+    their `draw` method, the objects drawn before them are blitted first so the order is kept.
+
+    - `objects` : objects to draw, ordered by z-index (Example: `World.get_visible()`)
+    """
+    window = get_window()
+
+    # dirty rects mode draws every object clipped to its dirty areas
+    if window.dirty_rects:
+        for obj in objects:
+            obj.draw()
+        return
+
+    surface = window.surface
+    stats = World._frame_stats
+    culling = World.culling
+
+    # same test as World.is_inside, without a call per object
+    view_x, view_y = World.pos.x, World.pos.y
+    view_w, view_h = World.size.x, World.size.y
+
+    blits: List = []
+    layer = None
+
+    for obj in objects:
+        on_draw = getattr(obj, "on_draw", None)
+
+        if not getattr(type(obj).draw, "_batchable", False) or (on_draw and on_draw.listeners):
+            if blits:
+                surface.blits(blits, doreturn=False)
+                blits = []
+
+            obj.draw()
+            continue
+
+        styles = getattr(obj, "styles", None)
+
+        if styles is not None:
+            if styles.z_index != layer:
+                if blits:
+                    surface.blits(blits, doreturn=False)
+                    blits = []
+
+                layer = styles.z_index
+
+            if culling:
+                x, y, w, h = obj._get_bounds()
+                if not styles.fixed:
+                    x, y = x - view_x, y - view_y
+
+                if not (x <= view_w and 0 <= x + w and y <= view_h and 0 <= y + h):
+                    stats.culled += 1
+                    continue
+
+            if not styles.visible:
+                continue
+
+        blit = obj._get_blit()
+
+        # the object can't be blitted right now (Example: shapes without the `static` style)
+        if blit is None:
+            if blits:
+                surface.blits(blits, doreturn=False)
+                blits = []
+
+            obj.draw()
+            continue
+
+        blits.append(blit)
+        stats.drawn += 1
+
+    if blits:
+        surface.blits(blits, doreturn=False)
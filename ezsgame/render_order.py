@@ -0,0 +1,123 @@
+from bisect import insort
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+def get_z_index(obj) -> int:
+    styles = getattr(obj, "styles", None)
+    return styles.z_index if styles else 0
+
+
+class RenderOrder:
+    """
+    Keeps objects ordered by `styles.z_index` (objects with the same z-index are kept in the order they were added).
+    Objects are kept in a bucket per z-index, so adding or removing objects doesn't sort all the objects again.
+
+    #### Notes
+    - If the `z_index` of an object changes, the object is moved to its new bucket after the next iteration,
+    or right away with `reorder`.
+    """
+
+    __slots__ = ("_buckets", "_z_indexes", "_objects", "_moved", "_count")
+
+    def __init__(self, *objects):
+        self._buckets: Dict[int, Dict[Any, None]] = {}  # {z_index: {object: None}} dicts keep insertion order
+        self._z_indexes: List[int] = []  # sorted z-indexes of the buckets
+        self._objects: Dict[Any, Tuple[int, int]] = {}  # {object: (z_index of its bucket, order added)}
+        self._moved: List[Any] = []  # objects whose z-index changed
+        self._count = 0
+
+        self.add(*objects)
+
+    def add(self, *objects) -> None:
+        """
+        #### Adds objects (objects already added are ignored)
+        """
+        for obj in objects:
+            if obj in self._objects:
+                continue
+
+            z_index = get_z_index(obj)
+            bucket = self._buckets.get(z_index)
+
+            if bucket is None:
+                bucket = self._buckets[z_index] = {}
+                insort(self._z_indexes, z_index)
+
+            bucket[obj] = None
+            self._objects[obj] = (z_index, self._count)
+            self._count += 1
+
+    def remove(self, obj) -> None:
+        """
+        #### Removes an object, raises `KeyError` if the object is not in the render order
+        """
+        z_index, _ = self._objects.pop(obj)
+        bucket = self._buckets[z_index]
+        del bucket[obj]
+
+        if not bucket:
+            del self._buckets[z_index]
+            self._z_indexes.remove(z_index)
+
+    def discard(self, obj) -> None:
+        """
+        #### Removes an object if it's in the render order
+        """
+        if obj in self._objects:
+            self.remove(obj)
+
+    def reorder(self, obj) -> None:
+        """
+        #### Moves an object to the position of its current `z_index`
+        """
+        if obj in self._objects and self._objects[obj][0] != get_z_index(obj):
+            self.remove(obj)
+            self.add(obj)
+
+    def sort(self, objects: Iterable[Any]) -> List[Any]:
+        """
+        #### Returns `objects` (that must be in the render order) sorted in render order
+        Cheaper than iterating all the objects when `objects` is a small part of them
+        """
+        objects = list(objects)
+
+        for obj in objects:
+            self.reorder(obj)
+
+        objects.sort(key=self._objects.__getitem__)
+        return objects
+
+    def _apply_moved(self) -> None:
+        for obj in self._moved:
+            self.reorder(obj)
+
+        self._moved.clear()
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._z_indexes.clear()
+        self._objects.clear()
+        self._moved.clear()
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._moved:
+            self._apply_moved()
+
+        for z_index in tuple(self._z_indexes):
+            for obj in tuple(self._buckets.get(z_index, ())):
+                if get_z_index(obj) != z_index:
+                    self._moved.append(obj)
+
+                yield obj
+
+        if self._moved:
+            self._apply_moved()
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __str__(self):
+        return f"<RenderOrder : {len(self)} objects>"
@@ -3,9 +3,43 @@ Module for scenes manipulation and creation
 """
 
 from abc import ABC, abstractmethod
-from typing import FrozenSet
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from .assets import Asset, AssetLoader, Assets
+from .world import World, get_window
+from .render_batch import draw_batched
+
+@dataclass(slots=True)
+class SceneStats:
+    """
+    Time spent in a scene since the scene manager was created or `reset` (see `SceneManager.stats`)
+    - `updates`, `draws` : number of calls to `update` and `draw`
+    - `update_time`, `draw_time` : time (seconds) spent in `update` and `draw`, threaded updates are timed in their thread
+    - `skipped` : threaded updates skipped because the previous update was still running
+    """
+    updates: int = 0
+    draws: int = 0
+    update_time: float = 0.0
+    draw_time: float = 0.0
+    skipped: int = 0
+
+    def reset(self) -> None:
+        self.updates = 0
+        self.draws = 0
+        self.update_time = 0.0
+        self.draw_time = 0.0
+        self.skipped = 0
+
+    def __str__(self):
+        update = self.update_time / self.updates * 1000 if self.updates else 0
+        draw = self.draw_time / self.draws * 1000 if self.draws else 0
+        return (
+            f"<SceneStats : {self.updates} updates ({update:.3f} ms), {self.draws} draws ({draw:.3f} ms), {self.skipped} skipped>"
+        )
 
-from .world import get_window
 
 class Scene(ABC):
     """
@@ -15,15 +49,38 @@ class Scene(ABC):
     Note: the minimum required for a scene is to have an `init`, `update` and `draw` methods
     - `name`: Name of the scene (defaults to class name without `_scene`) Example: `main_scene` -> `main`
     - `shadow_update`: If True, the scene will be updated even if it's not the current scene
-    - `shadow_draw`: If True, the scene will be drawn even if it's not the current scene
+    - `shadow_draw`: If True, the scene will be drawn even if it's not the current scene (before the current scene)
+    - `update_rate`: updates per second of the scene when it's not the current scene (Example: `10` for a background simulation),
+    `0` updates it every frame
+    - `threaded`: If True, the scene is updated in a background thread when it's not the current scene, for scenes whose `update`
+    doesn't touch pygame surfaces or objects of other scenes (Example: pathfinding, network). The main loop doesn't wait for the
+    update, if it's still running when the next update is due that update is skipped. With `shadow_draw`, the scene is drawn
+    while its update runs, `update` should set the results it computed at the end (Example: `self.path = path`) so `draw`
+    shows the last complete state.
+
+    ### Assets
+    - `assets`: images, GIFs, sounds and fonts `(font file, size)` used by the scene, with `lazy_load` they are loaded in the
+    background before `init` and unloaded when no loaded scene uses them (see `SceneManager`)
+    - `next_scenes`: names of the scenes likely shown after this one, their assets are loaded in the background (prefetched)
+    while this scene is shown (with `lazy_load`)
     """
 
+    assets: Iterable[Asset] = ()
+    next_scenes: Iterable[str] = ()
+
     def __init__(
-        self, name: str = None, shadow_update: bool = False, shadow_draw: bool = False
+        self,
+        name: str = None,
+        shadow_update: bool = False,
+        shadow_draw: bool = False,
+        update_rate: float = 0,
+        threaded: bool = False,
     ):
         self.name: str = name or self.__class__.__name__.replace("_scene", "")
         self.shadow_update: bool = shadow_update
         self.shadow_draw: bool = shadow_draw
+        self.update_rate: float = update_rate
+        self.threaded: bool = threaded
 
         self.manager: SceneManager = None
 
@@ -60,6 +117,13 @@ class Scene(ABC):
         """
         pass
 
+    def unload(self) -> None:
+        """
+        Called after `on_switch_out` when the scene is unloaded (with `lazy_load`), to remove its objects and free what `init` made.
+        The assets only this scene uses are unloaded after, and `init` is called again the next time the scene is switched to
+        """
+        pass
+
     def switch_to(self, scene_name: str) -> None:
         """
         Switch to a scene
@@ -77,19 +141,47 @@ class SceneManager:
     ### Init
     - `scenes`: Scenes to be managed
     - `main_scene`: Name of the main scene (defaults to `main`)
-    - `lazy_load`: If True, scenes will be initialized (init method) only when switched to not when the scene manager is initialized (Main scene will always be initialized)
+    - `lazy_load`: If True, scenes will be initialized (init method) only when switched to not when the scene manager is initialized (Main scene will always be initialized).
+    Scenes are unloaded (`unload` method) when switched from, unless they have `shadow_update` or `shadow_draw`
+    - `auto_draw`: If True, objects inside the world view are drawn after the scenes (batched blits, like `Window.run`),
+    a `Layer` is drawn with a single blit and its objects are only drawn again when they change
+    - `loading_scene`: Name of the scene shown while the `assets` of a scene load (with `lazy_load`), the manager switches to the
+    scene when they are loaded. `loading_progress` is the progress from 0 to 1. Without a loading scene, `switch_to` waits for the assets.
+
+    ### Profiling
+    `stats` has the time spent in the `update` and `draw` of each scene `{scene name: SceneStats}`
     """
 
-    def __init__(self, *scenes: Scene, main_scene: str = "main", lazy_load: bool = False):
+    def __init__(
+        self,
+        *scenes: Scene,
+        main_scene: str = "main",
+        lazy_load: bool = False,
+        auto_draw: bool = False,
+        loading_scene: str = None,
+    ):
 
         self.window = get_window()
 
         self.lazy_load: bool = lazy_load
+        self.auto_draw: bool = auto_draw
+        self.loading_scene: Optional[str] = loading_scene
         self.scenes: dict = {scene.name: scene for scene in scenes}
-        
+
+        # assets of the scene being loaded
+        self.loader: Optional[AssetLoader] = None
+        self._loading_target: Optional[str] = None
+        self._initialized: Set[str] = set()
+        self._prefetching: Dict[str, AssetLoader] = {}  # {scene name: loader of its assets}
+
+        self.stats: Dict[str, SceneStats] = {scene.name: SceneStats() for scene in scenes}
+        self._next_updates: Dict[str, float] = {}  # {scene name: time of the next update}, scenes with `update_rate`
+        self._running: Dict[str, Future] = {}  # {scene name: threaded update}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         try:
             self.current_scene: Scene = self.scenes[main_scene]
-            self.current_scene.init()
+            self._init_scene(self.current_scene)
             self.current_scene.on_switch()
         except KeyError:
             raise Exception(f"Main scene '{main_scene}' not found in scenes <{self.scenes.keys()}>")
@@ -105,56 +197,245 @@ class SceneManager:
             [scene.name for scene in scenes if getattr(scene, "shadow_draw", False)]
         )
 
+        # shadow scenes in the order they were given
+        self._shadow_updates: Tuple[Scene, ...] = tuple(scene for scene in scenes if scene.name in self.has_shadow_update)
+        self._shadow_draws: Tuple[Scene, ...] = tuple(scene for scene in scenes if scene.name in self.has_shadow_draw)
+
         for scene in scenes:
             scene.manager = self
 
         if not lazy_load:
             for scene in scenes:
-                scene.init()
+                self._init_scene(scene)
+        else:
+            self.prefetch(*self.current_scene.next_scenes)
+
+    def _init_scene(self, scene: Scene) -> None:
+        if scene.name not in self._initialized:
+            self._initialized.add(scene.name)
+            Assets.acquire(scene.name, scene.assets)
+            scene.init()
+
+    def _unload_scene(self, scene: Scene) -> None:
+        self._initialized.discard(scene.name)
+        scene.unload()
+        Assets.release(scene.name)
+
+    def prefetch(self, *scene_names: str) -> None:
+        """
+        Loads the assets of scenes in the background (a few per frame, in `update`), so switching to them doesn't wait for the assets
+        """
+        for name in scene_names:
+            scene = self.scenes[name]
+
+            if scene is self.current_scene or name in self._prefetching or name == self._loading_target:
+                continue
+
+            # the assets are kept until the scene is shown or it's not likely to be shown anymore
+            Assets.acquire(("prefetch", name), scene.assets)
+            self._prefetching[name] = AssetLoader([asset for asset in scene.assets if not Assets.is_loaded(asset)])
+
+    def _cancel_prefetch(self, scene_name: str) -> None:
+        self._prefetching.pop(scene_name).cancel()
+        Assets.release(("prefetch", scene_name))
+
+    def _get_loader(self, scene: Scene) -> AssetLoader:
+        Assets.acquire(scene.name, scene.assets)
+
+        if scene.name in self._prefetching:
+            loader = self._prefetching.pop(scene.name)
+            Assets.release(("prefetch", scene.name))
+            return loader
+
+        return AssetLoader([asset for asset in scene.assets if not Assets.is_loaded(asset)])
 
     def switch_to(self, scene_name: str) -> None:
         """
         Switch to a scene
+        (With `lazy_load`, the assets of the scene are loaded before, see `loading_scene`)
         """
-        if scene_name in self.scenes.keys():
-            if self.current_scene:
-                self.current_scene.on_switch_out()
-                self.window.fill() # Clear window
+        if scene_name not in self.scenes.keys():
+            raise Exception(f"Scene '{scene_name}' not found")
 
-            self.current_scene = self.scenes[scene_name]
+        # switching while a scene loads
+        if self.loader:
+            self.loader.cancel()
+            Assets.release(self._loading_target)
+            self.loader = None
+            self._loading_target = None
 
-            if self.lazy_load:
-                self.current_scene.init()
+        scene = self.scenes[scene_name]
 
-            self.current_scene.on_switch()
-        else:
-            raise Exception(f"Scene '{scene_name}' not found")
+        if self.lazy_load and scene_name not in self._initialized and scene.assets:
+            loader = self._get_loader(scene)
+
+            if not loader.done and self.loading_scene and self.loading_scene != scene_name:
+                self._switch(self.loading_scene)
+                self.loader = loader
+                self._loading_target = scene_name
+                return
+
+            loader.wait()
+
+        self._switch(scene_name)
+
+    def _switch(self, scene_name: str) -> None:
+        previous = self.current_scene
+        scene = self.current_scene = self.scenes[scene_name]
+        self._wait_update(scene)
+
+        if previous:
+            previous.on_switch_out()
+            self.window.fill() # Clear window
+
+        if self.lazy_load:
+            # the assets of the scene and the next scenes are owned before the previous scene is unloaded,
+            # so shared assets stay loaded (Example: going back to a menu)
+            Assets.acquire(scene.name, scene.assets)
+
+            if scene.name in self._prefetching:
+                self._cancel_prefetch(scene.name)
+
+            self.prefetch(*scene.next_scenes)
+
+            if previous and previous is not scene and previous.name not in self.has_shadow_update | self.has_shadow_draw:
+                self._unload_scene(previous)
+
+            self._init_scene(scene)
+
+            # scenes that are not likely to be shown anymore
+            for name in list(self._prefetching):
+                if name not in scene.next_scenes:
+                    self._cancel_prefetch(name)
+
+        scene.on_switch()
+
+    def get_memory(self) -> Dict[str, int]:
+        """
+        Returns the memory (in bytes) used by the assets of each scene in the caches `{scene name: bytes}`,
+        assets shared by many scenes are counted in each of them
+        """
+        return {
+            name: sum(Assets.get_memory(asset) for asset in dict.fromkeys(scene.assets))
+            for name, scene in self.scenes.items()
+        }
+
+    @property
+    def loading_progress(self) -> float:
+        """
+        Progress of the assets being loaded, from 0 to 1 (1 if no scene is loading)
+        """
+        return self.loader.progress if self.loader else 1.0
 
     def update(self) -> None:
         """
-        Update sthe current scene (and scenes that have shadow_update)
+        Updates the current scene (and scenes that have shadow_update, see `Scene.update_rate` and `Scene.threaded`)
         """
-        if self.current_scene:
-            self.current_scene.update()
+        # decoded assets are added to the caches a few per frame, the scene is switched to when they are ready
+        if self.loader:
+            self.loader.poll()
+
+            if self.loader.done:
+                target = self._loading_target
+                self.loader = None
+                self._loading_target = None
+                self._switch(target)
+
+        # prefetched assets load when no scene is waiting for its assets
+        else:
+            for loader in self._prefetching.values():
+                if not loader.done:
+                    loader.poll(budget=2)
+                    break
+
+        current = self.current_scene
+
+        if current:
+            self._wait_update(current)
+            self._update_scene(current)
+
+        # Update scenes that have shadow_update
+        now = time.perf_counter()
 
-            # Update scenes that have shadow_update
-            map(
-                lambda name: self.scenes[name].update(),
-                self.has_shadow_update - {self.current_scene.name},
+        for scene in self._shadow_updates:
+            if scene is current or scene.name not in self._initialized:
+                continue
+
+            if scene.update_rate:
+                next_update = self._next_updates.get(scene.name, now)
+
+                if now < next_update:
+                    continue
+
+                # scheduled from the previous update so the rate doesn't drift, missed updates are skipped
+                next_update += 1 / scene.update_rate
+                self._next_updates[scene.name] = next_update if next_update > now else now + 1 / scene.update_rate
+
+            if scene.threaded:
+                self._submit_update(scene)
+            else:
+                self._update_scene(scene)
+
+    def _update_scene(self, scene: Scene) -> None:
+        stats = self.stats[scene.name]
+        start = time.perf_counter()
+        scene.update()
+        stats.update_time += time.perf_counter() - start
+        stats.updates += 1
+
+    def _submit_update(self, scene: Scene) -> None:
+        running = self._running.get(scene.name)
+
+        if running is not None:
+            if not running.done():
+                self.stats[scene.name].skipped += 1
+                return
+
+            self._wait_update(scene)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=sum(scene.threaded for scene in self._shadow_updates), thread_name_prefix="ezsgame-scenes"
             )
 
+        self._running[scene.name] = self._executor.submit(self._update_scene, scene)
+
+    def _wait_update(self, scene: Scene) -> None:
+        # waits for the threaded update of a scene, its errors are raised in the main thread
+        running = self._running.pop(scene.name, None)
+
+        if running is not None:
+            running.result()
+
+    def _draw_scene(self, scene: Scene) -> None:
+        # a running threaded update is not waited for (the scene draws its last complete state), a finished one raises its errors
+        running = self._running.get(scene.name)
+
+        if running is not None and running.done():
+            self._wait_update(scene)
+
+        stats = self.stats[scene.name]
+        start = time.perf_counter()
+        scene.draw()
+        stats.draw_time += time.perf_counter() - start
+        stats.draws += 1
+
     def draw(self) -> None:
         """
-        Draws the current scene (and scenes that have shadow_draw)
+        Draws the scenes that have shadow_draw and the current scene (on top of them)
         """
-        if self.current_scene:
-            self.current_scene.draw()
+        current = self.current_scene
 
-            # Draw scenes that have shadow_draw
-            map(
-                lambda name: self.scenes[name].draw(),
-                self.has_shadow_draw - {self.current_scene.name},
-            )
+        # Draw scenes that have shadow_draw
+        for scene in self._shadow_draws:
+            if scene is not current and scene.name in self._initialized:
+                self._draw_scene(scene)
+
+        if current:
+            self._draw_scene(current)
+
+        if self.auto_draw:
+            draw_batched(World.get_visible())
 
     def __del__(self) -> None:
         """
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 import pygame as pg
 
 class Mixer:
@@ -15,7 +15,7 @@ class Mixer:
         return f"<Object: Mixer, ID : {self._id}>"
         
     def load(self, filename):
-        self.sounds.append(Sound(filename))
+        Sound(filename, self)  # adds itself to the mixer sounds
         
     def _load_sound(self, sound_object):
         self.sounds.append(sound_object)
@@ -38,23 +38,60 @@ class Mixer:
         for sound in self.sounds:
             del sound
   
+class SoundCache:
+    """
+    - Decoded sounds loaded ahead of time (Example: assets of a scene, see `AssetLoader`)
+
+    `Sound` objects of a cached file copy its samples instead of decoding the file again.
+    """
+
+    sounds: Dict[str, pg.mixer.Sound] = {}
+
+    def add(file: str, sound: pg.mixer.Sound) -> None:
+        SoundCache.sounds[str(file)] = sound
+
+    def get(file: str) -> Optional[pg.mixer.Sound]:
+        return SoundCache.sounds.get(str(file))
+
+    def remove(file: str) -> None:
+        SoundCache.sounds.pop(str(file), None)
+
+    def get_memory(file: str) -> int:
+        r"""
+        #### Returns the memory (in bytes) used by the samples of a cached sound, `0` if it's not cached
+        """
+        sound = SoundCache.get(file)
+        if sound is None or not pg.mixer.get_init():
+            return 0
+
+        frequency, size, channels = pg.mixer.get_init()
+        return int(sound.get_length() * frequency) * abs(size) // 8 * channels
+
+
 class Sound:
-    defualt_mixer = Mixer()
+    defualt_mixer: Optional[Mixer] = None # created with the first sound (pygame.mixer is initialized on first use)
     
-    def __init__(self, file, mixer: Optional[Mixer]):
+    def __init__(self, file, mixer: Optional[Mixer] = None):
+        self.mixer = mixer or Sound.get_default_mixer()
+
         try:
-            self.sound = pg.mixer.Sound(file)
+            cached = SoundCache.get(file)
+            self.sound = pg.mixer.Sound(buffer=cached.get_raw()) if cached else pg.mixer.Sound(file)
         except Exception as e:
             raise Exception(f"Could not load sound file <{file}>. \n Error: {e}")
         
         self.sound.set_volume(0.5)
         self.volume = 0.5
         
-        self.mixer = mixer or Sound.defualt_mixer
-        
         self.mixer._load_sound(self)
         self.length = self.sound.get_length()
         
+    def get_default_mixer() -> Mixer:
+        if Sound.defualt_mixer is None:
+            Sound.defualt_mixer = Mixer()
+
+        return Sound.defualt_mixer
+
     @property
     def volume(self):
         return self.sound.get_volume()
@@ -85,6 +122,9 @@ class Sound:
         return f"<Object: Sound>"
     
     def __del__(self):
+        if not hasattr(self, "sound"):
+            return
+
         if self in self.mixer.sounds:
             self.mixer.remove(self)
         del self.sound
@@ -0,0 +1,138 @@
+"""
+Module for spatial indexing of objects
+"""
+
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+Bounds = Tuple[float, float, float, float]  # x, y, width, height
+Cell = Tuple[int, int]
+
+
+def get_bounds(obj) -> Bounds:
+    """
+    #### Returns the bounds `(x, y, width, height)` of an object
+    Uses `obj._get_bounds` if the object has it, otherwise its `pos` and `size`
+    """
+    if hasattr(obj, "_get_bounds"):
+        return obj._get_bounds()
+
+    x, y = obj.pos
+    w, h = obj.size
+    return (x, y, w, h)
+
+
+class SpatialGrid:
+    """
+    Uniform grid that indexes objects by the cells their bounds cover, so finding the objects at a point
+    or inside an area only visits the objects in those cells.
+
+    ### Init
+    - `cell_size`: size (in pixels) of the grid cells (default: `64`)
+
+    #### Notes
+    - Objects must be updated (`update`) after they move or get resized, `Object` instances do it
+      automatically when their `pos` or `size` are set.
+    """
+
+    __slots__ = ("cell_size", "_cells", "_objects")
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Set[Any]] = {}
+        self._objects: Dict[Any, Tuple[Cell, Cell]] = {}  # {object: (first cell, last cell)}
+
+    def _cell_range(self, bounds: Bounds) -> Tuple[Cell, Cell]:
+        x, y, w, h = bounds
+        cs = self.cell_size
+        return (int(x // cs), int(y // cs)), (int((x + w) // cs), int((y + h) // cs))
+
+    def _cells_in(self, cell_range: Tuple[Cell, Cell]) -> Iterable[Cell]:
+        (x0, y0), (x1, y1) = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def insert(self, obj) -> None:
+        """
+        #### Adds an object to the grid (if the object is already in the grid, it's updated)
+        """
+        if obj in self._objects:
+            self.update(obj)
+            return
+
+        cell_range = self._cell_range(get_bounds(obj))
+        self._objects[obj] = cell_range
+
+        for cell in self._cells_in(cell_range):
+            self._cells.setdefault(cell, set()).add(obj)
+
+    def remove(self, obj) -> None:
+        """
+        #### Removes an object from the grid
+        """
+        cell_range = self._objects.pop(obj, None)
+        if cell_range is None:
+            return
+
+        for cell in self._cells_in(cell_range):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(obj)
+                if not bucket:
+                    del self._cells[cell]
+
+    def update(self, obj) -> None:
+        """
+        #### Moves an object to the cells that its current bounds cover
+        """
+        old_range = self._objects.get(obj)
+        if old_range is None:
+            return
+
+        # still in the same cells, nothing to do
+        if self._cell_range(get_bounds(obj)) == old_range:
+            return
+
+        self.remove(obj)
+        self.insert(obj)
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """
+        #### Returns the objects whose bounds contain the point `(x, y)` (borders excluded)
+        """
+        cs = self.cell_size
+        found = []
+
+        for obj in self._cells.get((int(x // cs), int(y // cs)), ()):
+            ox, oy, w, h = get_bounds(obj)
+            if ox < x < ox + w and oy < y < oy + h:
+                found.append(obj)
+
+        return found
+
+    def query_rect(self, bounds: Bounds) -> Set[Any]:
+        """
+        #### Returns the objects in the cells covered by `bounds` (x, y, width, height)
+        Note: this is a broad test, returned objects may be near the area but not overlapping it
+        """
+        found = set()
+
+        for cell in self._cells_in(self._cell_range(bounds)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update(bucket)
+
+        return found
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._objects.clear()
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects)
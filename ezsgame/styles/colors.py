@@ -1,4 +1,5 @@
 from colour import Color
+import math
 import random
 
 from ezsgame.types import Size
@@ -6,6 +7,7 @@ import pygame as pg
 from typing import List, Tuple
 from ..world import get_window
 from ..funcs import div
+from ..graphics.image_cache import ImageCache, convert
 
 
 def adapt_rgb(rgb): return tuple(map(lambda i: i*255, rgb))
@@ -78,57 +80,144 @@ def gen_gradient(size: Size, div, start, end, direction="v", pos_prefix: float =
     return objs
 
 
+GRADIENT_DIRECTIONS = {"h": "horizontal", "v": "vertical", "d": "diagonal", "r": "radial"}
+
+
+def _resolve_stops(colors) -> Tuple[Tuple[int, ...], ...]:
+    # colors as (R, G, B) or (R, G, B, A) ints, every color with the same channels
+    colors = [tuple(int(round(c)) for c in resolve_color(color)) for color in colors]
+
+    if any(len(color) == 4 for color in colors):
+        colors = [color if len(color) == 4 else (*color, 255) for color in colors]
+
+    return tuple(colors)
+
+
+def _interpolate(colors: Tuple[Tuple[int, ...], ...], count: int) -> bytes:
+    # pixels of a gradient line of `count` pixels, colors evenly spaced
+    segments = len(colors) - 1
+    last = max(count - 1, 1)
+    channels = range(len(colors[0]))
+    pixels = bytearray()
+
+    for i in range(count):
+        t = i * segments / last
+        index = min(int(t), segments - 1)
+        t -= index
+
+        start, end = colors[index], colors[index + 1]
+        pixels.extend(round(start[c] + (end[c] - start[c]) * t) for c in channels)
+
+    return bytes(pixels)
+
+
+def render_gradient(colors, size: Tuple[int, int], direction: str = "horizontal") -> pg.Surface:
+    r'''
+    #### Renders a gradient into a new surface
+    - `colors`: colors of the gradient, evenly spaced `[(R, G, B), ...]` or `[(R, G, B, A), ...]`
+    - `size`: size of the surface `[width, height]`
+    - `direction`: `"horizontal"`, `"vertical"`, `"diagonal"` or `"radial"`
+    '''
+    colors = _resolve_stops(colors)
+    width, height = size
+    mode = "RGBA" if len(colors[0]) == 4 else "RGB"
+    flags = pg.SRCALPHA if mode == "RGBA" else 0
+
+    # a line of pixels stretched over the surface
+    if direction == "horizontal":
+        line = pg.image.frombytes(_interpolate(colors, width), (width, 1), mode)
+        return pg.transform.scale(line, size)
+
+    if direction == "vertical":
+        line = pg.image.frombytes(_interpolate(colors, height), (1, height), mode)
+        return pg.transform.scale(line, size)
+
+    surface = pg.Surface(size, flags)
+
+    # each row is a part of a line twice as long, shifted by the row
+    if direction == "diagonal":
+        line = pg.image.frombytes(_interpolate(colors, width * 2), (width * 2, 1), mode)
+        surface.blits(
+            [(line, (0, y), (round(y * width / height), 0, width, 1)) for y in range(height)],
+            doreturn=False
+        )
+        return surface
+
+    # rings from the corners to the center
+    if direction == "radial":
+        center = (width / 2, height / 2)
+        radius = int(math.hypot(width, height) / 2) + 1
+        pixels = _interpolate(colors, radius + 1)
+        channels = len(colors[0])
+        ring_colors = [pixels[i:i + channels] for i in range(0, len(pixels), channels)]
+
+        surface.fill(ring_colors[-1])
+        for r in range(radius, 0, -1):
+            pg.draw.circle(surface, ring_colors[r], center, r, 2)
+        surface.set_at((int(center[0]), int(center[1])), ring_colors[0])
+
+        return surface
+
+    raise ValueError(
+        "Direction must be 'horizontal', 'vertical', 'diagonal' or 'radial'")
+
+
 class Gradient:
     r'''
     #### Gradient
+    Rendered once into a surface (interpolated per pixel) and cached, drawing it is a single blit.
+    The surface is rendered again only when the size changes.
+
     #### Parameters
-    - `start`: start color `white` or `(R, G, B)`
-    - `end`: end color `black` or `(R, G, B)`
+    - `colors`: colors of the gradient, evenly spaced (at least two) `white` or `(R, G, B)` or `(R, G, B, A)`
 
     #### Optional Arguments (Keyword Arguments)
-    - `direction`: direction of the gradient `"horizontal"` or `"vertical"`
-    - `complexity`: space between each color stripe (higher -> load time) `int`
-    - `size`: size of the gradient `[width, height]` (default: window size)
+    - `direction`: direction of the gradient `"horizontal"`, `"vertical"`, `"diagonal"` (top left to bottom right) or `"radial"` (center to corners)
+    - `complexity`: not used, kept for compatibility (gradients are interpolated per pixel)
+    - `size`: size of the gradient `[width, height]` (default: window size, follows the window when it's resized)
     '''
 
-    def __init__(self, *colors, direction="horizontal", complexity=120, size=None):
-        if complexity < 3:
-            complexity = 3
-
-        if complexity > 1000:
-            complexity = 1000
-
+    def __init__(self, *colors, direction="horizontal", complexity=None, size=None):
         if not colors or len(colors) < 2:
             raise ValueError(
                 "You must specify at least two colors to create a gradient")
 
+        if not direction or direction[0].lower() not in GRADIENT_DIRECTIONS:
+            raise ValueError(
+                "Direction must be 'horizontal', 'vertical', 'diagonal' or 'radial'")
+
         self.colors = colors
+        self.direction = GRADIENT_DIRECTIONS[direction[0].lower()]
 
         self.window = get_window()
+        self.size = Size(*size) if size else None
+
+        self._colors = _resolve_stops(colors)
+        self._surface = None
+        self._surface_size = None
+
+    def get_surface(self) -> pg.Surface:
+        r'''
+        #### Returns the rendered gradient (rendered again only if the size changed)
+        '''
+        size = self.size if self.size else self.window.size
+        size = (max(int(size[0]), 1), max(int(size[1]), 1))
 
-        size = resolve_size(size) if size else self.window.size
-        self.gradient_objs = []
-        last_color = None
+        if size != self._surface_size:
+            key = ("gradient", self._colors, self.direction, size)
+            surface = ImageCache.get(key)
 
-        for index, division in enumerate(div("x", len(colors), size), start=1):
-            if index > len(colors) - 1:
-                break
+            if surface is None:
+                surface = convert(render_gradient(self._colors, size, self.direction))
+                ImageCache.add(key, surface)
 
-            last_color = colors[index-1]
+            self._surface = surface
+            self._surface_size = size
 
-            self.gradient_objs.extend(gen_gradient(size,
-                                                   div("x", complexity, [
-                                                       division[1], size[1]]),
-                                                   last_color,
-                                                   colors[index],
-                                                   direction,
-                                                   division[0]
-                                                   )
-                                      )
+        return self._surface
 
     def draw(self):
-        for obj in self.gradient_objs:
-            pg.draw.rect(self.window.surface, obj[2], pg.Rect(obj[0], obj[1]))
+        self.window.surface.blit(self.get_surface(), (0, 0))
 
     def __str__(self):
         return f"<Gradient {self.colors}>"
@@ -22,6 +22,8 @@ class Styles:
 
     # bools
     visible: bool = True
+    fixed: bool = False # not moved by the world view / camera (Example: HUD)
+    static: bool = False # shapes are rendered once and drawn as an image (Example: UI panels)
     
     
     def resolve(self, parent_size: Size):
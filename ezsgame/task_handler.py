@@ -0,0 +1,70 @@
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable, Coroutine, List, Set
+
+# asyncio is only imported when a task runs (faster startup)
+
+
+class TaskHandler:
+    r"""
+    - Runs the coroutines of `async def` callbacks (events, intervals) as tasks of the asyncio event loop
+
+    Async callbacks need the main loop to run in an event loop (`Window.run_async`).
+    Errors raised by the tasks are raised again in the main loop by `check`, like errors of normal callbacks.
+    """
+
+    tasks: Set["asyncio.Task"] = set()  # running tasks, asyncio only keeps weak references to them
+    errors: List[BaseException] = []
+
+    def run(coroutine: Coroutine) -> "asyncio.Task":
+        r"""
+        #### Runs a coroutine as a task of the running event loop, returns the task
+        Raises `RuntimeError` if there is no running event loop
+        """
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            coroutine.close()
+            raise RuntimeError("Async callbacks need the main loop to run with `Window.run_async`")
+
+        task = loop.create_task(coroutine)
+        TaskHandler.tasks.add(task)
+        task.add_done_callback(TaskHandler._done)
+        return task
+
+    def _done(task: "asyncio.Task") -> None:
+        TaskHandler.tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            TaskHandler.errors.append(task.exception())
+
+    def wrap(callback: Callable) -> Callable:
+        r"""
+        #### Returns a function that runs `callback` as a task if it's an `async def` function, otherwise returns `callback`
+        """
+        if not iscoroutinefunction(callback):
+            return callback
+
+        @wraps(callback)
+        def run_callback(*args: Any, **kwargs: Any) -> "asyncio.Task":
+            return TaskHandler.run(callback(*args, **kwargs))
+
+        return run_callback
+
+    def check() -> None:
+        r"""
+        #### Raises the first error of the tasks that failed since the last check
+        """
+        if TaskHandler.errors:
+            error = TaskHandler.errors[0]
+            TaskHandler.errors.clear()
+            raise error
+
+    def cancel_all() -> None:
+        r"""
+        #### Cancels every running task
+        """
+        for task in list(TaskHandler.tasks):
+            task.cancel()
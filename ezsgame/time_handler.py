@@ -1,105 +1,305 @@
-from typing import Callable, List
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Dict, List, Tuple
 import pygame as pg
 
+from .task_handler import TaskHandler
+
+# catch up policies, what an interval does when it missed calls (Example: a frame slower than the interval)
+CATCH_UP_SKIP = "skip"  # calls once and skips the missed calls, keeps the period (default)
+CATCH_UP_ALL = "all"  # calls once per missed call
+CATCH_UP_RESET = "reset"  # calls once and the next call is `time` after now
+
+# intervals this short (ms) are called about every frame, they are kept in a list instead of the heap
+FRAME_INTERVAL = 1000 / 60
+
 
 class Interval:
-    __slots__ = "time", "callback", "name", "last_call", "repeat"
+    __slots__ = "time", "callback", "name", "last_call", "repeat", "next_call", "catch_up", "cancelled"
 
     def __init__(
-        self, time: float, callback: Callable, last_call: float, name, repeat: int
+        self,
+        time: float,
+        callback: Callable,
+        last_call: float,
+        name,
+        repeat: int,
+        catch_up: str = CATCH_UP_SKIP,
     ):
         self.time = time
         self.callback = callback
         self.name = name
         self.last_call = last_call
         self.repeat = repeat
+        self.next_call = last_call + time
+        self.catch_up = catch_up
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        r"""
+        #### Cancels the interval, so it won't be called anymore
+        """
+        TimeHandler.cancel(self)
+
+    def __str__(self):
+        return f"<Interval : {self.name}, every {self.time} ms>"
 
 
 class TimeHandler:
     r"""
     - Handles the time events
+
+    Intervals are kept in a heap ordered by their next call, so `check` only goes through the intervals that have to be called.
+    Intervals of a frame or less (`FRAME_INTERVAL`) are called about every frame, they are kept in a list and checked every frame.
+    Intervals are rescheduled from their previous call time (`next = previous + time`), so they don't drift.
     """
 
-    intervals: List[Interval] = []
-    to_remove: List[str] = []
+    intervals: Dict[str, List[Interval]] = {}  # {name: intervals with that name}
     to_add: List[Interval] = []
 
-    def add(call_time: int, callback, name: str = "Default", repeat: int = -1):
+    # (next call, order, interval), cancelled intervals are dropped when they get to the top
+    _heap: List[Tuple[float, int, Interval]] = []
+    _order = count()
+    _active: int = 0  # intervals in the heap that are not cancelled
+
+    # intervals of a frame or less, cancelled intervals are dropped in the next check
+    _frame_intervals: List[Interval] = []
+
+    def add(
+        call_time: int,
+        callback,
+        name: str = "Default",
+        repeat: int = -1,
+        catch_up: str = CATCH_UP_SKIP,
+    ) -> Interval:
         r"""
-        #### Adds a `interval` that will be called every `time` seconds
+        #### Adds a `interval` that will be called every `time` seconds, returns the `Interval` (can be cancelled with `interval.cancel()`)
         - `name` : name of the event
         - `time` : amount of time in seconds that the event will be called after
-        - `callback` : function to be called when the event is triggered
+        - `callback` : function to be called when the event is triggered, `async def` functions run as tasks (see `Window.run_async`)
         - `repeat` : number of times the interval will last (-1 for infinite)
-        """ 
+        - `catch_up` : what to do when calls were missed: `"skip"` them, call `"all"` of them or `"reset"` the interval from now (Optional)
+        """
 
         # convert time to milliseconds
         call_time *= 1000
 
-        name = (
-            f"{len(TimeHandler.intervals)}.{call_time}" if name == "Default" else name
-        )
-
         # check for valid repeat
         if repeat <= 0 and not repeat == -1:
             raise ValueError(
                 f"At TimeHandler.add (Adding a interval): Argument `repeat` must be either -1 (infinite) or bigger than 0, got: {repeat}.\n For degubbing: TimeHandler.add({call_time=}, {callback=}, {name=}, {repeat=})"
             )
 
-        TimeHandler.to_add.append(Interval(call_time, callback, 0, name, repeat))
+        if catch_up not in (CATCH_UP_SKIP, CATCH_UP_ALL, CATCH_UP_RESET):
+            raise ValueError(
+                f"At TimeHandler.add (Adding a interval): Argument `catch_up` must be either 'skip', 'all' or 'reset', got: {catch_up}"
+            )
+
+        order = next(TimeHandler._order)
+        name = f"{order}.{call_time}" if name == "Default" else name
+
+        interval = Interval(call_time, TaskHandler.wrap(callback), pg.time.get_ticks(), name, repeat, catch_up)
+
+        TimeHandler.intervals.setdefault(name, []).append(interval)
+        TimeHandler.to_add.append(interval)
+        return interval
 
     def remove(name: str):
         r"""
         #### Removes an `interval` from the event list so it won't be called anymore
         - `name` : name of the event to be removed
         """
-        TimeHandler.to_remove.append(name)
+        intervals = TimeHandler.intervals.get(name)
+
+        if intervals:
+            TimeHandler.cancel(intervals[0])
+
+    def cancel(interval: Interval) -> None:
+        r"""
+        #### Cancels an `interval` (returned by `add`) so it won't be called anymore
+        """
+        if interval.cancelled:
+            return
+
+        interval.cancelled = True
+
+        if interval in TimeHandler.to_add:
+            TimeHandler.to_add.remove(interval)
+        elif interval.time > FRAME_INTERVAL:
+            TimeHandler._active -= 1
+
+        intervals = TimeHandler.intervals.get(interval.name)
+        if intervals:
+            intervals.remove(interval)
+
+            if not intervals:
+                del TimeHandler.intervals[interval.name]
+
+        # too many cancelled intervals in the heap
+        heap = TimeHandler._heap
+        if len(heap) > 64 and len(heap) > TimeHandler._active * 2:
+            heap[:] = [entry for entry in heap if not entry[2].cancelled]
+            heapify(heap)
+
+    def clear() -> None:
+        r"""
+        #### Removes every interval
+        """
+        for entry in TimeHandler._heap:
+            entry[2].cancelled = True
+
+        for interval in TimeHandler._frame_intervals:
+            interval.cancelled = True
+
+        for interval in TimeHandler.to_add:
+            interval.cancelled = True
+
+        TimeHandler._heap.clear()
+        TimeHandler._frame_intervals.clear()
+        TimeHandler.to_add.clear()
+        TimeHandler.intervals.clear()
+        TimeHandler._active = 0
 
     def check():
         r"""
         #### Manages the time events
         """
-        # removing intervals
-        for target_name in TimeHandler.to_remove:
-            for index, interval in enumerate(TimeHandler.intervals):
-                if interval.name == target_name:
-                    del TimeHandler.intervals[index]
-                    break
-
-        TimeHandler.to_remove.clear()
+        heap = TimeHandler._heap
+        order = TimeHandler._order
 
         # adding intervals
-        TimeHandler.intervals.extend(TimeHandler.to_add)
+        for interval in TimeHandler.to_add:
+            if interval.time <= FRAME_INTERVAL:
+                TimeHandler._frame_intervals.append(interval)
+            else:
+                heappush(heap, (interval.next_call, next(order), interval))
+                TimeHandler._active += 1
+
         TimeHandler.to_add.clear()
 
-        # Checking  Intervals
         current_time = pg.time.get_ticks()
-        for interval in TimeHandler.intervals:
-            if current_time - interval.last_call >= interval.time:
+
+        if TimeHandler._frame_intervals:
+            TimeHandler._check_frame_intervals(current_time)
+
+        if not heap or heap[0][0] > current_time:
+            return
+
+        # intervals that have to be called, callbacks are called after so they can add or cancel intervals
+        due: List[Tuple[float, int, Interval]] = []
+        limit = len(heap) // 8
+
+        while heap and heap[0][0] <= current_time and len(due) < limit:
+            due.append(heappop(heap))
+
+        # most of the intervals have to be called, splitting the heap is cheaper than popping them one by one
+        if heap and heap[0][0] <= current_time:
+            due.extend(entry for entry in heap if entry[0] <= current_time)
+            heap[:] = [entry for entry in heap if entry[0] > current_time]
+            heapify(heap)
+            due.sort()
+
+        rescheduled: List[Tuple[float, int, Interval]] = []
+
+        for _, _, interval in due:
+            # cancelled (maybe by a previous callback)
+            if not interval.cancelled and TimeHandler._call(interval, current_time):
+                rescheduled.append((interval.next_call, next(order), interval))
+
+        if len(rescheduled) > limit:
+            heap.extend(rescheduled)
+            heapify(heap)
+        else:
+            for entry in rescheduled:
+                heappush(heap, entry)
+
+    def _check_frame_intervals(current_time: float) -> None:
+        # the list is replaced before the callbacks are called, intervals added by them go to `to_add`
+        intervals = TimeHandler._frame_intervals
+        kept = TimeHandler._frame_intervals = []
+        call = TimeHandler._call
+
+        for interval in intervals:
+            if interval.cancelled:
+                continue
+
+            next_call = interval.next_call
+            if next_call > current_time:
+                kept.append(interval)
+                continue
+
+            if interval.repeat != -1 or interval.catch_up != CATCH_UP_SKIP:
+                if call(interval, current_time):
+                    kept.append(interval)
+                continue
+
+            # infinite intervals that skip the missed calls (the default), same as `_call` without the function call
+            interval.callback()
+            interval.last_call = current_time
+
+            if interval.cancelled:
+                continue
+
+            period = interval.time
+            if period > 0:
+                interval.next_call = next_call + ((current_time - next_call) // period + 1) * period
+
+            kept.append(interval)
+
+    def _call(interval: Interval, current_time: float) -> bool:
+        # calls a due interval, returns False if it doesn't have to be called anymore
+        # number of calls since the last check
+        period = interval.time
+        if period <= 0 or interval.next_call + period > current_time:
+            calls = 1
+        else:
+            calls = int((current_time - interval.next_call) // period) + 1
+
+        if calls == 1 or interval.catch_up != CATCH_UP_ALL:
+            times = 1
+            interval.callback()
+        else:
+            # check interval repeats
+            times = min(calls, interval.repeat) if interval.repeat > 0 else calls
+
+            for _ in range(times):
                 interval.callback()
-                interval.last_call = pg.time.get_ticks()
 
-                # check interval repeats
-                if (
-                    interval.repeat > 0
-                ):  # this conditional avoids modifying infinite intervals
-                    interval.repeat -= 1
-                    
-                    # if interval doesnt have to repeat any more, then delete it
-                    if interval.repeat == 0:
-                        TimeHandler.to_remove.append(interval.name)
+                if interval.cancelled:
+                    break
+
+        interval.last_call = current_time
+
+        if interval.cancelled:
+            return False
+
+        if interval.repeat > 0:  # this conditional avoids modifying infinite intervals
+            interval.repeat -= times
+
+            # if interval doesnt have to repeat any more, then delete it
+            if interval.repeat == 0:
+                TimeHandler.cancel(interval)
+                return False
+
+        if interval.catch_up == CATCH_UP_RESET:
+            interval.next_call = current_time + period
+        else:
+            interval.next_call += calls * period
+
+        return True
 
 
 # time decorators  ------------------------------------------------------------
-def add_interval(time: int, name: str = "Default", repeat: int = -1) -> Callable:
+def add_interval(time: int, name: str = "Default", repeat: int = -1, catch_up: str = CATCH_UP_SKIP) -> Callable:
     r"""
     - Adds an `interval` to the time handler, calls the function every `time`
     - `time` : amount of time in seconds that the event will be called after
     - `name` : name of the interval (Optional)
+    - `catch_up` : what to do when calls were missed (see `TimeHandler.add`) (Optional)
     """
 
     def wrapper(func):
-        TimeHandler.add(time, func, name, repeat)
+        TimeHandler.add(time, func, name, repeat, catch_up)
         return func
 
     return wrapper
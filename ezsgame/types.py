@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Callable, Dict, Self, Type, TypeAlias
 import math
 
+from .task_handler import TaskHandler
+
 
 # Signal --------------------------------------------
 class Signal:
@@ -50,14 +52,14 @@ class Signal:
 
     def add(self, name: str, func: Callable):
         """
-        #### Adds a function to the signal listeners
+        #### Adds a function to the signal listeners (`async def` functions run as tasks, see `Window.run_async`)
         """
 
         # check if the name is already in use
         if name in self.listeners:
             raise ValueError(f"Name \"{name}\" is already in use in this signal")
         
-        self.listeners[name] = func
+        self.listeners[name] = TaskHandler.wrap(func)
 
     def remove(self, name: str):
         """
@@ -435,6 +437,174 @@ class Pos (Vector2):
         return f"Pos({self.x}, {self.y})"
 
 
+# Observed vectors ---------------------------------
+
+def _observed_inplace(operator: Callable) -> Callable:
+    # applies the operator to a copy and sets both components at once, so the observer is called once
+    def method(self, other):
+        result = operator(Vector2(self.x, self.y), other)
+        self.set(result.x, result.y)
+        return self
+
+    return method
+
+
+def _plain_result(operator: Callable) -> Callable:
+    # the result is a plain vector (`Pos` / `Size`), copies and results of operators don't track changes
+    def method(self, *args):
+        return operator(self.copy(), *args)
+
+    return method
+
+
+class Observed:
+    r"""
+    #### Change tracking for vectors (see `ObservedPos` and `ObservedSize`)
+    `version` is increased every time the vector changes and the `observer` (if any) is called with the vector,
+    changes in place included: `vector[0] = x`, `vector.x = x`, `vector += other`, `vector.set(x, y)`.
+    Operators and `set` change both components at once, the observer is called once.
+
+    #### Notes
+    - Set the observer with `observe` (assigning `vector.observer` counts as a change).
+    - Plain `Pos` and `Size` are not tracked, reading an observed vector costs the same as reading a `Pos`.
+    - `copy()` and the results of operators (Example: `vector + velocity`) are plain `Pos` / `Size`.
+    """
+    __slots__ = ()
+
+    _plain_type: Type[Vector2] = Vector2  # type of copies and results of operators
+
+    def observe(self, observer: Callable[[Vector2], None] | None) -> Self:
+        r"""
+        #### Sets the function called with the vector when it changes (`None` to stop observing)
+        """
+        object.__setattr__(self, "observer", observer)
+        return self
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+
+        # properties (Example: `Size.width`) set `x` or `y`
+        if name == "x" or name == "y":
+            object.__setattr__(self, "version", self.version + 1)
+
+            if self.observer is not None:
+                self.observer(self)
+
+    def set(self, a, b):
+        object.__setattr__(self, "x", a)
+        object.__setattr__(self, "y", b)
+        object.__setattr__(self, "version", self.version + 1)
+
+        if self.observer is not None:
+            self.observer(self)
+
+    @classmethod
+    def observing(cls, x: Number, y: Number, observer: Callable[[Vector2], None] | None) -> Self:
+        r"""
+        #### Returns a vector `(x, y)` observed by `observer`, faster than the constructor (no measures or iterables)
+        """
+        vector = cls.__new__(cls)
+        object.__setattr__(vector, "x", x)
+        object.__setattr__(vector, "y", y)
+        object.__setattr__(vector, "version", 0)
+        object.__setattr__(vector, "observer", observer)
+        return vector
+
+    def normalize(self) -> Self:
+        self.set(*Vector2(self.x, self.y).normalize())
+        return self
+
+    def copy(self) -> Vector2:
+        vector = self._plain_type.__new__(self._plain_type)
+        vector.x = self.x
+        vector.y = self.y
+        return vector
+
+    __add__ = _plain_result(Vector2.__add__)
+    __sub__ = _plain_result(Vector2.__sub__)
+    __mul__ = _plain_result(Vector2.__mul__)
+    __truediv__ = _plain_result(Vector2.__truediv__)
+    __floordiv__ = _plain_result(Vector2.__floordiv__)
+    __mod__ = _plain_result(Vector2.__mod__)
+    __pow__ = _plain_result(Vector2.__pow__)
+    __neg__ = _plain_result(Vector2.__neg__)
+    __pos__ = _plain_result(Vector2.__pos__)
+    __abs__ = _plain_result(Vector2.__abs__)
+
+    # most used in place operators, without a copy
+    def __iadd__(self, b):
+        if isinstance(b, Vector2):
+            self.set(self.x + b.x, self.y + b.y)
+
+        elif isinstance(b, (int, float)):
+            self.set(self.x + b, self.y + b)
+
+        else:
+            x, y = b
+            self.set(self.x + x, self.y + y)
+
+        return self
+
+    def __isub__(self, b):
+        if isinstance(b, Vector2):
+            self.set(self.x - b.x, self.y - b.y)
+
+        elif isinstance(b, (int, float)):
+            self.set(self.x - b, self.y - b)
+
+        else:
+            x, y = b
+            self.set(self.x - x, self.y - y)
+
+        return self
+
+    __imul__ = _observed_inplace(Vector2.__imul__)
+    __itruediv__ = _observed_inplace(Vector2.__itruediv__)
+    __ifloordiv__ = _observed_inplace(Vector2.__ifloordiv__)
+    __imod__ = _observed_inplace(Vector2.__imod__)
+    __ipow__ = _observed_inplace(Vector2.__ipow__)
+
+
+class ObservedPos(Observed, Pos):
+    r"""
+    #### Position that tracks its changes (see `Observed`)
+    #### Parameters
+    - `x`: x position `number` or `[x, y]`
+    - `y`: y position `number`
+    - `observer`: function called with the position when it changes (Optional)
+    """
+    __slots__ = ("version", "observer")
+    _plain_type = Pos
+
+    def __init__(self, x: Number, y: Number = None, observer: Callable[[Vector2], None] | None = None):
+        object.__setattr__(self, "observer", None)
+        object.__setattr__(self, "version", 0)
+        super().__init__(x, y)
+
+        object.__setattr__(self, "version", 0)
+        object.__setattr__(self, "observer", observer)
+
+
+class ObservedSize(Observed, Size):
+    r"""
+    #### Size that tracks its changes (see `Observed`)
+    #### Parameters
+    - `width`: width  `int` or `[width, height]`
+    - `height`: height `int` or `[width, height]`
+    - `observer`: function called with the size when it changes (Optional)
+    """
+    __slots__ = ("version", "observer")
+    _plain_type = Size
+
+    def __init__(self, width: Number, height: Number = None, observer: Callable[[Vector2], None] | None = None):
+        object.__setattr__(self, "observer", None)
+        object.__setattr__(self, "version", 0)
+        super().__init__(width, height)
+
+        object.__setattr__(self, "version", 0)
+        object.__setattr__(self, "observer", observer)
+
+
 
 # Profiling options ------------------------------
 import cProfile
@@ -1,5 +1,7 @@
-from typing import Callable, Iterable
-import pygame as pg, random, os
+from dataclasses import dataclass
+from typing import Callable, Iterable, List
+import pygame as pg, random, os, time
+from inspect import iscoroutine
 
 from .scenes import SceneManager
 from .graphics import Image
@@ -8,15 +10,69 @@ from .types import ProfilingOptions, Size, Pos
 from .styles.colors import Gradient
 from .styles.styles_resolver import resolve_color
 from .world import World
+from .render_batch import draw_batched
 
 # handlers
 from .event_handler import EventHandler
 from .time_handler import TimeHandler
+from .task_handler import TaskHandler
+from .collisions import CollisionWorld
 
 from pstats import SortKey, Stats
 
+# max number of dirty areas in a frame, the whole window is updated if there are more
+DIRTY_RECTS_LIMIT = 64
 
-pg.init()
+# max part of the window covered by the dirty areas, the whole window is updated if they cover more
+DIRTY_AREA_LIMIT = 0.3
+
+# max part of the drawn objects that changed in a frame, the next frames update the whole window if more changed
+# (checking the objects against the dirty areas and drawing them clipped costs more than drawing everything)
+DIRTY_OBJECTS_LIMIT = 0.05
+
+# while the whole window is updated because the scene is animated, objects are checked for changes once every this many frames
+DIRTY_CHECK_FRAMES = 30
+
+
+def merge_rects(rects: List[pg.Rect]) -> List[pg.Rect]:
+    r"""
+    #### Merges the rects that overlap, so each area is updated only once
+    """
+    merged: List[pg.Rect] = []
+
+    for rect in rects:
+        index = rect.collidelist(merged)
+
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+
+        merged.append(rect)
+
+    return merged
+
+
+@dataclass(slots=True)
+class TickStats:
+    """
+    Number of simulation ticks of the fixed timestep loop (`Window.tick_rate`), since the window was created or `reset`
+    - `ticks` : ticks that ran
+    - `caught_up` : extra ticks that ran to catch up (frames slower than a tick)
+    - `dropped` : ticks that were skipped because the loop was more than `max_ticks` behind
+    """
+    frames: int = 0
+    ticks: int = 0
+    caught_up: int = 0
+    dropped: int = 0
+
+    def reset(self) -> None:
+        self.frames = 0
+        self.ticks = 0
+        self.caught_up = 0
+        self.dropped = 0
+
+    def __str__(self):
+        return f"<TickStats : {self.ticks} ticks in {self.frames} frames, {self.caught_up} caught up, {self.dropped} dropped>"
 
 
 class Window:
@@ -24,6 +80,14 @@ class Window:
     #### Window
 
     - Profiling: If a `ProfilingOptions` is passed to the `profiling` parameter, the profiling will be enabled.
+    - Dirty rects: If `dirty_rects` is True, only the areas where objects changed are cleared by `fill`, drawn and
+    updated on the display. Things that are not ezsgame objects (Example: `pg.draw` calls) should mark the area
+    they draw with `mark_dirty`. The whole window is updated instead when the dirty areas cover a large part of it, or when
+    many objects change every frame (animated scenes, see `DIRTY_AREA_LIMIT` and `DIRTY_OBJECTS_LIMIT`).
+    - Fixed timestep: If `tick_rate` is set, the simulation (`on_update` events, collisions, camera and scene updates in
+    `run_scenes`) runs `tick_rate` times per second whatever the frame rate is, up to `max_ticks` ticks per frame.
+    `alpha` is the fraction of a tick elapsed since the last tick, to draw moving objects between their last two
+    positions (`interpolate`). `tick_stats` counts the ticks that were caught up or dropped.
     """
 
     __slots__ = (
@@ -41,6 +105,22 @@ class Window:
         "show_fps",
         "fps",
         "profiling",
+        "dirty_rects",
+        "_dirty",
+        "_late_dirty",
+        "_filled",
+        "_full_update",
+        "_tracked",
+        "_changed",
+        "_animated_frames",
+        "_untracked",
+        "tick_rate",
+        "max_ticks",
+        "alpha",
+        "tick_stats",
+        "_accumulator",
+        "_last_tick_time",
+        "_async_loop",
     )
 
     # check if an istance of Window is created
@@ -82,6 +162,9 @@ class Window:
         fullscreen: bool = False,
         resizable: bool = False,
         profiling: ProfilingOptions = False,
+        dirty_rects: bool = False,
+        tick_rate: int = 0,
+        max_ticks: int = 5,
     ):
         self.size = size if isinstance(size, Size) else Size(*size)
         self.pos = Pos(0, 0)
@@ -96,6 +179,31 @@ class Window:
         self.show_fps = show_fps
         self.profiling = profiling
 
+        # dirty rects mode
+        self.dirty_rects = dirty_rects
+        self._dirty: List[pg.Rect] = []  # areas to clear and update this frame
+        self._late_dirty: List[pg.Rect] = []  # areas that changed after the fill, cleared next frame
+        self._filled = False
+        self._full_update = True
+        self._tracked = 0  # objects checked for changes this frame
+        self._changed = 0  # objects that changed this frame
+        self._animated_frames = 0  # frames since the scene was found animated, 0 if it's not
+        self._untracked = False  # objects are not checked for changes this frame
+
+        # fixed timestep
+        self.tick_rate = tick_rate
+        self.max_ticks = max_ticks
+        self.alpha = 0.0
+        self.tick_stats = TickStats()
+        self._accumulator = 0.0
+        self._last_tick_time = None
+
+        # `run_async` waits for the next frame without blocking the event loop
+        self._async_loop = False
+
+        # other pygame modules are initialized when they are used (fonts, mixer)
+        pg.display.init()
+
         self.load_icon(icon)
 
         # Profiling
@@ -120,11 +228,27 @@ class Window:
         self.size = size
         self._resolve_size(size)
         pg.display.set_mode(self.size, pg.RESIZABLE)
+        self._full_update = True
         return self
 
-    def get_delta_time(self) -> int:
+    def get_delta_time(self) -> float:
+        r"""
+        #### Returns the time of a simulation step in seconds (the last frame time, or a tick with a fixed `tick_rate`)
+        """
+        if self.tick_rate:
+            return 1 / self.tick_rate
+
         return self.clock.get_time() / 1000
 
+    def interpolate(self, previous, current):
+        r"""
+        #### Returns a value between its value in the previous tick and in the last tick, using `alpha`
+        Used to draw objects smoothly when the frame rate is higher than the `tick_rate`
+        - `previous` : value in the previous tick (number or `Pos`)
+        - `current` : value in the last tick
+        """
+        return previous + (current - previous) * self.alpha
+
     def load_icon(self, icon: str):
         r"""
         #### Loads an icon for the window
@@ -156,6 +280,7 @@ class Window:
         x = random.randint(-force, force)
         y = random.randint(-force, force)
         self.surface.blit(self.surface, (x, y))
+        self._full_update = True
         return self
 
     def get_fps(self):
@@ -266,9 +391,12 @@ class Window:
     def height(self, value: Measure) -> None:
         self.size.height = value
 
-    def update(self):
+    def update(self, tick: Callable = None):
         r"""
         #### Updates the Window
+        - `tick` : function called before the `on_update` events, once per simulation tick (Optional)
+
+        Note: with a fixed `tick_rate`, the simulation runs 0 or more ticks (up to `max_ticks`) depending on the time elapsed
         """
 
         if self.show_fps:
@@ -276,21 +404,102 @@ class Window:
                 f"{self.title}  FPS : " + f"{int(self.clock.get_fps())}"
             )
 
-        pg.display.update()
+        if self.dirty_rects and not self._full_update:
+            pg.display.update(merge_rects(self._dirty + self._late_dirty))
+
+            # areas that changed after the fill still need to be cleared
+            self._dirty = self._late_dirty
+            self._late_dirty = []
+
+        else:
+            pg.display.update()
+            self._dirty.clear()
+            self._late_dirty.clear()
+            self._full_update = False
+
+        if self.dirty_rects:
+            self._check_animated()
+        else:
+            self._untracked = False
+
+        self._filled = False
+        World._end_frame()
+
+        self.clock.tick(0 if self._async_loop else self.fps)
+
+        if self.tick_rate:
+            self._fixed_ticks(tick)
+
+        else:
+            if tick:
+                tick()
+
+            self._tick()
+
+    def _check_animated(self):
+        # many objects changed (animated scene), the next frames are likely the same and update the whole window from the
+        # start without checking every object for changes. Every few frames the objects are checked for two frames (the first
+        # one gets their current state) to know when the scene stops being animated
+        if self._animated_frames % DIRTY_CHECK_FRAMES == 0:
+            self._animated_frames = int(self._changed > self._tracked * DIRTY_OBJECTS_LIMIT)
+        else:
+            self._animated_frames += 1
 
-        self.clock.tick(self.fps)
+        self._untracked = self._animated_frames % DIRTY_CHECK_FRAMES not in (0, DIRTY_CHECK_FRAMES - 1)
+        self._full_update = self._full_update or self._animated_frames > 0
+        self._tracked = self._changed = 0
 
-        # Add objects that were added during the update
-        if len(World.objects_to_add) > 0:
-            World.objects.update(World.objects_to_add)
-            World.objects_to_add.clear()
+    def _tick(self):
+        # Add and remove objects that were added or removed during the update
+        for obj in World._apply_changes():
+            # the area where the removed object was drawn has to be cleared
+            if self.dirty_rects and getattr(obj, "_last_drawn", None):
+                self.mark_dirty(obj._last_drawn[0])
+                obj._last_drawn = None
 
-            # sort objects by z-index
-            World.objects = sorted(World.objects, key=lambda obj: obj.styles.z_index)
+        # call collision callbacks
+        CollisionWorld.check()
 
         # call on update events
         World.on_update.trigger()
 
+        # move the view after the objects moved
+        if World.camera:
+            World.camera.update()
+
+    def _fixed_ticks(self, tick: Callable = None):
+        step = 1 / self.tick_rate
+        now = time.perf_counter()
+
+        # the first frame runs a single tick
+        if self._last_tick_time is None:
+            self._accumulator = step
+        else:
+            self._accumulator += now - self._last_tick_time
+
+        self._last_tick_time = now
+
+        ticks = 0
+        while self._accumulator >= step and ticks < self.max_ticks:
+            if tick:
+                tick()
+
+            self._tick()
+            self._accumulator -= step
+            ticks += 1
+
+        # too far behind, running every tick would make the next frames even slower (spiral of death)
+        if self._accumulator >= step:
+            dropped = int(self._accumulator // step)
+            self._accumulator -= dropped * step
+            self.tick_stats.dropped += dropped
+
+        self.tick_stats.frames += 1
+        self.tick_stats.ticks += ticks
+        self.tick_stats.caught_up += max(ticks - 1, 0)
+
+        self.alpha = self._accumulator / step
+
     def quit(self):
         r"""
         #### Quits the App  (Ends the window)
@@ -322,6 +531,20 @@ class Window:
         if size == [0, 0]:
             size = self.size
 
+            # only the dirty areas are cleared
+            if self.dirty_rects and not self._full_update:
+                if len(self._dirty) <= DIRTY_RECTS_LIMIT * 4:
+                    self._dirty = merge_rects(self._dirty)
+
+                # too many changes, updating everything is cheaper
+                if len(self._dirty) > DIRTY_RECTS_LIMIT or self._get_dirty_area() > DIRTY_AREA_LIMIT:
+                    self._full_update = True
+
+                else:
+                    self._filled = True
+                    self._fill_dirty(color)
+                    return
+
         if isinstance(color, Gradient) or isinstance(color, Image):
             color.draw()
 
@@ -329,12 +552,74 @@ class Window:
             color = resolve_color(color)
             pg.draw.rect(self.surface, color, pg.Rect(pos, size))
 
+    def _get_dirty_area(self) -> float:
+        # part of the window covered by the dirty areas (merged areas don't overlap)
+        width, height = self.surface.get_size()
+        return sum(rect.w * rect.h for rect in self._dirty) / (width * height)
+
+    def _fill_dirty(self, color):
+        rects = self._dirty
+
+        if not rects:
+            return
+
+        if isinstance(color, Gradient) or isinstance(color, Image):
+            self.surface.set_clip(rects[0].unionall(rects))
+            color.draw()
+            self.surface.set_clip(None)
+
+        else:
+            color = resolve_color(color)
+            for rect in rects:
+                self.surface.fill(color, rect)
+
+    def mark_dirty(self, rect) -> None:
+        r"""
+        #### Marks an area of the window as changed (Only used in dirty rects mode)
+        - `rect` : area that changed `[x, y, width, height]`
+        """
+        # everything will be updated anyway
+        if self._full_update:
+            return
+
+        # areas outside of the window are ignored (fill doesn't clip negative positions properly)
+        rect = pg.Rect(rect).clip(self.surface.get_rect())
+        if not rect:
+            return
+
+        if self._filled:
+            self._late_dirty.append(rect)
+
+        self._dirty.append(rect)
+
+    def is_dirty(self, rect) -> bool:
+        r"""
+        #### Returns True if the area overlaps an area that changed this frame (Only used in dirty rects mode)
+        - `rect` : area to check `[x, y, width, height]`
+        """
+        return self._full_update or pg.Rect(rect).collidelist(self._dirty) != -1
+
+    def get_dirty_areas(self, rect) -> List[pg.Rect] | None:
+        r"""
+        #### Returns the areas that changed this frame and overlap `rect`, or `None` if the whole window is being updated (Only used in dirty rects mode)
+        - `rect` : area to check `[x, y, width, height]`
+        """
+        if self._full_update:
+            return None
+
+        # nothing changed (static scene)
+        if not self._dirty:
+            return []
+
+        return [self._dirty[i] for i in pg.Rect(rect).collidelistall(self._dirty)]
+
     def toggle_fullscreen(self):
         r"""
         #### Toggles the fullscreen mode
         """
         self.fullscreen = not self.fullscreen
         self._init()
+        self._full_update = True
 
     # Scenes
     def run_scenes(self, scene_manager: SceneManager):
@@ -342,26 +627,74 @@ class Window:
         while True:
             self.check_events()
 
-            scene_manager.update()
+            # with a fixed tick rate the scenes update at the tick rate
+            if not self.tick_rate:
+                scene_manager.update()
+
             scene_manager.draw()
 
-            self.update()
+            self.update(scene_manager.update if self.tick_rate else None)
 
     # Shortcut: Running, avoid the having to write boilerplate code as "screen.check_events() screen.update()"
     def run(self, func: Callable, auto_draw: bool = True):
         r"""
         #### Runs a function as the main loop
         - `func` : function to be runned
-        - `auto_draw` : if True, all objects will be drawn automatically, ordered by declaration order. Will be called after `func`  (Optional)
+        - `auto_draw` : if True, all objects inside the view will be drawn automatically, ordered by z-index and declaration order (images, sprites, texts and layers are blitted in batches). Will be called after `func`  (Optional)
 
-        Note: `check_events()` and `update()` are called automatically and the start and end of the function respectively
+        Note: `check_events()` and `update()` are called automatically and the start and end of the function respectively.
+        With a fixed `tick_rate`, `func` is still called every frame, use `on_update` events for the simulation
         """
         while True:
             self.check_events()
             func()
 
             if auto_draw:
-                for obj in World.objects:
-                    obj.draw()
+                draw_batched(World.get_visible())
 
             self.update()
+
+    async def run_async(self, func: Callable, auto_draw: bool = True):
+        r"""
+        #### Runs a function as the main loop inside an asyncio event loop
+        - `func` : function (or `async def` function) to be runned every frame
+        - `auto_draw` : if True, all objects inside the view will be drawn automatically after `func` (see `run`) (Optional)
+
+        Instead of blocking until the next frame, the loop waits with `asyncio.sleep`, so other tasks (loading, saving,
+        networking, `async def` event callbacks and intervals) run between frames. The loop yields to the event loop every
+        frame, even when the frame took longer than `1 / fps`.
+
+        #### Example
+        ```python
+        asyncio.run(window.run_async(update))
+        ```
+        """
+        import asyncio
+
+        self._async_loop = True
+        next_frame = time.perf_counter()
+
+        try:
+            while True:
+                self.check_events()
+
+                # errors of async callbacks are raised in the main loop
+                TaskHandler.check()
+
+                result = func()
+                if iscoroutine(result):
+                    await result
+
+                if auto_draw:
+                    draw_batched(World.get_visible())
+
+                self.update()
+
+                # wait for the next frame, late frames don't make the next frames shorter
+                now = time.perf_counter()
+                next_frame = max(next_frame + 1 / self.fps, now) if self.fps else now
+
+                await asyncio.sleep(next_frame - now)
+
+        finally:
+            self._async_loop = False
@@ -1,12 +1,37 @@
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Set
-from .types import Pos, Size, Signal
+from typing import List, Set, Tuple
+from .types import Number, Pos, Size, Signal
+from .render_order import RenderOrder
+from .spatial import SpatialGrid, get_bounds
+from .collisions import CollisionWorld
+
+
+@dataclass(slots=True)
+class CullingStats:
+    """
+    Number of objects drawn and culled (not drawn because they are outside of the view) in a frame
+    """
+    drawn: int = 0
+    culled: int = 0
+
+    def reset(self) -> None:
+        self.drawn = 0
+        self.culled = 0
 
 
 class World:
     """
     #### Defines the "world"
     The `pos` and `size` defined the "view" of the world, objects outside of the view won't be drawn.
+    Objects are drawn at `pos - World.pos` (see `Object.screen_pos`), so moving the view scrolls the world
+    without changing the objects positions. Objects with the `fixed` style are drawn at their `pos` (Example: HUD).
+
+    - Camera: the active camera (`Camera.activate`) moves the view every frame.
+
+    - Culling: objects are kept in a `SpatialGrid` so `get_visible` only goes through the objects near the view.
+    Objects update the grid when their `pos` or `size` change, changes in place included (see `Object.observe_geometry`).
+    Set `culling` to False to draw objects outside of the view. `culling_stats` has the stats of the last frame.
     """
 
 
@@ -18,20 +43,134 @@ class World:
     EventHandler = object
     TimeHandler = object
 
-    objects: Set = set()
+    objects: RenderOrder = RenderOrder() # ordered by z-index
     objects_to_add: Set = set() # avoids iteration errors (adding objects during iteration)
+    objects_to_remove: Set = set() # avoids iteration errors (removing objects during iteration)
+    _attached: Set = set() # removed objects that keep colliding and receiving mouse events
+
+    # culling
+    culling: bool = True
+    grid: SpatialGrid = SpatialGrid(cell_size=128)
+    culling_stats: CullingStats = CullingStats() # last frame
+    _frame_stats: CullingStats = CullingStats() # current frame
+
+    camera = None # active camera, moves the view
 
     on_update: Signal = Signal()
     
+    @classmethod
+    def add(cls, obj) -> None:
+        """
+        #### Adds `obj` to the world (at the end of the frame)
+        Note: objects are added automatically when they are created
+        """
+        cls.objects_to_remove.discard(obj)
+        cls.objects_to_add.add(obj)
+
+    @classmethod
+    def remove(cls, obj, detach: bool = True) -> None:
+        """
+        #### Removes `obj` from the world (at the end of the frame), so it won't be drawn by `Window.run` anymore
+        - `detach` : if True, the object doesn't collide and can't be hovered or clicked until it's added again.
+        False to only stop drawing it (Example: objects drawn by a `Layer`)
+        """
+        cls.objects_to_add.discard(obj)
+        cls.objects_to_remove.add(obj)
+
+        if detach:
+            cls._attached.discard(obj)
+        else:
+            cls._attached.add(obj)
+
+    @classmethod
+    def _apply_changes(cls) -> List:
+        """
+        #### Adds and removes the objects that were added or removed during the frame, returns the removed objects
+        """
+        removed = list(cls.objects_to_remove)
+        events = getattr(cls.EventHandler, "events", None)
+
+        for obj in removed:
+            cls.objects.discard(obj)
+
+            if obj in cls.grid:
+                cls.grid.remove(obj)
+                obj._grids.remove(cls.grid)
+
+            if obj not in cls._attached:
+                CollisionWorld.suspend(obj)
+
+                if events is not None:
+                    events._suspend_target(obj)
+
+        cls.objects_to_remove.clear()
+        cls._attached.clear()
+
+        for obj in cls.objects_to_add:
+            if obj not in cls.grid and hasattr(obj, "_grids"):
+                cls.grid.insert(obj)
+                obj._grids.append(cls.grid)
+
+            CollisionWorld.resume(obj)
+
+            if events is not None:
+                events._resume_target(obj)
+
+        # objects are inserted in z-index order
+        cls.objects.add(*cls.objects_to_add)
+        cls.objects_to_add.clear()
+
+        return removed
+
+    @classmethod
+    def _end_frame(cls) -> None:
+        """
+        #### Keeps the stats of the frame that was just drawn in `culling_stats` (once per frame, not per simulation tick)
+        """
+        cls.culling_stats, cls._frame_stats = cls._frame_stats, cls.culling_stats
+        cls._frame_stats.reset()
+
+    @classmethod
+    def get_offset(cls, obj) -> Tuple[Number, Number]:
+        """
+        #### Returns the offset between the world and the window for `obj`
+        `World.pos` for most objects, `(0, 0)` for objects with the `fixed` style
+        """
+        styles = getattr(obj, "styles", None)
+        if styles is not None and styles.fixed:
+            return (0, 0)
+
+        return (cls.pos.x, cls.pos.y)
+
     @classmethod
     def is_inside(cls, obj) -> bool:
         """
-        #### Returns `True` if `obj` is inside the world
+        #### Returns `True` if `obj` is inside the view of the world (at least partially)
+        """
+        x, y, w, h = get_bounds(obj)
+        view_x, view_y = cls.get_offset(obj)
+        view_w, view_h = cls.size
+
+        return x <= view_x + view_w and view_x <= x + w and y <= view_y + view_h and view_y <= y + h
+
+    @classmethod
+    def get_visible(cls) -> List:
+        """
+        #### Returns the objects inside the view of the world, ordered by z-index
         """
-        return (
-            cls.pos[0] <= obj.pos[0] <= cls.pos[0] + cls.size[0]
-            and cls.pos[1] <= obj.pos[1] <= cls.pos[1] + cls.size[1]
-        )
+        if not cls.culling:
+            return list(cls.objects)
+
+        near = cls.grid.query_rect((*cls.pos, *cls.size))
+
+        # fixed objects are inside the window area, not the view
+        if cls.pos.x or cls.pos.y:
+            near.update(obj for obj in cls.grid.query_rect((0, 0, *cls.size)) if obj.styles.fixed)
+
+        visible = cls.objects.sort(obj for obj in near if obj in cls.objects)
+
+        cls._frame_stats.culled += len(cls.objects) - len(visible)
+        return visible
 
 
 # Utility for getting the window object easily